@@ -0,0 +1,93 @@
+"""
+范围爆炸的性能测试
+模拟同一帧内数十个火球/冰霜新星同时爆炸，对比遍历敌人列表和空间网格半径查询的耗时
+
+运行方式（项目根目录）：
+    python benchmarks/bench_aoe.py
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.collision.spatial_grid import SpatialGrid
+from modules.collision.broad_phase import enemies_in_radius
+
+ENEMY_COUNTS = [500, 2000, 10000]
+EXPLOSION_COUNT = 60
+EXPLOSION_RADIUS = 120
+WORLD_SIZE = 4000
+FRAMES = 5
+
+
+class BenchEnemy:
+    """只包含范围伤害所需属性的敌人"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 44, 30)
+        self.health = 100
+
+    def take_damage(self, amount):
+        self.health -= amount
+
+
+class GridIndex:
+    """提供enemies_in_radius接口的空间索引，与EnemyManager的查询方式一致"""
+    def __init__(self, enemies):
+        self.spatial_grid = SpatialGrid(cell_size=128)
+        self.spatial_grid.rebuild(enemies)
+
+    def enemies_in_radius(self, x, y, radius):
+        return self.spatial_grid.query_radius(x, y, radius)
+
+
+def explode_all(enemies, explosions):
+    """一帧内结算所有爆炸，返回每次爆炸命中的敌人"""
+    hits = []
+    for x, y in explosions:
+        targets = enemies_in_radius(enemies, x, y, EXPLOSION_RADIUS)
+        for enemy in targets:
+            enemy.take_damage(10)
+        hits.append([id(enemy) for enemy in targets])
+    return hits
+
+
+def _time_frames(func, *args):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        result = func(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000, result
+
+
+def main():
+    pygame.init()
+    random.seed(1)
+
+    print(f"{'敌人数':>8}{'遍历(ms)':>12}{'网格(ms)':>12}{'命中数':>8}")
+    for count in ENEMY_COUNTS:
+        enemies = [BenchEnemy(random.randint(0, WORLD_SIZE), random.randint(0, WORLD_SIZE))
+                   for _ in range(count)]
+        explosions = [(random.uniform(0, WORLD_SIZE), random.uniform(0, WORLD_SIZE))
+                      for _ in range(EXPLOSION_COUNT)]
+
+        list_ms, list_hits = _time_frames(explode_all, enemies, explosions)
+        # 网格耗时包含每帧一次的重建
+        grid_ms, grid_hits = _time_frames(lambda: explode_all(GridIndex(enemies), explosions))
+
+        # 两种方式必须命中完全相同的敌人
+        assert grid_hits == list_hits, "网格查询的命中结果与遍历不一致"
+
+        print(f"{count:>8}{list_ms:>12.2f}{grid_ms:>12.2f}{sum(map(len, list_hits)):>8}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+投射物与敌人碰撞的性能测试
+对比逐一遍历、空间网格和numpy批量计算三种粗检测方式在不同敌人数量下的耗时
+
+运行方式（项目根目录）：
+    python benchmarks/bench_collision.py
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.collision.spatial_grid import SpatialGrid
+from modules.collision.broad_phase import BroadPhase
+from modules.utils import apply_mask_collision
+
+ENEMY_COUNTS = [500, 2000, 10000]
+PROJECTILE_COUNT = 200
+WORLD_SIZE = 6000
+FRAMES = 5
+
+
+class BenchEnemy:
+    """只包含碰撞所需属性的敌人"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 44, 30)
+        self.mask = pygame.mask.Mask((44, 30), fill=True)
+        self.health = 100
+
+
+class BenchProjectile:
+    """只包含碰撞所需属性的投射物"""
+    def __init__(self, x, y):
+        self.world_x = float(x)
+        self.world_y = float(y)
+        self.rect = pygame.Rect(0, 0, 32, 32)
+        self.rect.center = (int(x), int(y))
+        self.mask = pygame.mask.Mask((32, 32), fill=True)
+
+
+def backend_hits(broad_phase, grid, enemies, projectiles):
+    """使用指定粗检测实现完成一帧的碰撞检测（包含网格重建和数据打包）"""
+    grid.rebuild(enemies)
+    broad_phase.begin_frame(enemies, grid)
+    hits = []
+    for projectile, candidates in zip(projectiles, broad_phase.query(projectiles)):
+        for enemy in candidates:
+            if apply_mask_collision(enemy, projectile):
+                hits.append((id(projectile), id(enemy)))
+    return hits
+
+
+def _time_frames(func, *args):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        result = func(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000, result
+
+
+def main():
+    pygame.init()
+    random.seed(1)
+
+    backends = BroadPhase.BACKENDS
+    print(f"{'敌人数':>8}" + "".join(f"{name + '(ms)':>12}" for name in backends) + f"{'命中数':>8}")
+    for count in ENEMY_COUNTS:
+        enemies = [BenchEnemy(random.randint(0, WORLD_SIZE), random.randint(0, WORLD_SIZE))
+                   for _ in range(count)]
+        projectiles = [BenchProjectile(random.randint(0, WORLD_SIZE), random.randint(0, WORLD_SIZE))
+                       for _ in range(PROJECTILE_COUNT)]
+        grid = SpatialGrid(cell_size=128)
+
+        timings = []
+        results = []
+        for name in backends:
+            elapsed, result = _time_frames(backend_hits, BroadPhase(name), grid, enemies, projectiles)
+            timings.append(elapsed)
+            results.append(result)
+
+        # 所有实现必须命中完全相同的目标
+        for name, result in zip(backends, results):
+            assert result == results[0], f"{name} 的命中结果与 {backends[0]} 不一致"
+
+        print(f"{count:>8}" + "".join(f"{ms:>12.2f}" for ms in timings) + f"{len(results[0]):>8}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+敌人群体分离的性能测试
+模拟围在玩家周围的密集敌群，统计每帧分离计算的耗时以及每1000个敌人的平均耗时
+
+运行方式（项目根目录）：
+    python benchmarks/bench_crowd.py
+"""
+
+import os
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.enemies.crowd_separation import CrowdSeparation
+from modules.enemies.enemy_config import ENEMY_CONFIGS
+
+ENEMY_COUNTS = [1000, 2000, 5000, 10000]
+FRAMES = 10
+
+
+class BenchEnemy:
+    """只包含群体分离所需属性的敌人"""
+    def __init__(self, x, y, enemy_type):
+        config = ENEMY_CONFIGS[enemy_type]
+        self.rect = pygame.Rect(0, 0, 44, 30)
+        self.rect.center = (x, y)
+        self.separation_radius = config.get("separation_radius", 0)
+        self.separation_strength = config.get("separation_strength", 0.5)
+
+
+def make_horde(count):
+    """生成围绕原点的密集敌群（敌人越多，敌群半径越大，密度保持不变）"""
+    horde_radius = 20 * math.sqrt(count)
+    enemies = []
+    for _ in range(count):
+        angle = random.uniform(0, math.pi * 2)
+        distance = horde_radius * math.sqrt(random.random())
+        enemy_type = random.choice(['ghost', 'radish', 'slime'])
+        enemies.append(BenchEnemy(int(math.cos(angle) * distance), int(math.sin(angle) * distance), enemy_type))
+    return enemies
+
+
+def time_backend(backend, count):
+    """对同一个敌群连续运行多帧分离，返回每帧平均耗时（毫秒）"""
+    random.seed(count)
+    enemies = make_horde(count)
+    solver = CrowdSeparation(backend)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        solver.apply(enemies)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+
+    print(f"{'敌人数':>8}{'python(ms)':>12}{'numpy(ms)':>12}{'python/千':>12}{'numpy/千':>12}")
+    for count in ENEMY_COUNTS:
+        python_ms = time_backend('python', count)
+        numpy_ms = time_backend('numpy', count)
+        print(f"{count:>8}{python_ms:>12.2f}{numpy_ms:>12.2f}"
+              f"{python_ms / count * 1000:>12.2f}{numpy_ms / count * 1000:>12.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+像素级碰撞检测的微基准测试
+使用assets/images中的真实精灵，对比：
+    legacy: 原始的逐像素Python双重循环
+    mask:   基于遮罩的apply_mask_collision（遮罩已缓存）
+    numpy:  新的numpy像素重叠检测pixel_perfect_collision
+    detail: numpy检测并返回重叠像素数量和质心
+
+运行方式（项目根目录）：
+    python benchmarks/bench_pixel_collision.py
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.resource_manager import resource_manager
+from modules.utils import pixel_perfect_collision, apply_mask_collision
+
+REPEAT = 20
+
+# (资源名称, 文件路径, 帧宽, 帧高, 缩放)
+ENEMY_SPRITES = [
+    ('ghost', 'images/enemy/Ghost_Idle.png', 44, 30, 1),
+    ('slime', 'images/enemy/Slime_Idle_44x30.png', 44, 30, 1),
+    ('radish', 'images/enemy/radish_idle_30x38.png', 30, 38, 1),
+    ('bat', 'images/enemy/Bat_Flying_46x30.png', 46, 30, 2),
+]
+PROJECTILE_SPRITES = [
+    ('knife', 'images/weapons/knife_32x32.png', 32, 32, 1),
+    ('fireball', 'images/weapons/fireball_32x32.png', 32, 32, 1),
+    ('nova', 'images/weapons/nova_32x32.png', 32, 32, 1),
+    ('player', 'images/player/Ninja_frog_Idle_32x32.png', 32, 32, 1),
+]
+# 第二个精灵相对第一个精灵左上角的偏移
+OFFSETS = [(-20, -10), (-8, 0), (0, 0), (6, 4), (12, 10), (30, 20), (40, 25)]
+
+
+def legacy_pixel_perfect_collision(surface1, rect1, surface2, rect2):
+    """原始实现：逐像素的Python双重循环"""
+    overlap_rect = rect1.clip(rect2)
+    if overlap_rect.width == 0 or overlap_rect.height == 0:
+        return False
+    offset_1 = (overlap_rect.x - rect1.x, overlap_rect.y - rect1.y)
+    offset_2 = (overlap_rect.x - rect2.x, overlap_rect.y - rect2.y)
+    try:
+        subsurface1 = surface1.subsurface((offset_1[0], offset_1[1], overlap_rect.width, overlap_rect.height))
+        subsurface2 = surface2.subsurface((offset_2[0], offset_2[1], overlap_rect.width, overlap_rect.height))
+    except ValueError:
+        return False
+    pixels1 = pygame.surfarray.array_alpha(subsurface1)
+    pixels2 = pygame.surfarray.array_alpha(subsurface2)
+    for x in range(overlap_rect.width):
+        for y in range(overlap_rect.height):
+            if pixels1[x, y] > 127 and pixels2[x, y] > 127:
+                return True
+    return False
+
+
+def load_sprite(name, path, width, height, scale):
+    """从精灵表中取第一帧并按比例缩放"""
+    sheet = resource_manager.load_spritesheet(f'bench_{name}', path)
+    frame = sheet.get_sprite(0, 0, width, height)
+    if scale != 1:
+        frame = pygame.transform.scale(frame, (width * scale, height * scale))
+    return frame
+
+
+def build_cases():
+    """生成所有 (精灵1, 精灵2) 的测试用例"""
+    enemies = [load_sprite(*info) for info in ENEMY_SPRITES]
+    projectiles = [load_sprite(*info) for info in PROJECTILE_SPRITES]
+    cases = []
+    for enemy_image in enemies:
+        for projectile_image in projectiles:
+            for dx, dy in OFFSETS:
+                sprite1 = SimpleNamespace(image=enemy_image, rect=enemy_image.get_rect(topleft=(100, 100)), mask=None)
+                sprite2 = SimpleNamespace(image=projectile_image,
+                                          rect=projectile_image.get_rect(topleft=(100 + dx, 100 + dy)), mask=None)
+                cases.append((sprite1, sprite2))
+    return cases
+
+
+def run(name, func, cases):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        results = [func(sprite1, sprite2) for sprite1, sprite2 in cases]
+    elapsed = (time.perf_counter() - start) / (REPEAT * len(cases)) * 1e6
+    print(f"{name:>8} {elapsed:>12.2f}")
+    return results
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    cases = build_cases()
+    print(f"测试用例数: {len(cases)}")
+    print(f"{'实现':>8} {'单次(us)':>12}")
+
+    legacy = run('legacy', lambda a, b: legacy_pixel_perfect_collision(a.image, a.rect, b.image, b.rect), cases)
+    mask = run('mask', apply_mask_collision, cases)
+    numpy_result = run('numpy', lambda a, b: pixel_perfect_collision(a.image, a.rect, b.image, b.rect), cases)
+    detail = run('detail', lambda a, b: pixel_perfect_collision(a.image, a.rect, b.image, b.rect,
+                                                                return_details=True), cases)
+
+    # 所有实现必须得到相同的碰撞结果
+    assert legacy == numpy_result == [d.collided for d in detail], "numpy实现与原始实现结果不一致"
+    assert legacy == mask, "遮罩实现与原始实现结果不一致"
+    print(f"碰撞数: {sum(legacy)}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
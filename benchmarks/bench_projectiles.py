@@ -0,0 +1,100 @@
+"""
+投射物表示的性能测试
+在10000个存活投射物下，对比改动前的pygame.sprite.Sprite + pygame.sprite.Group
+和__slots__投射物 + ProjectileGroup的内存占用、更新/遍历耗时以及加入和移除的耗时
+
+运行方式（项目根目录）：
+    python benchmarks/bench_projectiles.py
+"""
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.projectiles import ProjectileGroup
+from modules.weapons.types.knife import ThrownKnife
+from modules.weapons.weapon_stats import WeaponStatType
+
+PROJECTILE_COUNT = 10000
+FRAMES = 20
+STATS = {WeaponStatType.DAMAGE: 20, WeaponStatType.PROJECTILE_SPEED: 400, WeaponStatType.LIFETIME: 1e9}
+
+
+class SpriteKnife(pygame.sprite.Sprite):
+    """改动前的飞刀表示：pygame.sprite.Sprite子类，属性保存在__dict__中"""
+
+    reset = ThrownKnife.reset
+    update = ThrownKnife.update
+
+    def __init__(self, x, y, direction_x, direction_y, stats):
+        super().__init__()
+        self.reset(x, y, direction_x, direction_y, stats)
+
+
+def create(projectile_class, group_class, directions):
+    group = group_class()
+    for direction_x, direction_y in directions:
+        group.add(projectile_class(0, 0, direction_x, direction_y, STATS))
+    return group
+
+
+def measure(projectile_class, group_class, directions):
+    """返回 (内存KB, 每帧update耗时ms, 每帧遍历耗时ms, 加入并移除全部耗时ms)"""
+    # 先创建一次，让旋转图像等共享资源进入缓存，不计入内存
+    create(projectile_class, group_class, directions)
+
+    tracemalloc.start()
+    group = create(projectile_class, group_class, directions)
+    memory_kb = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        group.update(1 / 60)
+    update_ms = (time.perf_counter() - start) / FRAMES * 1000
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        total = 0.0
+        for projectile in group:
+            total += projectile.world_x
+    iterate_ms = (time.perf_counter() - start) / FRAMES * 1000
+
+    # 只测容器本身，不经过kill，避免把对象池的开销计入
+    projectiles = list(group)
+    start = time.perf_counter()
+    for projectile in projectiles:
+        group.remove(projectile)
+    group.add(*projectiles)
+    churn_ms = (time.perf_counter() - start) * 1000
+    return memory_kb, update_ms, iterate_ms, churn_ms
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    random.seed(1)
+    directions = [(random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(PROJECTILE_COUNT)]
+
+    print(f"{PROJECTILE_COUNT}个存活投射物")
+    print(f"{'实现':<24}{'内存(KB)':>10}{'update(ms)':>12}{'遍历(ms)':>10}{'加入移除(ms)':>14}")
+    for name, projectile_class, group_class in (
+            ('Sprite + Group', SpriteKnife, pygame.sprite.Group),
+            ('__slots__ + ProjectileGroup', ThrownKnife, ProjectileGroup)):
+        memory_kb, update_ms, iterate_ms, churn_ms = measure(projectile_class, group_class, directions)
+        print(f"{name:<24}{memory_kb:>10.0f}{update_ms:>12.2f}{iterate_ms:>10.2f}{churn_ms:>14.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
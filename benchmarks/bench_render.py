@@ -0,0 +1,83 @@
+"""
+世界精灵绘制的性能测试
+对比逐个调用screen.blit和通过RenderBatcher批量提交的耗时，并输出每帧的绘制统计
+
+运行方式（项目根目录）：
+    python benchmarks/bench_render.py
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.render_batch import RenderBatcher
+from modules.enemies.enemy_manager import EnemyManager
+from modules.items.item import Item
+
+ENEMY_COUNTS = [300, 1000, 3000]
+ENEMY_TYPES = ['ghost', 'radish', 'slime']
+SCREEN_SIZE = (1280, 720)
+# 敌人分布在屏幕周围，约一半位于屏幕外
+WORLD_RANGE = 1300
+FRAMES = 20
+
+
+def render_world(screen, manager, items, batcher=None):
+    """绘制一帧的敌人和物品"""
+    center_x = SCREEN_SIZE[0] // 2
+    center_y = SCREEN_SIZE[1] // 2
+    if batcher is not None:
+        batcher.begin(screen)
+    manager.render(screen, 0, 0, center_x, center_y, batcher)
+    for item in items:
+        if batcher is not None:
+            item.queue_render(batcher, 0, 0, center_x, center_y)
+        else:
+            item.render(screen, 0, 0, center_x, center_y)
+    if batcher is not None:
+        batcher.end_frame()
+
+
+def _time_frames(func, *args):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        func(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    random.seed(1)
+
+    print(f"{'敌人数':>8}{'逐个(ms)':>12}{'批量(ms)':>12}{'提交':>8}{'裁剪':>8}{'blit调用':>10}")
+    for count in ENEMY_COUNTS:
+        manager = EnemyManager()
+        for _ in range(count):
+            manager.spawn_enemy(random.choice(ENEMY_TYPES),
+                                random.randint(-WORLD_RANGE, WORLD_RANGE),
+                                random.randint(-WORLD_RANGE, WORLD_RANGE))
+        items = [Item(random.randint(-WORLD_RANGE, WORLD_RANGE), random.randint(-WORLD_RANGE, WORLD_RANGE), 'exp')
+                 for _ in range(count // 2)]
+
+        direct_ms = _time_frames(render_world, screen, manager, items)
+        batcher = RenderBatcher()
+        batched_ms = _time_frames(render_world, screen, manager, items, batcher)
+        stats = batcher.get_stats()
+
+        print(f"{count:>8}{direct_ms:>12.2f}{batched_ms:>12.2f}"
+              f"{stats['submitted']:>8}{stats['culled']:>8}{stats['blits_calls']:>10}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+敌人更新的性能测试
+对比逐个调用Enemy.update和数组结构核心（EnemySoACore）批量模拟的每帧耗时
+
+运行方式（项目根目录）：
+    python benchmarks/bench_soa.py
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pygame
+from modules.enemies.enemy_manager import EnemyManager
+
+ENEMY_COUNTS = [500, 2000, 5000]
+ENEMY_TYPES = ['ghost', 'radish', 'slime']
+SCREEN_SIZE = (1280, 720)
+WORLD_RANGE = 3000
+FRAMES = 30
+
+
+class BenchPlayer:
+    """只提供敌人更新需要的属性"""
+    world_x = 0.0
+    world_y = 0.0
+    level = 0
+
+
+def build_manager(count, use_soa):
+    """生成敌人，约三分之一带有燃烧效果"""
+    random.seed(1)
+    manager = EnemyManager()
+    manager.spawn_director.enabled = False  # 不自动生成敌人
+    manager.lod.set_view_size(SCREEN_SIZE)
+    for _ in range(count):
+        manager.spawn_enemy(random.choice(ENEMY_TYPES),
+                            random.uniform(-WORLD_RANGE, WORLD_RANGE),
+                            random.uniform(-WORLD_RANGE, WORLD_RANGE))
+    manager.set_soa_enabled(use_soa)
+    for enemy in manager.enemies[::3]:
+        enemy.apply_burn_effect(0.001, 1000)
+    return manager
+
+
+def time_update(manager):
+    player = BenchPlayer()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        manager.update(1 / 60, player)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    print(f"{'敌人数':>8}{'逐个(ms)':>12}{'数组(ms)':>12}")
+    for count in ENEMY_COUNTS:
+        object_ms = time_update(build_manager(count, False))
+        soa_ms = time_update(build_manager(count, True))
+        print(f"{count:>8}{object_ms:>12.2f}{soa_ms:>12.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
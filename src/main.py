@@ -10,7 +10,7 @@ def main():
     pygame.display.set_caption("像素生存")
     
     clock = pygame.time.Clock()
-    game = Game(screen)
+    game = Game(screen, debug_mode="--debug" in sys.argv)  # 使用 --debug 启动时启用调试按键
     
     while game.running:
         dt = clock.tick(30) / 1000.0  # 转换为秒
@@ -0,0 +1,18 @@
+"""
+碰撞系统导出模块
+提供空间网格、碰撞粗检测和连续碰撞检测工具
+"""
+
+from .spatial_grid import SpatialGrid
+from .broad_phase import BroadPhase, projectile_enemy_candidates, brute_force_candidates, enemies_in_radius
+from .swept import swept_mask_collision, reset_sweep
+
+__all__ = [
+    'SpatialGrid',
+    'BroadPhase',
+    'projectile_enemy_candidates',
+    'brute_force_candidates',
+    'enemies_in_radius',
+    'swept_mask_collision',
+    'reset_sweep'
+]
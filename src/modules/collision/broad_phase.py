@@ -0,0 +1,237 @@
+"""
+碰撞粗检测
+为投射物筛选可能发生碰撞的敌人，供像素级检测使用
+
+支持三种可切换的实现：
+    'brute': 逐一计算每对投射物和敌人的距离（原始实现）
+    'grid':  通过空间网格只检测相邻格子中的敌人
+    'numpy': 每帧把敌人和投射物打包成数组，一次性计算距离矩阵
+三种实现的判定条件完全相同：敌人rect左上角到投射物本次移动轨迹（上一次检测位置到当前位置的线段）
+的距离小于两者宽度一半之和。投射物静止时等同于单帧的距离检测。
+"""
+
+import math
+import numpy as np
+from .swept import sweep_start, segment_point_distance
+
+
+def projectile_enemy_candidates(grid, projectile):
+    """
+    通过空间网格获取与投射物通过距离检测的敌人
+
+    只检查投射物移动轨迹覆盖的格子及相邻格子中的敌人，距离判定与逐一遍历时完全一致：
+    敌人rect左上角到投射物移动轨迹的距离小于两者宽度一半之和。
+
+    Args:
+        grid: 敌人的空间网格（SpatialGrid）
+        projectile: 投射物，需要有world_x、world_y和rect属性
+
+    Returns:
+        list: 通过距离检测的敌人列表，按敌人列表中的顺序排列
+    """
+    px = projectile.world_x
+    py = projectile.world_y
+    sx, sy = sweep_start(projectile)
+    half_width = projectile.rect.width / 2
+    reach = half_width + grid.max_half_width
+
+    left = min(sx, px) - reach
+    top = min(sy, py) - reach
+    width = abs(px - sx) + reach * 2
+    height = abs(py - sy) + reach * 2
+
+    result = []
+    for enemy in grid.query_rect(left, top, width, height):
+        distance = segment_point_distance(sx, sy, px, py, enemy.rect.x, enemy.rect.y)
+        if distance < enemy.rect.width / 2 + half_width:
+            result.append(enemy)
+    return result
+
+
+def brute_force_candidates(enemies, projectile):
+    """
+    逐一遍历敌人列表获取与投射物通过距离检测的敌人
+
+    Args:
+        enemies: 敌人列表
+        projectile: 投射物
+
+    Returns:
+        list: 通过距离检测的敌人列表
+    """
+    px = projectile.world_x
+    py = projectile.world_y
+    sx, sy = sweep_start(projectile)
+
+    result = []
+    for enemy in enemies:
+        distance = segment_point_distance(sx, sy, px, py, enemy.rect.x, enemy.rect.y)
+        if distance < enemy.rect.width / 2 + projectile.rect.width / 2:
+            result.append(enemy)
+    return result
+
+
+def enemies_in_radius(enemies, x, y, radius):
+    """
+    获取中心点在圆形范围内的敌人，用于爆炸、光环等范围效果
+
+    Args:
+        enemies: 敌人列表，或提供enemies_in_radius空间查询的EnemyManager
+        x: 范围中心X坐标（世界坐标）
+        y: 范围中心Y坐标（世界坐标）
+        radius: 范围半径
+
+    Returns:
+        list: 范围内的敌人，按敌人列表中的顺序排列
+    """
+    if hasattr(enemies, 'enemies_in_radius'):
+        return enemies.enemies_in_radius(x, y, radius)
+
+    result = []
+    for enemy in enemies:
+        # 先做一个简单的矩形检测，快速排除明显不在范围内的敌人
+        if (abs(enemy.rect.centerx - x) <= radius + enemy.rect.width // 2 and
+                abs(enemy.rect.centery - y) <= radius + enemy.rect.height // 2):
+            dx = enemy.rect.centerx - x
+            dy = enemy.rect.centery - y
+            if math.sqrt(dx * dx + dy * dy) <= radius:
+                result.append(enemy)
+    return result
+
+
+class BroadPhase:
+    """可切换实现的投射物-敌人碰撞粗检测"""
+
+    BACKENDS = ('brute', 'grid', 'numpy')
+
+    def __init__(self, backend='grid', chunk_size=1 << 18):
+        """
+        Args:
+            backend: 使用的实现（'brute'、'grid'或'numpy'）
+            chunk_size: numpy实现中单次计算的距离矩阵最大元素数量，避免一次分配过大的数组
+        """
+        self.backend = None
+        self.set_backend(backend)
+        self.chunk_size = chunk_size
+
+        # 对比模式：同时使用另一种实现计算候选，统计结果不一致的次数
+        self.verify_backend = None
+        self.mismatch_count = 0
+
+        # 当前帧的敌人数据
+        self.enemies = []
+        self.grid = None
+        self._enemy_x = None
+        self._enemy_y = None
+        self._enemy_half_width = None
+
+    def set_backend(self, backend):
+        """
+        切换粗检测实现
+
+        Args:
+            backend: 实现名称
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"未知的碰撞检测实现: {backend}")
+        self.backend = backend
+
+    def next_backend(self):
+        """切换到下一种实现，返回新的实现名称"""
+        index = self.BACKENDS.index(self.backend)
+        self.set_backend(self.BACKENDS[(index + 1) % len(self.BACKENDS)])
+        return self.backend
+
+    def begin_frame(self, enemies, grid):
+        """
+        每帧碰撞检测开始前调用，记录并打包当前帧的敌人数据
+
+        Args:
+            enemies: 敌人列表
+            grid: 敌人的空间网格
+        """
+        self.enemies = list(enemies)
+        self.grid = grid
+        if self.backend == 'numpy' or self.verify_backend == 'numpy':
+            self._pack_enemies()
+
+    def _pack_enemies(self):
+        """把敌人的左上角坐标和半宽打包成数组"""
+        data = np.array([(enemy.rect.x, enemy.rect.y, enemy.rect.width) for enemy in self.enemies],
+                        dtype=np.float64).reshape(-1, 3).T
+        self._enemy_x = data[0]
+        self._enemy_y = data[1]
+        self._enemy_half_width = data[2] / 2
+
+    def query(self, projectiles):
+        """
+        获取每个投射物通过距离检测的敌人
+
+        Args:
+            projectiles: 投射物列表
+
+        Returns:
+            list: 与projectiles一一对应的候选敌人列表
+        """
+        projectiles = list(projectiles)
+        result = self._query_with(self.backend, projectiles)
+
+        if self.verify_backend is not None and self.verify_backend != self.backend:
+            expected = self._query_with(self.verify_backend, projectiles)
+            if expected != result:
+                self.mismatch_count += 1
+
+        return result
+
+    def _query_with(self, backend, projectiles):
+        if backend == 'grid':
+            return [projectile_enemy_candidates(self.grid, projectile) for projectile in projectiles]
+        if backend == 'numpy':
+            return self._query_numpy(projectiles)
+        return [brute_force_candidates(self.enemies, projectile) for projectile in projectiles]
+
+    def _query_numpy(self, projectiles):
+        """一次性计算敌人到各投射物移动轨迹的距离矩阵（按块计算）"""
+        result = [[] for _ in projectiles]
+        if not projectiles or not self.enemies:
+            return result
+
+        count = len(projectiles)
+        data = np.array([sweep_start(projectile) + (projectile.world_x, projectile.world_y, projectile.rect.width)
+                         for projectile in projectiles], dtype=np.float64).T
+        start_x = data[0][:, None]
+        start_y = data[1][:, None]
+        seg_x = (data[2] - data[0])[:, None]
+        seg_y = (data[3] - data[1])[:, None]
+        seg_length_sq = seg_x * seg_x + seg_y * seg_y
+        moving = seg_length_sq > 0
+        safe_length_sq = np.where(moving, seg_length_sq, 1.0)
+        proj_half_width = (data[4] / 2)[:, None]
+
+        enemies = self.enemies
+        enemy_x = self._enemy_x
+        enemy_y = self._enemy_y
+        enemy_half_width = self._enemy_half_width
+
+        rows_per_chunk = max(1, self.chunk_size // len(enemies))
+        for start in range(0, count, rows_per_chunk):
+            end = min(start + rows_per_chunk, count)
+            ax = start_x[start:end]
+            ay = start_y[start:end]
+            sx = seg_x[start:end]
+            sy = seg_y[start:end]
+
+            # 敌人在轨迹上的投影位置，静止的投射物取终点
+            t = ((enemy_x - ax) * sx + (enemy_y - ay) * sy) / safe_length_sq[start:end]
+            t = np.where(moving[start:end], np.clip(t, 0.0, 1.0), 1.0)
+            dx = enemy_x - (ax + t * sx)
+            dy = enemy_y - (ay + t * sy)
+            distance = np.sqrt(dx * dx + dy * dy)
+            hit = distance < enemy_half_width + proj_half_width[start:end]
+
+            # nonzero按行优先返回，保证投射物和敌人的顺序与遍历时一致
+            rows, cols = np.nonzero(hit)
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                result[start + row].append(enemies[col])
+
+        return result
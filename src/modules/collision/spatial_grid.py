@@ -0,0 +1,252 @@
+"""
+空间哈希网格
+按世界坐标把实体划分到固定大小的格子中，用于加速碰撞和范围查询
+"""
+
+import math
+
+
+class SpatialGrid:
+    """均匀空间哈希网格
+
+    每个实体按其rect中心点落入唯一的格子。查询时根据已插入实体的最大半宽/半高
+    扩展查询范围，保证不会漏掉rect与查询区域相交的实体。
+    查询结果按插入顺序返回，与遍历原始列表时的顺序一致。
+    """
+
+    def __init__(self, cell_size=128):
+        """
+        Args:
+            cell_size: 格子边长（世界坐标像素）
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # {(cx, cy): [obj, ...]}
+        self._cell_of = {}  # {obj: (cx, cy)}
+        self._order = {}  # {obj: 插入序号}
+        self._next_order = 0
+
+        # 已插入实体的最大半宽和半高，用于扩展查询范围
+        self.max_half_width = 0
+        self.max_half_height = 0
+
+    def __len__(self):
+        return len(self._cell_of)
+
+    def __contains__(self, obj):
+        return obj in self._cell_of
+
+    def _cell_key(self, x, y):
+        """获取世界坐标所在的格子坐标"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def clear(self):
+        """清空网格"""
+        self.cells.clear()
+        self._cell_of.clear()
+        self._order.clear()
+        self._next_order = 0
+        self.max_half_width = 0
+        self.max_half_height = 0
+
+    def insert(self, obj):
+        """
+        插入实体（实体需要有rect属性）
+
+        Args:
+            obj: 要插入的实体
+        """
+        if obj in self._cell_of:
+            self.move(obj)
+            return
+
+        rect = obj.rect
+        key = self._cell_key(rect.centerx, rect.centery)
+        self.cells.setdefault(key, []).append(obj)
+        self._cell_of[obj] = key
+        self._order[obj] = self._next_order
+        self._next_order += 1
+
+        if rect.width / 2 > self.max_half_width:
+            self.max_half_width = rect.width / 2
+        if rect.height / 2 > self.max_half_height:
+            self.max_half_height = rect.height / 2
+
+    def remove(self, obj):
+        """
+        移除实体
+
+        Args:
+            obj: 要移除的实体
+
+        Returns:
+            bool: 实体是否在网格中
+        """
+        key = self._cell_of.pop(obj, None)
+        if key is None:
+            return False
+        self._order.pop(obj, None)
+
+        bucket = self.cells.get(key)
+        if bucket is not None:
+            bucket.remove(obj)
+            if not bucket:
+                del self.cells[key]
+        return True
+
+    def move(self, obj):
+        """
+        实体位置变化后增量更新其所在格子
+
+        Args:
+            obj: 已插入的实体
+        """
+        old_key = self._cell_of.get(obj)
+        if old_key is None:
+            self.insert(obj)
+            return
+
+        rect = obj.rect
+        new_key = self._cell_key(rect.centerx, rect.centery)
+        if new_key == old_key:
+            return
+
+        bucket = self.cells[old_key]
+        bucket.remove(obj)
+        if not bucket:
+            del self.cells[old_key]
+        self.cells.setdefault(new_key, []).append(obj)
+        self._cell_of[obj] = new_key
+
+    def rebuild(self, objects):
+        """
+        根据实体列表重建网格，插入顺序与列表顺序一致
+
+        Args:
+            objects: 实体列表
+        """
+        self.clear()
+        cells = self.cells
+        cell_of = self._cell_of
+        order = self._order
+        size = self.cell_size
+        max_hw = 0
+        max_hh = 0
+
+        for index, obj in enumerate(objects):
+            rect = obj.rect
+            key = (math.floor(rect.centerx / size), math.floor(rect.centery / size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [obj]
+            else:
+                bucket.append(obj)
+            cell_of[obj] = key
+            order[obj] = index
+            if rect.width > max_hw:
+                max_hw = rect.width
+            if rect.height > max_hh:
+                max_hh = rect.height
+
+        self._next_order = len(cell_of)
+        self.max_half_width = max_hw / 2
+        self.max_half_height = max_hh / 2
+
+    def _collect(self, min_x, min_y, max_x, max_y):
+        """收集中心点落在给定范围所覆盖格子内的实体（未排序、未精确过滤）"""
+        size = self.cell_size
+        cx0 = math.floor(min_x / size)
+        cy0 = math.floor(min_y / size)
+        cx1 = math.floor(max_x / size)
+        cy1 = math.floor(max_y / size)
+
+        cells = self.cells
+        result = []
+        # 查询范围覆盖的格子数量多于已占用格子时，直接遍历已占用格子
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    result.extend(bucket)
+            return result
+
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    result.extend(bucket)
+        return result
+
+    def query_rect(self, left, top, width, height):
+        """
+        查询rect与给定矩形区域相交的实体
+
+        Args:
+            left: 区域左边界（世界坐标）
+            top: 区域上边界（世界坐标）
+            width: 区域宽度
+            height: 区域高度
+
+        Returns:
+            list: 相交的实体列表，按插入顺序排列
+        """
+        right = left + width
+        bottom = top + height
+        candidates = self._collect(
+            left - self.max_half_width, top - self.max_half_height,
+            right + self.max_half_width, bottom + self.max_half_height
+        )
+
+        result = []
+        for obj in candidates:
+            rect = obj.rect
+            if rect.right > left and rect.left < right and rect.bottom > top and rect.top < bottom:
+                result.append(obj)
+
+        order = self._order
+        result.sort(key=order.__getitem__)
+        return result
+
+    def query_neighbors(self, x, y, reach):
+        """
+        查询中心点附近可能与半径reach内区域接触的所有实体（不做精确过滤）
+
+        返回的实体包含rect与以(x, y)为中心、边长2*reach的正方形相交的全部实体，
+        调用方需自行做精确检测。
+
+        Args:
+            x: 查询中心X坐标
+            y: 查询中心Y坐标
+            reach: 查询半径
+
+        Returns:
+            list: 候选实体列表，按插入顺序排列
+        """
+        candidates = self._collect(
+            x - reach - self.max_half_width, y - reach - self.max_half_height,
+            x + reach + self.max_half_width, y + reach + self.max_half_height
+        )
+        order = self._order
+        candidates.sort(key=order.__getitem__)
+        return candidates
+
+    def query_radius(self, x, y, radius):
+        """
+        查询rect中心点到(x, y)的距离不超过radius的实体
+
+        Args:
+            x: 查询中心X坐标
+            y: 查询中心Y坐标
+            radius: 查询半径
+
+        Returns:
+            list: 实体列表，按插入顺序排列
+        """
+        result = []
+        for obj in self._collect(x - radius, y - radius, x + radius, y + radius):
+            dx = obj.rect.centerx - x
+            dy = obj.rect.centery - y
+            if math.sqrt(dx * dx + dy * dy) <= radius:
+                result.append(obj)
+
+        order = self._order
+        result.sort(key=order.__getitem__)
+        return result
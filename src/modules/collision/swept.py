@@ -0,0 +1,108 @@
+"""
+连续碰撞检测
+投射物记录上一次碰撞检测时的位置，检测时使用这段移动轨迹（线段）代替单帧位置，
+避免高速投射物在一帧内穿过敌人
+"""
+
+import math
+from ..utils import apply_mask_collision
+from ..resource_manager import resource_manager
+
+# 窄检测时沿轨迹采样的最大次数
+MAX_SWEEP_SAMPLES = 32
+
+
+def sweep_start(projectile):
+    """
+    获取投射物本次移动轨迹的起点
+
+    没有记录上一次位置的投射物视为静止，与单帧检测完全相同
+
+    Args:
+        projectile: 投射物
+
+    Returns:
+        tuple: 起点世界坐标 (x, y)
+    """
+    return (getattr(projectile, 'prev_world_x', projectile.world_x),
+            getattr(projectile, 'prev_world_y', projectile.world_y))
+
+
+def reset_sweep(projectile):
+    """
+    碰撞检测结束后把轨迹起点更新为当前位置
+
+    Args:
+        projectile: 投射物
+    """
+    projectile.prev_world_x = projectile.world_x
+    projectile.prev_world_y = projectile.world_y
+
+
+def segment_point_distance(ax, ay, bx, by, px, py):
+    """
+    计算点到线段的最短距离
+
+    Args:
+        ax, ay: 线段起点
+        bx, by: 线段终点
+        px, py: 点坐标
+
+    Returns:
+        float: 最短距离
+    """
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        # 线段退化为点，与单帧距离检测的计算方式保持一致
+        ex = px - bx
+        ey = py - by
+        return (ex**2 + ey**2)**0.5
+
+    t = ((px - ax) * dx + (py - ay) * dy) / length_sq
+    t = max(0.0, min(1.0, t))
+    ex = px - (ax + t * dx)
+    ey = py - (ay + t * dy)
+    return (ex**2 + ey**2)**0.5
+
+
+def swept_mask_collision(enemy, projectile):
+    """
+    沿投射物的移动轨迹进行像素级碰撞检测
+
+    先检测当前位置（与单帧检测一致），未命中时再从轨迹起点开始按投射物尺寸的一半为步长采样，
+    返回轨迹上是否有任意位置与敌人的遮罩重叠。检测过程不修改投射物的位置。
+
+    Args:
+        enemy: 敌人（需要有image、rect属性）
+        projectile: 投射物（需要有image、rect、world_x、world_y属性）
+
+    Returns:
+        bool: 是否发生碰撞
+    """
+    if apply_mask_collision(enemy, projectile):
+        return True
+
+    start_x, start_y = sweep_start(projectile)
+    dx = projectile.world_x - start_x
+    dy = projectile.world_y - start_y
+    step = max(1.0, min(projectile.rect.width, projectile.rect.height) / 2)
+    samples = min(MAX_SWEEP_SAMPLES, int(math.hypot(dx, dy) / step))
+    if samples <= 0:
+        return False
+
+    if getattr(enemy, 'mask', None) is None:
+        enemy.mask = resource_manager.get_surface_mask(enemy.image)
+    if getattr(projectile, 'mask', None) is None:
+        projectile.mask = resource_manager.get_surface_mask(projectile.image)
+
+    rect = projectile.rect.copy()
+    for i in range(samples):
+        t = i / samples
+        rect.centerx = round(start_x + dx * t)
+        rect.centery = round(start_y + dy * t)
+        offset = (rect.x - enemy.rect.x, rect.y - enemy.rect.y)
+        if enemy.mask.overlap(projectile.mask, offset) is not None:
+            return True
+    return False
@@ -0,0 +1,99 @@
+"""
+战斗事件队列
+碰撞检测过程中只记录命中、击杀和音效，在每帧结束时统一结算：
+一次性压缩敌人列表、批量生成掉落物品并合并重复的音效
+"""
+
+from .resource_manager import resource_manager
+
+
+class CombatEventQueue:
+    """记录一帧内的战斗事件，并在帧末批量结算"""
+
+    def __init__(self):
+        self._killed = {}  # {enemy: None}，保持击杀顺序并去重
+        self._sounds = {}  # {sound_name: None}，同一帧内相同音效只播放一次
+        self.hit_count = 0
+
+        # 上一次结算的统计数据
+        self.last_hits = 0
+        self.last_kills = 0
+
+    def __contains__(self, enemy):
+        """敌人是否已在本帧被记录为击杀"""
+        return enemy in self._killed
+
+    def record_hit(self, enemy, sound="hit"):
+        """
+        记录一次命中
+
+        Args:
+            enemy: 被命中的敌人
+            sound: 命中音效名称
+        """
+        self.hit_count += 1
+        if sound:
+            self._sounds[sound] = None
+
+    def record_kill(self, enemy, sound="enemy_death"):
+        """
+        记录一次击杀，同一个敌人只记录一次
+
+        Args:
+            enemy: 被击杀的敌人
+            sound: 死亡音效名称
+        """
+        self._killed[enemy] = None
+        if sound:
+            self._sounds[sound] = None
+
+    def queue_sound(self, name):
+        """
+        记录需要在帧末播放的音效
+
+        Args:
+            name: 音效名称
+        """
+        self._sounds[name] = None
+
+    def resolve(self, enemy_manager, item_manager=None, player=None):
+        """
+        结算本帧记录的所有事件
+
+        遍历一次敌人列表，把被记录击杀的敌人和被范围伤害、状态效果杀死的敌人一并移除，
+        然后批量生成掉落物品，并播放去重后的音效。
+
+        Args:
+            enemy_manager: 敌人管理器
+            item_manager: 物品管理器，None时不生成掉落
+            player: 玩家对象，用于掉落的幸运值加成
+
+        Returns:
+            int: 本帧击杀的敌人数量
+        """
+        killed = self._killed
+        for enemy in enemy_manager.enemies:
+            if enemy not in killed and not enemy.alive():
+                killed[enemy] = None
+                self._sounds["enemy_death"] = None
+
+        if killed:
+            enemy_manager.remove_enemies(killed)
+            if item_manager:
+                item_manager.spawn_items(
+                    [(enemy.rect.x, enemy.rect.y, enemy.type) for enemy in killed], player)
+
+        for sound in self._sounds:
+            resource_manager.play_sound(sound)
+
+        kills = len(killed)
+        self.last_hits = self.hit_count
+        self.last_kills = kills
+        self.clear()
+        return kills
+
+    def clear(self):
+        """丢弃本帧记录的所有事件"""
+        self._killed = {}
+        self._sounds = {}
+        self.hit_count = 0
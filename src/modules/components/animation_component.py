@@ -50,13 +50,14 @@ class AnimationComponent(Component):
         from ..resource_manager import resource_manager
         
         for anim_name, anim_info in animation_data.items():
+            # 使用精灵表路径作为资源名称，避免不同英雄的同名动画互相覆盖
             sprite_sheet = resource_manager.load_spritesheet(
-                f"{anim_name}_sprite", 
+                anim_info['sprite_sheet'], 
                 anim_info['sprite_sheet']
             )
             
             self.animations[anim_name] = resource_manager.create_animation(
-                f"{anim_name}_anim",
+                f"{anim_info['sprite_sheet']}_anim",
                 sprite_sheet,
                 frame_width=anim_info.get('frame_width', 32),
                 frame_height=anim_info.get('frame_height', 32),
@@ -125,6 +126,30 @@ class AnimationComponent(Component):
             
         return None
     
+    def get_current_mask(self, flip_x=False, surface=None):
+        """
+        获取当前动画帧的碰撞遮罩（带缓存）
+        
+        Args:
+            flip_x: 是否水平翻转
+            surface: 当前帧图像，缓存未命中时用于计算遮罩，None表示重新获取
+            
+        Returns:
+            Mask: 当前帧的遮罩
+        """
+        from ..resource_manager import resource_manager
+        
+        if surface is None:
+            surface = self.get_current_frame(flip_x)
+        if surface is None:
+            return None
+            
+        animation = self.animations.get(self.current_animation)
+        if animation is None:
+            return resource_manager.get_surface_mask(surface)
+        return resource_manager.get_frame_mask(
+            animation.name, animation.current_frame, 1.0, flip_x, surface)
+    
     def render(self, screen, rect):
         """
         渲染当前动画帧
@@ -6,6 +6,7 @@
 from .base_component import Component
 import inspect
 from ..weapons.weapon_utils import create_weapon
+from ..weapons.targeting import TargetingService
 
 class WeaponManager(Component):
     """武器管理组件，处理实体的武器系统"""
@@ -27,6 +28,9 @@ class WeaponManager(Component):
         
         # 可用武器类型
         self.available_weapons = {}  # 将在player类中初始化
+        
+        # 所有武器共享的目标查询服务，每帧只建立一次索引
+        self.targeting = TargetingService()
     
     def add_weapon(self, weapon_type):
         """
@@ -52,6 +56,7 @@ class WeaponManager(Component):
                 weapon = self.available_weapons[weapon_type](self.owner)
                 
             if weapon:
+                weapon.targeting = self.targeting
                 self.weapons.append(weapon)
                 self.weapon_levels[weapon_type] = 1
                 
@@ -94,6 +99,9 @@ class WeaponManager(Component):
         if not enemies:
             enemies = []
         
+        # 建立本帧的敌人索引，所有武器的目标查询共享同一份索引
+        self.targeting.rebuild(enemies)
+        
         for weapon in self.weapons:
             # 检查weapon.update方法所需的参数数量
             update_signature = inspect.signature(weapon.update)
@@ -110,7 +118,7 @@ class WeaponManager(Component):
             if attack_power > 0:
                 self.apply_attack_power_bonus()
     
-    def render(self, screen, camera_x, camera_y):
+    def render(self, screen, camera_x, camera_y, batcher=None):
         """
         渲染所有武器
         
@@ -118,9 +126,12 @@ class WeaponManager(Component):
             screen: 目标Surface
             camera_x: 相机X坐标
             camera_y: 相机Y坐标
+            batcher: RenderBatcher实例，提供时只收集绘制内容，由调用方统一提交
         """
         for weapon in self.weapons:
-            if hasattr(weapon, 'render'):
+            if batcher is not None and hasattr(weapon, 'queue_render'):
+                weapon.queue_render(batcher, camera_x, camera_y)
+            elif hasattr(weapon, 'render'):
                 weapon.render(screen, camera_x, camera_y)
     
     def apply_weapon_upgrade(self, weapon_type, level, effects):
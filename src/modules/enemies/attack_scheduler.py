@@ -0,0 +1,86 @@
+"""
+远程攻击调度器
+远程敌人在生成时注册，每帧统一调度它们的攻击，无需在碰撞检测中逐一探测敌人类型
+"""
+
+
+class AttackScheduler:
+    """按注册顺序调度远程敌人的攻击"""
+
+    def __init__(self):
+        self.attackers = []  # 已注册的远程敌人，按注册顺序排列
+        self._registered = set()
+
+    def __len__(self):
+        return len(self.attackers)
+
+    def __contains__(self, enemy):
+        return enemy in self._registered
+
+    def register(self, enemy):
+        """
+        注册远程敌人
+
+        Args:
+            enemy: 远程敌人
+        """
+        if enemy in self._registered:
+            return
+        self._registered.add(enemy)
+        self.attackers.append(enemy)
+
+    def unregister(self, enemy):
+        """
+        取消注册（敌人死亡或被移除时调用）
+
+        Args:
+            enemy: 远程敌人
+
+        Returns:
+            bool: 敌人是否已注册
+        """
+        if enemy not in self._registered:
+            return False
+        self._registered.discard(enemy)
+        self.attackers.remove(enemy)
+        return True
+
+    def unregister_many(self, enemies):
+        """
+        批量取消注册，只对注册列表做一次压缩
+
+        Args:
+            enemies: 要取消注册的敌人集合
+        """
+        removed = [enemy for enemy in enemies if enemy in self._registered]
+        if not removed:
+            return
+        self._registered.difference_update(removed)
+        registered = self._registered
+        self.attackers[:] = [enemy for enemy in self.attackers if enemy in registered]
+
+    def clear(self):
+        """清空所有注册的敌人"""
+        self.attackers.clear()
+        self._registered.clear()
+
+    def update(self, player):
+        """
+        调度本帧所有远程敌人的攻击，玩家进入无敌状态后停止调度
+
+        Args:
+            player: 攻击目标（玩家）
+
+        Returns:
+            bool: 本帧是否有攻击命中玩家
+        """
+        hit = False
+        for enemy in self.attackers[:]:  # 使用副本，攻击过程中敌人可能被移除
+            if player.invincible:
+                break
+            # 本帧已经死亡、等待移除的敌人不再攻击
+            if not enemy.alive():
+                continue
+            if enemy.attack_player(player):
+                hit = True
+        return hit
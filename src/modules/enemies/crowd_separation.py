@@ -0,0 +1,214 @@
+"""
+敌人群体分离
+每帧在敌人移动之后把彼此重叠的敌人推开，避免成群的敌人叠成一团。
+通过均匀网格只检测相邻格子中的敌人，总耗时与敌人数量成线性关系。
+"""
+
+import math
+import numpy as np
+
+# 检测的相邻格子偏移（只取一半，保证每对敌人只检测一次）
+NEIGHBOR_OFFSETS = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class CrowdSeparation:
+    """基于网格的敌人分离求解器
+
+    每个敌人的分离半径和分离强度来自ENEMY_CONFIGS中的separation_radius和separation_strength，
+    半径为0的敌人不参与分离。两个敌人中心距离小于两者半径的平均值时，按各自的强度沿连线方向推开。
+    """
+
+    BACKENDS = ('auto', 'python', 'numpy')
+
+    def __init__(self, backend='auto', numpy_threshold=200):
+        """
+        Args:
+            backend: 使用的实现（'python'、'numpy'，或按敌人数量自动选择的'auto'）
+            numpy_threshold: 'auto'模式下敌人数量达到该值时使用numpy实现
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"未知的群体分离实现: {backend}")
+        self.backend = backend
+        self.numpy_threshold = numpy_threshold
+        self.enabled = True
+
+    def apply(self, enemies):
+        """
+        推开彼此重叠的敌人
+
+        Args:
+            enemies: 敌人列表（需要有rect、separation_radius和separation_strength属性）
+        """
+        if not self.enabled or len(enemies) < 2:
+            return
+
+        xs = [enemy.rect.centerx for enemy in enemies]
+        ys = [enemy.rect.centery for enemy in enemies]
+        radii = [enemy.separation_radius for enemy in enemies]
+        strengths = [enemy.separation_strength for enemy in enemies]
+
+        disp_x, disp_y = self.compute_displacements(xs, ys, radii, strengths)
+
+        for enemy, dx, dy in zip(enemies, disp_x, disp_y):
+            if dx or dy:
+                enemy.rect.x += round(dx)
+                enemy.rect.y += round(dy)
+
+    def compute_displacements(self, xs, ys, radii, strengths):
+        """
+        计算每个敌人需要移动的距离
+
+        Args:
+            xs: 敌人中心X坐标列表
+            ys: 敌人中心Y坐标列表
+            radii: 分离半径列表
+            strengths: 分离强度列表（0~1，每帧消除的重叠比例）
+
+        Returns:
+            tuple: (disp_x, disp_y) 每个敌人的位移
+        """
+        backend = self.backend
+        if backend == 'auto':
+            backend = 'numpy' if len(xs) >= self.numpy_threshold else 'python'
+        if backend == 'numpy':
+            disp_x, disp_y = self._displacements_numpy(xs, ys, radii, strengths)
+            return disp_x.tolist(), disp_y.tolist()
+        return self._displacements_python(xs, ys, radii, strengths)
+
+    def _displacements_python(self, xs, ys, radii, strengths):
+        """逐对计算位移"""
+        count = len(xs)
+        disp_x = [0.0] * count
+        disp_y = [0.0] * count
+        cell_size = max(radii, default=0)
+        if cell_size <= 0:
+            return disp_x, disp_y
+
+        cells = {}
+        for i in range(count):
+            if radii[i] > 0:
+                key = (math.floor(xs[i] / cell_size), math.floor(ys[i] / cell_size))
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [i]
+                else:
+                    bucket.append(i)
+
+        for (cx, cy), bucket in cells.items():
+            for ox, oy in NEIGHBOR_OFFSETS:
+                same_cell = ox == 0 and oy == 0
+                others = bucket if same_cell else cells.get((cx + ox, cy + oy))
+                if not others:
+                    continue
+
+                for position, i in enumerate(bucket):
+                    for j in (others[position + 1:] if same_cell else others):
+                        dx = xs[j] - xs[i]
+                        dy = ys[j] - ys[i]
+                        limit = (radii[i] + radii[j]) / 2
+                        distance_sq = dx * dx + dy * dy
+                        if distance_sq >= limit * limit:
+                            continue
+
+                        distance = math.sqrt(distance_sq)
+                        if distance > 0:
+                            nx = dx / distance
+                            ny = dy / distance
+                        else:
+                            # 完全重合时沿X轴推开
+                            nx = 1.0
+                            ny = 0.0
+                        push = (limit - distance) * 0.5
+
+                        disp_x[i] -= nx * push * strengths[i]
+                        disp_y[i] -= ny * push * strengths[i]
+                        disp_x[j] += nx * push * strengths[j]
+                        disp_y[j] += ny * push * strengths[j]
+
+        return disp_x, disp_y
+
+    def _displacements_numpy(self, xs, ys, radii, strengths):
+        """把所有相邻格子中的敌人对展开成数组，一次性计算位移"""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        radii = np.asarray(radii, dtype=np.float64)
+        strengths = np.asarray(strengths, dtype=np.float64)
+        count = len(xs)
+        disp_x = np.zeros(count)
+        disp_y = np.zeros(count)
+
+        active = np.nonzero(radii > 0)[0]
+        if len(active) < 2:
+            return disp_x, disp_y
+        cell_size = radii.max()
+
+        # 把格子坐标编码成一维编号，相邻格子的编号差固定
+        cx = np.floor(xs[active] / cell_size).astype(np.int64)
+        cy = np.floor(ys[active] / cell_size).astype(np.int64)
+        cx -= cx.min()
+        cy -= cy.min() - 1
+        height = int(cy.max()) + 2
+        cell_id = cx * height + cy
+
+        order = active[np.argsort(cell_id, kind='stable')]
+        sorted_ids = np.sort(cell_id, kind='stable')
+        cells, starts, counts = np.unique(sorted_ids, return_index=True, return_counts=True)
+
+        pairs_i = []
+        pairs_j = []
+        for ox, oy in NEIGHBOR_OFFSETS:
+            same_cell = ox == 0 and oy == 0
+            if same_cell:
+                cell_a = np.arange(len(cells))
+                cell_b = cell_a
+            else:
+                neighbor = cells + ox * height + oy
+                position = np.searchsorted(cells, neighbor)
+                position[position >= len(cells)] = 0
+                found = cells[position] == neighbor
+                cell_a = np.nonzero(found)[0]
+                cell_b = position[found]
+            if len(cell_a) == 0:
+                continue
+
+            # 展开两个格子之间的所有敌人对
+            count_a = counts[cell_a]
+            count_b = counts[cell_b]
+            totals = count_a * count_b
+            pair_cell = np.repeat(np.arange(len(cell_a)), totals)
+            local = np.arange(totals.sum()) - np.repeat(np.cumsum(totals) - totals, totals)
+            local_a = local // count_b[pair_cell]
+            local_b = local % count_b[pair_cell]
+            if same_cell:
+                keep = local_a < local_b
+                pair_cell = pair_cell[keep]
+                local_a = local_a[keep]
+                local_b = local_b[keep]
+
+            pairs_i.append(order[starts[cell_a][pair_cell] + local_a])
+            pairs_j.append(order[starts[cell_b][pair_cell] + local_b])
+
+        i = np.concatenate(pairs_i)
+        j = np.concatenate(pairs_j)
+        dx = xs[j] - xs[i]
+        dy = ys[j] - ys[i]
+        limit = (radii[i] + radii[j]) / 2
+        distance_sq = dx * dx + dy * dy
+        close = distance_sq < limit * limit
+        i = i[close]
+        j = j[close]
+        dx = dx[close]
+        dy = dy[close]
+        limit = limit[close]
+
+        distance = np.sqrt(distance_sq[close])
+        overlapping = distance > 0
+        safe_distance = np.where(overlapping, distance, 1.0)
+        # 完全重合时沿X轴推开
+        nx = np.where(overlapping, dx / safe_distance, 1.0)
+        ny = np.where(overlapping, dy / safe_distance, 0.0)
+        push = (limit - distance) * 0.5
+
+        disp_x += np.bincount(j, nx * push * strengths[j], count) - np.bincount(i, nx * push * strengths[i], count)
+        disp_y += np.bincount(j, ny * push * strengths[j], count) - np.bincount(i, ny * push * strengths[i], count)
+        return disp_x, disp_y
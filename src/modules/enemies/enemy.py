@@ -2,18 +2,46 @@ import pygame
 import math
 from ..resource_manager import resource_manager
 from ..utils import create_outlined_sprite
-from abc import ABC, abstractmethod
-from .enemy_config import get_enemy_config
+from abc import ABC
+from .enemy_config import get_enemy_stats
+from .frame_bank import frame_banks
+from .registry import enemy_registry, DEFAULT_ANIMATION_SPEED
+from .health_bar import health_bars, HEALTH_BAR_OFFSET_Y
+from ..render_batch import LAYER_ENEMIES, LAYER_ENEMY_OVERLAY
 
 class Enemy(pygame.sprite.Sprite, ABC):
+    # 远程敌人在生成时注册到攻击调度器，由调度器每帧触发攻击
+    ranged = False
+    
     def __init__(self, x, y, enemy_type, difficulty="normal", level=1, scale=None):
         super().__init__()
         
+        # 动画相关
+        self.animations = {}  # 由load_animations按资源清单创建
+        self.frame_bank = None  # 该类型敌人共享的预处理帧，首次更新图像时获取
+        
+        self._init_state(x, y, enemy_type, difficulty, level, scale)
+        
+    def reset(self, x, y, enemy_type, difficulty="normal", level=1, scale=None):
+        """
+        从对象池取出时重新初始化敌人，复用已加载的动画和帧缓存
+        
+        Args:
+            与构造函数相同
+        """
+        self._init_state(x, y, enemy_type, difficulty, level, scale)
+        self.frame_bank = None  # 缩放可能不同，重新从帧缓存获取
+        for animation in self.animations.values():
+            animation.reset()
+        self.update_image()
+        
+    def _init_state(self, x, y, enemy_type, difficulty, level, scale):
+        """初始化敌人的属性和所有运行时状态"""
         # 设置敌人类型
         self.type = enemy_type
         
-        # 从配置获取敌人属性
-        self.config = get_enemy_config(enemy_type, difficulty, level)
+        # 从属性表获取敌人属性（只读，同一类型、难度和等级的敌人共享）
+        self.config = get_enemy_stats(enemy_type, difficulty, level)
         
         # 设置基本属性
         self.health = self.config["health"]
@@ -25,10 +53,17 @@ class Enemy(pygame.sprite.Sprite, ABC):
         # 设置缩放因子
         self.scale = scale if scale is not None else self.config.get("scale", 2.0)
         
-        # 动画相关
-        self.animations = {}  # 子类需要设置具体动画
+        # 群体分离参数，避免敌人叠成一团
+        self.separation_radius = self.config.get("separation_radius", 0)
+        self.separation_strength = self.config.get("separation_strength", 0.5)
+        
+        # 动画状态
         self.current_animation = 'idle'
         
+        # LOD状态：是否更新动画和图像，以及降低更新频率时累积的时间
+        self.lod_visuals = True
+        self.lod_pending_dt = 0.0
+        
         # 设置敌人在世界坐标系中的位置
         self.rect = pygame.Rect(x, y, 44 * self.scale, 30 * self.scale)  # 根据缩放调整碰撞箱大小
         
@@ -68,10 +103,10 @@ class Enemy(pygame.sprite.Sprite, ABC):
         # 创建遮罩
         self.mask = None
         
-    @abstractmethod
     def load_animations(self):
-        """加载敌人的动画，子类必须实现"""
-        pass
+        """按注册表中该类型的资源清单创建动画，该类型的精灵表在第一次生成时加载"""
+        self.animations = enemy_registry.create_animations(
+            self.type, self.config.get("animation_speed", DEFAULT_ANIMATION_SPEED))
         
     def apply_burn_effect(self, damage_per_second, duration):
         """
@@ -162,9 +197,7 @@ class Enemy(pygame.sprite.Sprite, ABC):
                 if self.health <= 0:
                     # 标记敌人为死亡状态
                     self._alive = False
-                    # 播放死亡音效
-                    resource_manager.play_sound("enemy_death")
-                    # 注意：实际移除敌人的操作是在EnemyManager中进行的
+                    # 注意：实际移除敌人和死亡音效由EnemyManager记录为击杀事件后统一处理
                 
             # 检查是否结束
             if effect['total_timer'] >= effect['duration']:
@@ -205,8 +238,8 @@ class Enemy(pygame.sprite.Sprite, ABC):
                 self.invincible = False
                 self.invincible_timer = 0
         
-        # 更新当前动画
-        if self.current_animation in self.animations:
+        # 更新当前动画（屏幕外的敌人不推进动画）
+        if self.lod_visuals and self.current_animation in self.animations:
             self.animations[self.current_animation].update(dt)
         
         # 更新动画状态
@@ -247,73 +280,39 @@ class Enemy(pygame.sprite.Sprite, ABC):
                 if self.current_animation in self.animations:
                     self.animations[self.current_animation].reset()
                     
-        # 更新当前图像
-        self.update_image()
+        # 更新当前图像，屏幕外的敌人保留原有图像，回到屏幕内时再刷新
+        if self.lod_visuals:
+            self.update_image()
             
     def update_image(self):
         """更新敌人的当前图像"""
         if self.current_animation in self.animations:
-            current_frame = self.animations[self.current_animation].get_current_frame()
-            
-            # 缩放图像
-            original_size = current_frame.get_size()
-            new_size = (int(original_size[0] * self.scale), int(original_size[1] * self.scale))
-            current_frame = pygame.transform.scale(current_frame, new_size)
-            
-            # 总是翻转当前帧
-            current_frame = pygame.transform.flip(current_frame, True, False)
+            animation = self.animations[self.current_animation]
             
-            # 根据朝向再次翻转图像
-            if not self.facing_right:
-                current_frame = pygame.transform.flip(current_frame, True, False)
+            # 从帧缓存中取出已经缩放并处理好朝向的帧
+            if self.frame_bank is None:
+                self.frame_bank = frame_banks.get_bank(self.type, self.scale, self.animations)
+            current_frame = self.frame_bank.get_frame(
+                self.current_animation, animation.current_frame, self.facing_right)
             
-            # 应用状态效果的视觉变化
-            modified_frame = current_frame.copy()
-            
-            # 创建遮罩以获取实际边缘和区域
-            mask = pygame.mask.from_surface(current_frame)
-            mask_outline = mask.outline()
-            
-            # 如果有减速效果
-            if 'slow' in self.status_effects:
-                # 创建与原图大小相同的透明表面
-                slow_effect = pygame.Surface(modified_frame.get_size(), pygame.SRCALPHA)
-                
-                # 为边缘添加蓝色光晕
-                if mask_outline:
-                    for point in mask_outline:
-                        # 绘制蓝色光晕点
-                        pygame.draw.circle(slow_effect, (0, 0, 200, 100), point, 3)
-                
-                # 为实际区域添加淡蓝色
-                mask_surface = mask.to_surface(setcolor=(0, 0, 100, 70), unsetcolor=(0, 0, 0, 0))
-                slow_effect.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                
-                # 叠加到原图
-                modified_frame.blit(slow_effect, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            # 获取遮罩以获取实际边缘和区域（同一帧、缩放和朝向的遮罩只计算一次）
+            mask = resource_manager.get_frame_mask(
+                animation.name, animation.current_frame, self.scale, self.facing_right, current_frame)
             
-            # 如果有燃烧闪烁效果
-            if self.burn_flash_timer > 0:
-                # 创建与原图大小相同的透明表面
-                fire_effect = pygame.Surface(modified_frame.get_size(), pygame.SRCALPHA)
-                
-                # 为边缘添加红色光晕
-                if mask_outline:
-                    for point in mask_outline:
-                        # 绘制红色/橙色光晕点
-                        pygame.draw.circle(fire_effect, (255, 100, 0, 150), point, 3)
-                
-                # 为实际区域添加淡红色
-                mask_surface = mask.to_surface(setcolor=(50, 0, 0, 50), unsetcolor=(0, 0, 0, 0))
-                fire_effect.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                
-                # 叠加到原图
-                modified_frame.blit(fire_effect, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            
-            self.image = modified_frame
-            
-            # 更新遮罩
-            self.mask = pygame.mask.from_surface(self.image)
+            # 应用状态效果的视觉变化，叠加效果后的帧同样从缓存中获取
+            slowed = 'slow' in self.status_effects
+            burning = self.burn_flash_timer > 0
+            if slowed or burning:
+                self.image = self.frame_bank.get_tinted_frame(
+                    self.current_animation, animation.current_frame, self.facing_right,
+                    slowed, burning, mask)
+                self.mask = resource_manager.get_frame_mask(
+                    animation.name, animation.current_frame, self.scale, self.facing_right,
+                    self.image, variant=(slowed, burning))
+            else:
+                # 没有状态效果时图像与原始帧相同，直接复用帧遮罩
+                self.image = current_frame
+                self.mask = mask
             
     def toggle_outline(self, show=None, color=None, thickness=None):
         """
@@ -343,32 +342,52 @@ class Enemy(pygame.sprite.Sprite, ABC):
         
         # 绘制敌人
         if hasattr(self, 'image'):
-            if self.show_outline:
-                # 创建带轮廓的图像
-                outlined_image = create_outlined_sprite(
-                    self,
-                    outline_color=self.outline_color,
-                    outline_thickness=self.outline_thickness
-                )
-                screen.blit(outlined_image, draw_rect)
-            else:
-                screen.blit(self.image, draw_rect)
-        
-        # 绘制血条
-        health_bar_width = 32 * self.scale
-        health_bar_height = 5 * self.scale
-        health_ratio = self.health / self.max_health
-        
-        # 调整血条位置，使其位于敌人上方
-        bar_x = screen_x
-        bar_y = screen_y - 10 * self.scale
-        
-        pygame.draw.rect(screen, (255, 0, 0),  # 红色背景
-                        (bar_x, bar_y,
-                         health_bar_width, health_bar_height))
-        pygame.draw.rect(screen, (0, 255, 0),  # 绿色血条
-                        (bar_x, bar_y,
-                         health_bar_width * health_ratio, health_bar_height))
+            screen.blit(self._get_render_image(), draw_rect)
+        
+        # 绘制血条（只在受伤后显示）
+        if self.show_health_bar():
+            screen.blit(self._get_health_bar(), (screen_x, screen_y - HEALTH_BAR_OFFSET_Y * self.scale))
+        
+    def queue_render(self, batcher, screen_x, screen_y):
+        """
+        把敌人和血条添加到批量渲染器
+        
+        Args:
+            batcher: RenderBatcher实例
+            screen_x: 敌人左上角的屏幕X坐标
+            screen_y: 敌人左上角的屏幕Y坐标
+        """
+        if hasattr(self, 'image'):
+            if not batcher.add(LAYER_ENEMIES, self._get_render_image(), (screen_x, screen_y)):
+                return
+        
+        # 满血的敌人不绘制血条
+        if self.show_health_bar():
+            batcher.add(LAYER_ENEMY_OVERLAY, self._get_health_bar(),
+                        (screen_x, screen_y - HEALTH_BAR_OFFSET_Y * self.scale))
+        
+    def show_health_bar(self):
+        """
+        是否需要显示血条：生命值未满或刚刚受到伤害
+        
+        Returns:
+            bool: 是否显示血条
+        """
+        return self.health < self.max_health or self.hurt_timer > 0
+        
+    def _get_render_image(self):
+        """获取需要绘制的图像（开启轮廓时为带轮廓的图像）"""
+        if self.show_outline:
+            return create_outlined_sprite(
+                self,
+                outline_color=self.outline_color,
+                outline_thickness=self.outline_thickness
+            )
+        return self.image
+        
+    def _get_health_bar(self):
+        """获取与当前血量对应的预绘制血条"""
+        return health_bars.get_bar(self.scale, self.health, self.max_health)
         
     def take_damage(self, amount):
         """受到伤害
@@ -3,6 +3,9 @@
 定义所有敌人的基础属性、技能和难度相关的缩放系数
 """
 
+import runpy
+from types import MappingProxyType
+
 # 全局难度系数设置
 DIFFICULTY_MULTIPLIERS = {
     "health": {  # 健康值随难度增长的系数
@@ -42,6 +45,8 @@ ENEMY_CONFIGS = {
         "score_value": 50,      # 击败后获得的分数
         "animation_speed": 0.0333, # 动画速度
         "scale": 1.0,           # 缩放大小
+        "separation_radius": 40,  # 群体分离半径，敌人中心距离小于该值时互相推开（0表示不参与）
+        "separation_strength": 0.5, # 群体分离强度，每帧消除的重叠比例(0~1)
     },
     
     # 萝卜 - 较慢但更健壮的敌人
@@ -52,6 +57,8 @@ ENEMY_CONFIGS = {
         "score_value": 15,
         "animation_speed": 0.0333,
         "scale": 1.0,
+        "separation_radius": 40,
+        "separation_strength": 0.5,
     },
     
     # 蝙蝠 - 快速但脆弱的敌人
@@ -62,6 +69,8 @@ ENEMY_CONFIGS = {
         "score_value": 80,
         "animation_speed": 0.0333,
         "scale": 2.0,
+        "separation_radius": 80,
+        "separation_strength": 0.3,
     },
     
     # 史莱姆 - 远程攻击敌人
@@ -76,21 +85,16 @@ ENEMY_CONFIGS = {
         "min_attack_range": 300, # 最小攻击距离
         "attack_cooldown": 2.0,  # 攻击冷却时间(秒)
         "projectile_speed": 180, # 投射物速度
+        "separation_radius": 40,
+        "separation_strength": 0.5,
     }
 }
 
-def get_enemy_config(enemy_type, difficulty="normal", level=1):
-    """
-    获取指定类型、难度和等级的敌人配置
-    
-    Args:
-        enemy_type (str): 敌人类型
-        difficulty (str): 游戏难度 ('easy', 'normal', 'hard', 'nightmare')
-        level (int): 游戏当前等级
-        
-    Returns:
-        dict: 包含敌人属性的字典
-    """
+# 编译后的敌人属性表 {(敌人类型, 难度, 等级): 只读属性}，首次用到时计算
+_stat_table = {}
+
+def _compile_enemy_stats(enemy_type, difficulty, level):
+    """按难度和等级系数计算敌人属性"""
     # 获取基础配置
     if enemy_type not in ENEMY_CONFIGS:
         raise ValueError(f"未知的敌人类型: {enemy_type}")
@@ -115,4 +119,71 @@ def get_enemy_config(enemy_type, difficulty="normal", level=1):
     config["damage"] = round(config["damage"])
     config["speed"] = round(config["speed"])
     
-    return config 
\ No newline at end of file
+    return config 
+
+def get_enemy_stats(enemy_type, difficulty="normal", level=1):
+    """
+    从属性表获取指定类型、难度和等级的敌人属性
+    同一组参数只计算一次，所有敌人共享同一个只读对象
+    
+    Args:
+        enemy_type (str): 敌人类型
+        difficulty (str): 游戏难度 ('easy', 'normal', 'hard', 'nightmare')
+        level (int): 游戏当前等级
+        
+    Returns:
+        MappingProxyType: 只读的敌人属性
+    """
+    key = (enemy_type, difficulty, level)
+    stats = _stat_table.get(key)
+    if stats is None:
+        stats = MappingProxyType(_compile_enemy_stats(enemy_type, difficulty, level))
+        _stat_table[key] = stats
+    return stats
+
+def get_enemy_config(enemy_type, difficulty="normal", level=1):
+    """
+    获取指定类型、难度和等级的敌人配置
+    
+    Args:
+        enemy_type (str): 敌人类型
+        difficulty (str): 游戏难度 ('easy', 'normal', 'hard', 'nightmare')
+        level (int): 游戏当前等级
+        
+    Returns:
+        dict: 包含敌人属性的字典（可以修改的副本）
+    """
+    return dict(get_enemy_stats(enemy_type, difficulty, level))
+
+def reload_enemy_configs(configs=None, from_file=False):
+    """
+    重新加载敌人配置并清空属性表，用于在游戏运行中调整数值
+    已经生成的敌人保持原有属性，之后生成（包括从对象池取出）的敌人使用新的属性
+    
+    Args:
+        configs: 新的ENEMY_CONFIGS内容，None表示保持当前内容（例如已经直接修改了ENEMY_CONFIGS）
+        from_file: 是否从本文件重新读取ENEMY_CONFIGS、DIFFICULTY_MULTIPLIERS和LEVEL_SCALING
+        
+    Returns:
+        bool: 是否重新加载成功，从文件读取失败时保持原有配置不变
+    """
+    if from_file:
+        # 先完整读取文件并构建三张新表，任何错误都不会影响当前配置
+        try:
+            namespace = runpy.run_path(__file__)
+            new_tables = {name: dict(namespace[name])
+                          for name in ("ENEMY_CONFIGS", "DIFFICULTY_MULTIPLIERS", "LEVEL_SCALING")}
+        except Exception as e:
+            print(f"无法重新加载敌人配置 {__file__}: {e!r}")
+            return False
+        for name, table in (("ENEMY_CONFIGS", ENEMY_CONFIGS),
+                            ("DIFFICULTY_MULTIPLIERS", DIFFICULTY_MULTIPLIERS),
+                            ("LEVEL_SCALING", LEVEL_SCALING)):
+            # 原地替换，保持其他模块持有的引用有效
+            table.clear()
+            table.update(new_tables[name])
+    elif configs is not None:
+        ENEMY_CONFIGS.clear()
+        ENEMY_CONFIGS.update(configs)
+    _stat_table.clear()
+    return True
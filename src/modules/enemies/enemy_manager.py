@@ -1,21 +1,75 @@
 import pygame
-import random
-import math
-from .types import Ghost, Radish, Bat, Slime
+from .enemy import Enemy
+from . import types  # 导入内置敌人类型，完成注册
+from .registry import enemy_registry
+from ..pooling import pools
+from ..collision.spatial_grid import SpatialGrid
+from .attack_scheduler import AttackScheduler
+from .crowd_separation import CrowdSeparation
+from .lod import LodScheduler
+from .soa_core import EnemySoACore
+from .spawn_director import SpawnDirector, load_wave_schedule
+from .population import PopulationManager
+from .horde import HordeAggregator
 
 class EnemyManager:
-    def __init__(self):
+    # 批量渲染时屏幕四周额外查询的范围（与逐个渲染的裁剪范围一致）
+    RENDER_CULL_MARGIN = 50
+    
+    def __init__(self, wave_schedule='default'):
+        """
+        Args:
+            wave_schedule: assets/waves目录下的波次文件名
+        """
         self.enemies = []
-        self.spawn_timer = 0
-        self.spawn_interval = 1.0  # 每秒生成一个敌人
         self.difficulty = "normal"  # 默认难度为normal
         self.difficulty_level = 1   # 难度等级，随游戏时间增长
         self.game_time = 0  # 游戏进行时间
-        self.bat_spawn_timer = 0  # 蝙蝠生成计时器
+        
+        # 按波次文件安排敌人生成，每帧在时间预算内执行
+        self.spawn_director = SpawnDirector(load_wave_schedule(wave_schedule))
         
         # 地图边界相关
         self.map_boundaries = None  # (min_x, min_y, max_x, max_y)
         
+        # 空间哈希网格，每帧根据敌人位置重建，用于碰撞和范围查询
+        self.spatial_grid = SpatialGrid(cell_size=128)
+        
+        # 远程敌人的攻击调度器
+        self.attack_scheduler = AttackScheduler()
+        
+        # 群体分离，敌人移动后推开彼此重叠的敌人
+        self.crowd_separation = CrowdSeparation()
+        
+        # 敌人更新的细节层级，由Game根据屏幕大小设置视野后生效
+        self.lod = LodScheduler()
+        
+        # 敌人数量上限和拴绳回收，默认不限制，由Game设置
+        self.population = PopulationManager()
+        
+        # 远处敌人群的聚合，由Game根据屏幕大小设置视野后生效
+        self.horde = HordeAggregator()
+        
+        # 数组结构的敌人模拟核心，默认关闭，通过set_soa_enabled开启
+        self.soa_core = None
+        
+    def set_soa_enabled(self, enabled):
+        """开启或关闭数组结构的敌人模拟核心
+        
+        开启时所有敌人的状态移入numpy数组，移动和状态效果按数组批量计算；
+        关闭时状态写回各个敌人对象，恢复逐个更新
+        
+        Args:
+            enabled: 是否开启
+        """
+        if enabled and self.soa_core is None:
+            self.soa_core = EnemySoACore(max(256, len(self.enemies)))
+            for enemy in self.enemies:
+                self.soa_core.add(enemy)
+        elif not enabled and self.soa_core is not None:
+            self.soa_core.clear()
+            self.soa_core = None
+        
     def set_map_boundaries(self, min_x, min_y, max_x, max_y):
         """设置地图边界
         
@@ -31,26 +85,25 @@ class EnemyManager:
         """在指定位置生成指定类型和生命值的敌人
         
         Args:
-            enemy_type: 敌人类型 ('ghost', 'radish', 'bat', 'slime')
+            enemy_type: 注册表中的敌人类型 ('ghost', 'radish', 'bat', 'slime')，也可以是类名 ('Ghost')
             x: 世界坐标系中的x坐标
             y: 世界坐标系中的y坐标
             health: 指定生命值，如果为None则使用该类型的默认生命值
             
         Returns:
-            Enemy: 生成的敌人实例
+            Enemy: 生成的敌人实例，类型未注册或达到数量上限时返回None
         """
-        # 根据类型创建对应的敌人实例
+        # 群代理中的敌人同样计入数量上限
+        if not self.population.can_spawn(len(self.enemies) + self.horde.member_count):
+            return None
+            
+        # 根据类型从对象池取出对应的敌人实例（池为空时创建新实例）
         enemy = None
-        
-        # 使用新的构造函数，传递敌人类型、难度和等级
-        if enemy_type == 'ghost':
-            enemy = Ghost(x, y, enemy_type, self.difficulty, self.difficulty_level)
-        elif enemy_type == 'radish':
-            enemy = Radish(x, y, enemy_type, self.difficulty, self.difficulty_level)
-        elif enemy_type == 'bat':
-            enemy = Bat(x, y, enemy_type, self.difficulty, self.difficulty_level)
-        elif enemy_type == 'slime':
-            enemy = Slime(x, y, enemy_type, self.difficulty, self.difficulty_level)
+        enemy_type = enemy_registry.resolve(enemy_type)
+        enemy_class = enemy_registry.get_class(enemy_type)
+        if enemy_class:
+            pool = pools.get_pool(('enemy', enemy_type), enemy_class)
+            enemy = pool.acquire(x, y, enemy_type, self.difficulty, self.difficulty_level)
             
         # 如果指定了生命值，覆盖配置的生命值
         if enemy and health is not None:
@@ -58,48 +111,124 @@ class EnemyManager:
             enemy.max_health = health
             
         if enemy:
-            self.enemies.append(enemy)
+            self.attach_enemies([enemy])
             
         return enemy
         
-    def update(self, dt, player):
+    def attach_enemies(self, enemies):
+        """把敌人加入敌人列表并注册到各个子系统（空间网格、数组核心、攻击调度器）
+        
+        Args:
+            enemies: 敌人列表
+        """
+        for enemy in enemies:
+            self.enemies.append(enemy)
+            self.spatial_grid.insert(enemy)
+            if self.soa_core is not None:
+                self.soa_core.add(enemy)
+            if enemy.ranged:
+                self.attack_scheduler.register(enemy)
+                
+    def detach_enemies(self, enemies):
+        """把敌人从敌人列表和各个子系统中移出，但不放回对象池（例如合并到群代理中）
+        
+        Args:
+            enemies: 要移出的敌人（列表、集合或字典）
+        """
+        removed = enemies if isinstance(enemies, (set, dict)) else set(enemies)
+        if not removed:
+            return
+            
+        # 原地修改列表，保持其他模块持有的列表引用有效
+        self.enemies[:] = [enemy for enemy in self.enemies if enemy not in removed]
+        for enemy in removed:
+            self.spatial_grid.remove(enemy)
+            if getattr(enemy, '_soa_core', None) is not None:
+                enemy._soa_core.remove(enemy)
+        self.attack_scheduler.unregister_many(removed)
+        
+    def all_enemies(self):
+        """获取所有敌人，包括合并在群代理中的敌人（位置同步到代理当前位置）
+        
+        Returns:
+            list: 敌人列表
+        """
+        return self.enemies + self.horde.members()
+        
+    def update(self, dt, player, events=None):
+        """更新敌人生成和所有敌人的状态
+        
+        Args:
+            dt: 时间增量
+            player: 玩家对象
+            events: 战斗事件队列，提供时死亡的敌人会记录为击杀
+        """
         self.game_time += dt
-        self.spawn_timer += dt
         
         # 更新难度等级（根据游戏时间）
         self.difficulty_level = max(1, int(self.game_time // 60) + 1)  # 每60秒提升一级
         
-        # 根据时间和玩家等级生成敌人
-        if self.spawn_timer >= self.spawn_interval:
-            self.spawn_timer = 0
-            self.random_spawn_enemy(player)
-            
-        # 如果玩家等级达到5级，更新蝙蝠生成计时器
-        if player.level >= 1:
-            # 如果是刚达到5级,立即生成一只蝙蝠
-            if self.bat_spawn_timer == 0:
-                self.spawn_bat(player)
-                self.bat_spawn_timer = 0.1  # 设置一个很小的值,避免重复触发初始生成
-            
-            self.bat_spawn_timer += dt
-            if self.bat_spawn_timer >= 60:  # 每60秒生成一只蝙蝠
-                self.bat_spawn_timer = 0.1  # 重置为0.1而不是0
-                self.spawn_bat(player)
-            
-        # 更新所有敌人
-        for enemy in self.enemies[:]:  # 使用切片创建副本以避免在迭代时修改列表
-            enemy.update(dt, player)
-            
-            # 检查敌人是否已死亡（包括被燃烧伤害杀死的）
-            if not enemy.alive():
-                try:
-                    self.enemies.remove(enemy)
-                    # 注意：在这里我们不再播放死亡音效，因为在enemy.py中已经播放
-                except ValueError:
-                    # 如果敌人已经被移除，忽略错误
-                    pass
-            
-    def render(self, screen, camera_x, camera_y, screen_center_x, screen_center_y):
+        # 按波次文件生成敌人
+        self.spawn_director.update(dt, self, player)
+            
+        # 更新所有敌人，屏幕外和远处的敌人按LOD层级降低更新成本
+        dead = []
+        lod = self.lod
+        lod.begin_frame(player)
+        if self.soa_core is not None:
+            # 数组核心批量计算所有敌人的移动和状态效果，只逐个更新屏幕内敌人的动画等剩余部分
+            dead = self.soa_core.update(dt, player, lod)
+        else:
+            for index, enemy in enumerate(self.enemies[:]):  # 使用切片创建副本以避免在迭代时修改列表
+                step = lod.schedule(enemy, index, dt)
+                if step is not None:
+                    enemy.update(step, player)
+                
+                # 检查敌人是否已死亡（包括被燃烧伤害杀死的）
+                if not enemy.alive():
+                    dead.append(enemy)
+        lod.end_frame()
+                
+        # 一次性移除所有死亡的敌人
+        if dead:
+            self.remove_enemies(dead)
+            if events is not None:
+                for enemy in dead:
+                    events.record_kill(enemy)
+        
+        # 移动群代理，拆分靠近玩家的代理并合并远处的敌人群
+        self.horde.update(dt, self, player)
+        
+        # 把被玩家甩开的敌人和群代理移动到玩家附近（每帧只检查一部分敌人）
+        self.population.update(dt, self.enemies, player, self.map_boundaries)
+        self.population.leash_all(self.horde.proxies, player, self.map_boundaries)
+        
+        # 推开彼此重叠的敌人
+        self.crowd_separation.apply(self.enemies)
+        
+        # 敌人位置已更新，重建空间网格
+        self.spatial_grid.rebuild(self.enemies)
+            
+    def render(self, screen, camera_x, camera_y, screen_center_x, screen_center_y, batcher=None):
+        """渲染敌人
+        
+        Args:
+            batcher: RenderBatcher实例，提供时只收集绘制内容，由调用方统一提交
+        """
+        if batcher is not None:
+            # 通过空间网格只取出屏幕附近的敌人，四周保留一定余量，精确裁剪由批量渲染器完成
+            margin = self.RENDER_CULL_MARGIN
+            visible = self.spatial_grid.query_rect(
+                camera_x - screen_center_x - margin, camera_y - screen_center_y - margin,
+                screen.get_width() + margin * 2, screen.get_height() + margin * 2)
+            batcher.culled += len(self.enemies) - len(visible)
+            
+            offset_x = screen_center_x - camera_x
+            offset_y = screen_center_y - camera_y
+            for enemy in visible:
+                enemy.queue_render(batcher, enemy.rect.x + offset_x, enemy.rect.y + offset_y)
+            return
+            
         for enemy in self.enemies:
             # 计算敌人在屏幕上的位置
             screen_x = screen_center_x + (enemy.rect.x - camera_x)
@@ -109,43 +238,58 @@ class EnemyManager:
             if -50 <= screen_x <= screen.get_width() + 50 and -50 <= screen_y <= screen.get_height() + 50:
                 enemy.render(screen, screen_x, screen_y)
             
-    def remove_enemy(self, enemy):
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
+    def enemies_in_radius(self, x, y, radius):
+        """获取中心点在圆形范围内的敌人（通过空间网格查询）
+        
+        Args:
+            x: 范围中心X坐标（世界坐标）
+            y: 范围中心Y坐标（世界坐标）
+            radius: 范围半径
             
-    def random_spawn_enemy(self, player):
-        """在玩家周围随机位置生成敌人，确保在地图边界内"""
-        # 在玩家周围的随机位置生成敌人
-        spawn_distance = 600  # 生成距离
+        Returns:
+            list: 范围内的敌人，按敌人列表中的顺序排列
+        """
+        return self.spatial_grid.query_radius(x, y, radius)
+        
+    def enemies_touching(self, rect):
+        """获取rect与给定矩形相交的敌人（通过空间网格查询）
         
-        # 尝试生成位置，最多尝试10次以找到在边界内的位置
-        for _ in range(10):
-            # 随机角度
-            angle = random.uniform(0, 2 * math.pi)
+        Args:
+            rect: 世界坐标系中的矩形
             
-            # 计算生成位置（世界坐标系）
-            x = player.world_x + spawn_distance * math.cos(angle)
-            y = player.world_y + spawn_distance * math.sin(angle)
+        Returns:
+            list: 相交的敌人，按敌人列表中的顺序排列
+        """
+        return self.spatial_grid.query_rect(rect.x, rect.y, rect.width, rect.height)
             
-            # 如果有地图边界限制，确保敌人在边界内生成
-            if self.map_boundaries:
-                min_x, min_y, max_x, max_y = self.map_boundaries
-                
-                # 检查生成位置是否在边界内
-                if min_x <= x <= max_x and min_y <= y <= max_y:
-                    break  # 位置有效，跳出循环
-                
-                # 如果位置无效，将坐标限制在边界内
-                x = max(min_x, min(x, max_x))
-                y = max(min_y, min(y, max_y))
-                break  # 使用修正后的位置
-        
-        # 根据游戏时间决定生成什么类型的敌人
-        if self.game_time < 10:  # 游戏开始10秒内
-            self.spawn_enemy('slime', x, y)
-        else:  # 10秒后可以生成幽灵和萝卜
-            enemy_type = random.choice(['ghost', 'radish', 'slime'])
-            self.spawn_enemy(enemy_type, x, y)
+    def remove_enemy(self, enemy):
+        if enemy in self.enemies:
+            self.enemies.remove(enemy)
+        self.spatial_grid.remove(enemy)
+        self.attack_scheduler.unregister(enemy)
+        self._release_enemy(enemy)
+        
+    def remove_enemies(self, enemies):
+        """批量移除敌人，只对敌人列表做一次压缩
+        
+        Args:
+            enemies: 要移除的敌人（列表、集合或字典）
+        """
+        removed = enemies if isinstance(enemies, (set, dict)) else set(enemies)
+        self.detach_enemies(removed)
+        for enemy in removed:
+            self._release_enemy(enemy)
+        
+    def _release_enemy(self, enemy):
+        """把移除的敌人放回对应类型的对象池
+        
+        敌人的状态保持不变，直到下次被取出时才重新初始化，
+        因此同一帧内仍然可以读取其位置等信息（例如生成掉落物品）
+        """
+        if getattr(enemy, '_soa_core', None) is not None:
+            enemy._soa_core.remove(enemy)
+        if isinstance(enemy, Enemy):
+            pools.release(('enemy', enemy.type), enemy)
             
     def set_difficulty(self, difficulty):
         """设置游戏难度
@@ -154,28 +298,3 @@ class EnemyManager:
             difficulty (str): 难度级别 ('easy', 'normal', 'hard', 'nightmare')
         """
         self.difficulty = difficulty
-            
-    def spawn_bat(self, player):
-        """在玩家周围生成一个蝙蝠，确保在地图边界内"""
-        spawn_distance = 600
-        
-        # 尝试生成位置，最多尝试10次以找到在边界内的位置
-        for _ in range(10):
-            angle = random.uniform(0, 2 * math.pi)
-            x = player.world_x + spawn_distance * math.cos(angle)
-            y = player.world_y + spawn_distance * math.sin(angle)
-            
-            # 如果有地图边界限制，确保蝙蝠在边界内生成
-            if self.map_boundaries:
-                min_x, min_y, max_x, max_y = self.map_boundaries
-                
-                # 检查生成位置是否在边界内
-                if min_x <= x <= max_x and min_y <= y <= max_y:
-                    break  # 位置有效，跳出循环
-                
-                # 如果位置无效，将坐标限制在边界内
-                x = max(min_x, min(x, max_x))
-                y = max(min_y, min(y, max_y))
-                break  # 使用修正后的位置
-        
-        self.spawn_enemy('bat', x, y) 
\ No newline at end of file
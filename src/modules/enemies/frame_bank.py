@@ -0,0 +1,203 @@
+"""
+敌人帧缓存
+同一类型敌人的动画帧、缩放和朝向都是固定的，第一次生成该类型敌人时预先生成
+所有缩放后的帧及其两种朝向，之后每帧只需取用已有的Surface。
+叠加了减速、燃烧效果的帧在第一次使用时生成并缓存。
+"""
+
+import time
+import pygame
+
+
+class FrameBank:
+    """单个敌人类型的预处理帧
+
+    帧的朝向与敌人原有的绘制方式一致：面向右侧时使用水平翻转后的帧，面向左侧时使用原始帧。
+    缓存中的Surface会被多个敌人共享，使用方不能修改它们。
+    """
+
+    def __init__(self, animations, scale):
+        """
+        Args:
+            animations: 动画字典 {动画状态: Animation}
+            scale: 缩放比例
+        """
+        self.scale = scale
+        self.frames = {}  # {动画状态: (面向左侧的帧列表, 面向右侧的帧列表)}
+        self.tinted_frames = {}  # {(动画状态, 帧序号, 是否面向右侧, 减速, 燃烧): Surface}
+        self.memory_bytes = 0
+        self.frame_count = 0
+        self.tinted_bytes = 0
+
+        start = time.perf_counter()
+        for state, animation in animations.items():
+            left_frames = []
+            right_frames = []
+            for frame in animation.frames:
+                original_size = frame.get_size()
+                new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
+                scaled = pygame.transform.scale(frame, new_size)
+                flipped = pygame.transform.flip(scaled, True, False)
+                left_frames.append(scaled)
+                right_frames.append(flipped)
+                self.memory_bytes += _surface_bytes(scaled) + _surface_bytes(flipped)
+                self.frame_count += 2
+            self.frames[state] = (left_frames, right_frames)
+        self.build_time = time.perf_counter() - start
+
+    def get_frame(self, state, index, facing_right):
+        """
+        获取预处理后的帧
+
+        Args:
+            state: 动画状态
+            index: 帧序号
+            facing_right: 是否面向右侧
+
+        Returns:
+            pygame.Surface: 共享的帧Surface（不要修改）
+        """
+        return self.frames[state][1 if facing_right else 0][index]
+
+    def get_tinted_frame(self, state, index, facing_right, slowed, burning, mask):
+        """
+        获取叠加了状态效果的帧，每种组合只生成一次
+
+        Args:
+            state: 动画状态
+            index: 帧序号
+            facing_right: 是否面向右侧
+            slowed: 是否叠加减速效果
+            burning: 是否叠加燃烧效果
+            mask: 原始帧的遮罩，仅在首次生成时使用
+
+        Returns:
+            pygame.Surface: 共享的帧Surface（不要修改）
+        """
+        key = (state, index, facing_right, slowed, burning)
+        frame = self.tinted_frames.get(key)
+        if frame is None:
+            frame = apply_status_tint(self.get_frame(state, index, facing_right), mask, slowed, burning)
+            self.tinted_frames[key] = frame
+            self.tinted_bytes += _surface_bytes(frame)
+        return frame
+
+
+def apply_status_tint(frame, mask, slowed, burning):
+    """
+    在帧上叠加减速（蓝色）和燃烧（红色）的光晕效果
+
+    Args:
+        frame: 原始帧
+        mask: 原始帧的遮罩
+        slowed: 是否叠加减速效果
+        burning: 是否叠加燃烧效果
+
+    Returns:
+        pygame.Surface: 叠加效果后的新Surface
+    """
+    modified_frame = frame.copy()
+    mask_outline = mask.outline()
+
+    # 如果有减速效果
+    if slowed:
+        # 创建与原图大小相同的透明表面
+        slow_effect = pygame.Surface(modified_frame.get_size(), pygame.SRCALPHA)
+
+        # 为边缘添加蓝色光晕
+        if mask_outline:
+            for point in mask_outline:
+                # 绘制蓝色光晕点
+                pygame.draw.circle(slow_effect, (0, 0, 200, 100), point, 3)
+
+        # 为实际区域添加淡蓝色
+        mask_surface = mask.to_surface(setcolor=(0, 0, 100, 70), unsetcolor=(0, 0, 0, 0))
+        slow_effect.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+        # 叠加到原图
+        modified_frame.blit(slow_effect, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+    # 如果有燃烧闪烁效果
+    if burning:
+        # 创建与原图大小相同的透明表面
+        fire_effect = pygame.Surface(modified_frame.get_size(), pygame.SRCALPHA)
+
+        # 为边缘添加红色光晕
+        if mask_outline:
+            for point in mask_outline:
+                # 绘制红色/橙色光晕点
+                pygame.draw.circle(fire_effect, (255, 100, 0, 150), point, 3)
+
+        # 为实际区域添加淡红色
+        mask_surface = mask.to_surface(setcolor=(50, 0, 0, 50), unsetcolor=(0, 0, 0, 0))
+        fire_effect.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+        # 叠加到原图
+        modified_frame.blit(fire_effect, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+    return modified_frame
+
+
+def _surface_bytes(surface):
+    """估算Surface像素数据占用的内存"""
+    return surface.get_pitch() * surface.get_height()
+
+
+class FrameBankRegistry:
+    """按 (敌人类型, 缩放) 管理帧缓存，每种组合只构建一次
+
+    每个缓存的帧数、内存占用和构建耗时记录在FrameBank上，通过get_stats汇总查看。
+    """
+
+    def __init__(self):
+        self.banks = {}  # {(enemy_type, scale): FrameBank}
+
+    def get_bank(self, enemy_type, scale, animations):
+        """
+        获取敌人类型的帧缓存，不存在时立即构建
+
+        Args:
+            enemy_type: 敌人类型
+            scale: 缩放比例
+            animations: 该类型敌人的动画字典，仅在首次构建时使用
+
+        Returns:
+            FrameBank: 帧缓存
+        """
+        key = (enemy_type, scale)
+        bank = self.banks.get(key)
+        if bank is None:
+            bank = FrameBank(animations, scale)
+            self.banks[key] = bank
+        return bank
+
+    def get_stats(self):
+        """
+        获取所有帧缓存的内存占用和构建耗时
+
+        Returns:
+            dict: 包含banks（每个缓存的统计）、total_bytes和total_build_time的字典
+        """
+        banks = {
+            key: {
+                'frames': bank.frame_count,
+                'bytes': bank.memory_bytes,
+                'tinted_frames': len(bank.tinted_frames),
+                'tinted_bytes': bank.tinted_bytes,
+                'build_time': bank.build_time
+            }
+            for key, bank in self.banks.items()
+        }
+        return {
+            'banks': banks,
+            'total_bytes': sum(bank.memory_bytes + bank.tinted_bytes for bank in self.banks.values()),
+            'total_build_time': sum(bank.build_time for bank in self.banks.values())
+        }
+
+    def clear(self):
+        """清空所有帧缓存"""
+        self.banks.clear()
+
+
+# 全局帧缓存
+frame_banks = FrameBankRegistry()
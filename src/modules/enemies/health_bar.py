@@ -0,0 +1,87 @@
+"""
+敌人血条缓存
+血条按血量比例量化成固定的档位，每种 (缩放, 档位) 只预先绘制一次，
+之后和敌人精灵一起通过批量渲染提交，不再每帧调用pygame.draw.rect。
+"""
+
+import math
+import pygame
+
+# 血条的量化档位数
+HEALTH_BAR_LEVELS = 32
+
+# 血条尺寸（缩放前）和相对敌人顶部的偏移
+HEALTH_BAR_WIDTH = 32
+HEALTH_BAR_HEIGHT = 5
+HEALTH_BAR_OFFSET_Y = 10
+
+HEALTH_BAR_BACKGROUND = (255, 0, 0)  # 红色背景
+HEALTH_BAR_FOREGROUND = (0, 255, 0)  # 绿色血条
+
+
+def health_bar_level(health, max_health, levels=HEALTH_BAR_LEVELS):
+    """
+    把血量量化为血条档位
+
+    向上取整，只要还有血量就至少显示一格
+
+    Args:
+        health: 当前生命值
+        max_health: 最大生命值
+        levels: 档位数
+
+    Returns:
+        int: 0~levels之间的档位
+    """
+    if max_health <= 0:
+        return 0
+    return max(0, min(levels, math.ceil(health / max_health * levels)))
+
+
+class HealthBarCache:
+    """按 (缩放, 档位) 缓存预先绘制好的血条"""
+
+    def __init__(self, levels=HEALTH_BAR_LEVELS):
+        """
+        Args:
+            levels: 血条的量化档位数
+        """
+        self.levels = levels
+        self.bars = {}  # {(scale, level): Surface}
+
+    def get_bar(self, scale, health, max_health):
+        """
+        获取与血量对应的血条
+
+        Args:
+            scale: 敌人缩放比例
+            health: 当前生命值
+            max_health: 最大生命值
+
+        Returns:
+            pygame.Surface: 共享的血条Surface（不要修改）
+        """
+        level = health_bar_level(health, max_health, self.levels)
+        key = (scale, level)
+        bar = self.bars.get(key)
+        if bar is None:
+            bar = self._build_bar(scale, level)
+            self.bars[key] = bar
+        return bar
+
+    def _build_bar(self, scale, level):
+        """绘制一条血条，尺寸与原先逐帧绘制的矩形一致"""
+        width = HEALTH_BAR_WIDTH * scale
+        height = HEALTH_BAR_HEIGHT * scale
+        bar = pygame.Surface((int(width), int(height)))
+        bar.fill(HEALTH_BAR_BACKGROUND)
+        bar.fill(HEALTH_BAR_FOREGROUND, (0, 0, int(width * level / self.levels), int(height)))
+        return bar
+
+    def clear(self):
+        """清空所有血条缓存"""
+        self.bars.clear()
+
+
+# 全局血条缓存
+health_bars = HealthBarCache()
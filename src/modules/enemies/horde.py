@@ -0,0 +1,279 @@
+"""
+敌人群聚合
+远离屏幕、聚集在一起的同类型敌人合并成一个群代理（HordeProxy），代理只记录成员数量和总生命值，
+整体按最慢成员的速度向玩家移动；代理进入渲染范围附近时再拆分回原来的敌人对象。
+
+成员在合并期间离开敌人列表，不参与碰撞、LOD和数组核心的模拟，因此每帧模拟的敌人数量
+只与屏幕附近的区域有关，而不随游戏时长增长。
+"""
+
+import math
+import pygame
+
+# 视野半对角线之外额外保留的距离，在该范围内的代理拆分回敌人
+DEFAULT_SPLIT_MARGIN = 200
+# 合并距离比拆分距离多出的部分，避免敌人在边界附近反复合并和拆分
+DEFAULT_MERGE_HYSTERESIS = 300
+
+
+class HordeProxy:
+    """代表一群同类型敌人的代理"""
+
+    def __init__(self, enemy_type, members):
+        """
+        Args:
+            enemy_type: 敌人类型
+            members: 合并的敌人列表
+        """
+        self.type = enemy_type
+        left = min(enemy.rect.left for enemy in members)
+        top = min(enemy.rect.top for enemy in members)
+        right = max(enemy.rect.right for enemy in members)
+        bottom = max(enemy.rect.bottom for enemy in members)
+        self.rect = pygame.Rect(left, top, right - left, bottom - top)
+        center_x = sum(enemy.rect.centerx for enemy in members) / len(members)
+        center_y = sum(enemy.rect.centery for enemy in members) / len(members)
+        self.rect.center = (center_x, center_y)
+
+        # [(敌人, 相对代理中心的X偏移, Y偏移)]
+        self.members = []
+        self.speed = math.inf
+        self.absorb(members)
+
+    @property
+    def count(self):
+        """成员数量"""
+        return len(self.members)
+
+    @property
+    def health(self):
+        """成员的总生命值"""
+        return sum(enemy.health for enemy, _, _ in self.members)
+
+    def absorb(self, enemies):
+        """
+        把敌人加入代理，保持其相对代理中心的位置
+
+        Args:
+            enemies: 敌人列表
+        """
+        center_x, center_y = self.rect.center
+        for enemy in enemies:
+            enemy_x, enemy_y = enemy.rect.center
+            self.members.append((enemy, enemy_x - center_x, enemy_y - center_y))
+            # 整群按最慢成员的速度移动，保证成员不会被甩开
+            self.speed = min(self.speed, enemy.speed)
+
+    def update(self, dt, player):
+        """
+        整群向玩家移动（与Enemy.update相同的移动方式）
+
+        Args:
+            dt: 时间增量
+            player: 玩家对象（需要有world_x、world_y属性）
+        """
+        dx = player.world_x - self.rect.centerx
+        dy = player.world_y - self.rect.centery
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance != 0:
+            self.rect.x += dx / distance * self.speed * dt
+            self.rect.y += dy / distance * self.speed * dt
+
+    def sync_members(self):
+        """
+        按代理当前位置更新所有成员的位置
+
+        Returns:
+            list: 成员敌人列表
+        """
+        center_x, center_y = self.rect.center
+        enemies = []
+        for enemy, offset_x, offset_y in self.members:
+            enemy.rect.center = (center_x + offset_x, center_y + offset_y)
+            enemies.append(enemy)
+        return enemies
+
+
+class HordeAggregator:
+    """把远处的同类型敌人群合并成代理，并在靠近玩家时拆分
+
+    未设置视野大小时不合并任何敌人。
+    """
+
+    def __init__(self, view_size=None, cell_size=128, min_group=8, interval=0.5,
+                 split_margin=DEFAULT_SPLIT_MARGIN, merge_hysteresis=DEFAULT_MERGE_HYSTERESIS):
+        """
+        Args:
+            view_size: 视野大小 (宽, 高)，通常为屏幕大小，None表示不合并
+            cell_size: 聚类网格的单元格大小，同一单元格内的同类型敌人合并到一起
+            min_group: 新建代理所需的最少敌人数量
+            interval: 每隔多少秒检查一次可以合并的敌人
+            split_margin: 视野半对角线之外额外保留的距离，代理在该范围内拆分
+            merge_hysteresis: 合并距离比拆分距离多出的部分
+        """
+        self.cell_size = cell_size
+        self.min_group = max(1, int(min_group))
+        self.interval = interval
+        self.split_margin = split_margin
+        self.merge_hysteresis = merge_hysteresis
+        self.enabled = True
+
+        self.proxies = []
+        self.split_distance = None
+        self.merge_distance = None
+        self.set_view_size(view_size)
+
+        self._timer = 0.0
+
+        # 累计统计
+        self.merged_total = 0
+        self.split_total = 0
+
+    def set_view_size(self, view_size):
+        """
+        设置视野大小，并据此计算拆分和合并距离
+
+        Args:
+            view_size: 视野大小 (宽, 高)，None表示不合并
+        """
+        self.view_size = view_size
+        if view_size is None:
+            self.split_distance = None
+            self.merge_distance = None
+        else:
+            self.split_distance = math.hypot(view_size[0], view_size[1]) / 2 + self.split_margin
+            self.merge_distance = self.split_distance + self.merge_hysteresis
+
+    @property
+    def member_count(self):
+        """所有代理的成员总数"""
+        return sum(proxy.count for proxy in self.proxies)
+
+    def members(self):
+        """
+        获取所有代理的成员（位置同步到代理当前位置），用于存档等需要完整敌人列表的场合
+
+        Returns:
+            list: 敌人列表
+        """
+        enemies = []
+        for proxy in self.proxies:
+            enemies.extend(proxy.sync_members())
+        return enemies
+
+    def update(self, dt, manager, player):
+        """
+        移动所有代理，拆分靠近玩家的代理，并定期合并远处的敌人
+
+        Args:
+            dt: 时间增量
+            manager: EnemyManager实例（提供enemies、attach_enemies和detach_enemies）
+            player: 玩家对象
+        """
+        if not self.proxies and (not self.enabled or self.merge_distance is None):
+            return
+
+        player_x = player.world_x
+        player_y = player.world_y
+
+        # 移动代理，进入拆分范围（或关闭聚合）时还原成员
+        split_distance = self.split_distance if self.split_distance is not None else math.inf
+        split_squared = split_distance * split_distance
+        remaining = []
+        released = []
+        for proxy in self.proxies:
+            proxy.update(dt, player)
+            dx = proxy.rect.centerx - player_x
+            dy = proxy.rect.centery - player_y
+            if not self.enabled or dx * dx + dy * dy <= split_squared:
+                released.extend(proxy.sync_members())
+                self.split_total += 1
+            else:
+                remaining.append(proxy)
+        self.proxies = remaining
+        if released:
+            manager.attach_enemies(released)
+
+        if not self.enabled or self.merge_distance is None:
+            return
+        self._timer += dt
+        if self._timer < self.interval:
+            return
+        self._timer = 0.0
+        self.aggregate(manager, player)
+
+    def aggregate(self, manager, player):
+        """
+        把合并距离之外、处于同一网格单元的同类型敌人合并成代理
+
+        Args:
+            manager: EnemyManager实例
+            player: 玩家对象
+
+        Returns:
+            int: 本次合并的敌人数量
+        """
+        player_x = player.world_x
+        player_y = player.world_y
+        merge_squared = self.merge_distance * self.merge_distance
+        cell_size = self.cell_size
+
+        # 按 (类型, 单元格) 分组候选敌人
+        groups = {}
+        for enemy in manager.enemies:
+            if not self._can_merge(enemy):
+                continue
+            center_x, center_y = enemy.rect.center
+            dx = center_x - player_x
+            dy = center_y - player_y
+            if dx * dx + dy * dy <= merge_squared:
+                continue
+            key = (enemy.type, int(center_x // cell_size), int(center_y // cell_size))
+            groups.setdefault(key, []).append(enemy)
+        if not groups:
+            return 0
+
+        # 已有代理所在的单元格直接吸收同类型的敌人
+        existing = {}
+        for proxy in self.proxies:
+            center_x, center_y = proxy.rect.center
+            existing.setdefault((proxy.type, int(center_x // cell_size), int(center_y // cell_size)), proxy)
+
+        merged = []
+        for key, enemies in groups.items():
+            proxy = existing.get(key)
+            if proxy is not None:
+                proxy.absorb(enemies)
+            elif len(enemies) >= self.min_group:
+                self.proxies.append(HordeProxy(key[0], enemies))
+            else:
+                continue
+            merged.extend(enemies)
+
+        if merged:
+            manager.detach_enemies(merged)
+            self.merged_total += len(merged)
+        return len(merged)
+
+    def _can_merge(self, enemy):
+        """只合并没有远程攻击、没有状态效果且不处于受伤状态的敌人"""
+        if getattr(enemy, 'ranged', False):
+            return False
+        if enemy.invincible or enemy.hurt_timer > 0:
+            return False
+        return not enemy.status_effects
+
+    def get_stats(self):
+        """
+        获取聚合统计
+
+        Returns:
+            dict: 包含proxies（当前代理数量）、members（代理中的敌人数量）、
+                  merged（累计合并的敌人数量）和split（累计拆分的代理数量）的字典
+        """
+        return {
+            'proxies': len(self.proxies),
+            'members': self.member_count,
+            'merged': self.merged_total,
+            'split': self.split_total
+        }
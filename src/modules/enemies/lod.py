@@ -0,0 +1,165 @@
+"""
+敌人更新的细节层级（LOD）
+根据敌人相对屏幕的位置把敌人分成几个层级：
+- 屏幕内：完整更新（移动、状态效果、动画和图像）
+- 屏幕外：只更新移动和状态计时，跳过动画推进和图像、遮罩的处理，回到屏幕内时再刷新图像
+- 远处：在屏幕外的基础上降低更新频率，跳过的时间累积起来在下一次更新时一并计算
+"""
+
+import math
+import numpy as np
+
+TIER_VISIBLE = 'visible'
+TIER_OFFSCREEN = 'offscreen'
+TIER_FAR = 'far'
+
+
+class LodScheduler:
+    """按层级决定每个敌人本帧如何更新
+
+    未设置视野大小时所有敌人都按屏幕内处理，与不使用LOD完全相同。
+    """
+
+    def __init__(self, view_size=None, margin=100, far_distance=1500, far_interval=4):
+        """
+        Args:
+            view_size: 视野大小 (宽, 高)，通常为屏幕大小，None表示不启用LOD
+            margin: 视野四周额外按屏幕内处理的像素
+            far_distance: 与玩家的距离超过该值的屏幕外敌人属于远处层级
+            far_interval: 远处层级每隔多少帧更新一次
+        """
+        self.view_size = view_size
+        self.margin = margin
+        self.far_distance = far_distance
+        self.far_interval = max(1, int(far_interval))
+        self.enabled = True
+
+        self.frame = 0
+        self._view = None  # 本帧的视野范围 (left, top, right, bottom)
+        self._center = (0, 0)
+
+        # 本帧各层级的敌人数量和跳过的更新次数
+        self.counts = {TIER_VISIBLE: 0, TIER_OFFSCREEN: 0, TIER_FAR: 0}
+        self.skipped = 0
+
+        # 上一帧的统计数据
+        self.last_stats = {'counts': dict(self.counts), 'skipped': 0}
+
+    def set_view_size(self, view_size):
+        """
+        设置视野大小
+
+        Args:
+            view_size: 视野大小 (宽, 高)，None表示不启用LOD
+        """
+        self.view_size = view_size
+
+    def begin_frame(self, player):
+        """
+        以玩家为中心计算本帧的视野范围（相机始终跟随玩家）
+
+        Args:
+            player: 玩家对象（需要有world_x、world_y属性）
+        """
+        self.frame += 1
+        for tier in self.counts:
+            self.counts[tier] = 0
+        self.skipped = 0
+
+        if not self.enabled or self.view_size is None:
+            self._view = None
+            return
+
+        half_width = self.view_size[0] / 2 + self.margin
+        half_height = self.view_size[1] / 2 + self.margin
+        x = player.world_x
+        y = player.world_y
+        self._view = (x - half_width, y - half_height, x + half_width, y + half_height)
+        self._center = (x, y)
+
+    def classify(self, enemy):
+        """
+        获取敌人本帧所属的层级
+
+        Args:
+            enemy: 敌人对象
+
+        Returns:
+            str: 层级名称
+        """
+        view = self._view
+        if view is None:
+            return TIER_VISIBLE
+
+        rect = enemy.rect
+        if rect.right > view[0] and rect.left < view[2] and rect.bottom > view[1] and rect.top < view[3]:
+            return TIER_VISIBLE
+
+        # 带有状态效果的敌人需要按帧结算伤害和持续时间，不降低更新频率
+        if getattr(enemy, 'status_effects', None):
+            return TIER_OFFSCREEN
+
+        dx = rect.centerx - self._center[0]
+        dy = rect.centery - self._center[1]
+        if math.hypot(dx, dy) > self.far_distance:
+            return TIER_FAR
+        return TIER_OFFSCREEN
+
+    def visible_mask(self, left, top, right, bottom):
+        """
+        批量判断敌人是否在视野内，并计入本帧的层级统计（供数组结构的敌人核心使用）
+
+        Args:
+            left, top, right, bottom: 敌人矩形边界的numpy数组
+
+        Returns:
+            numpy.ndarray: 布尔数组，True表示在视野内
+        """
+        view = self._view
+        if view is None:
+            visible = np.ones(len(left), dtype=np.bool_)
+        else:
+            visible = (right > view[0]) & (left < view[2]) & (bottom > view[1]) & (top < view[3])
+
+        count = int(np.count_nonzero(visible))
+        self.counts[TIER_VISIBLE] += count
+        self.counts[TIER_OFFSCREEN] += len(visible) - count
+        return visible
+
+    def schedule(self, enemy, index, dt):
+        """
+        决定敌人本帧的更新方式，并设置敌人的lod_visuals标记
+
+        Args:
+            enemy: 敌人对象
+            index: 敌人在列表中的位置，用于把远处敌人的更新分散到不同的帧
+            dt: 本帧的时间增量
+
+        Returns:
+            float | None: 本次更新使用的时间增量（包含之前累积的时间），None表示本帧跳过更新
+        """
+        tier = self.classify(enemy)
+        self.counts[tier] += 1
+        enemy.lod_visuals = tier == TIER_VISIBLE
+
+        pending = getattr(enemy, 'lod_pending_dt', 0.0) + dt
+        if tier == TIER_FAR and (self.frame + index) % self.far_interval:
+            enemy.lod_pending_dt = pending
+            self.skipped += 1
+            return None
+
+        enemy.lod_pending_dt = 0.0
+        return pending
+
+    def end_frame(self):
+        """记录本帧的统计数据"""
+        self.last_stats = {'counts': dict(self.counts), 'skipped': self.skipped}
+
+    def get_stats(self):
+        """
+        获取上一帧的统计数据
+
+        Returns:
+            dict: 包含counts（各层级的敌人数量）和skipped（跳过的更新次数）的字典
+        """
+        return {'counts': dict(self.last_stats['counts']), 'skipped': self.last_stats['skipped']}
@@ -0,0 +1,159 @@
+"""
+敌人数量管理
+- 同时存在的敌人数量上限：达到上限后新的生成请求直接丢弃
+- 拴绳回收：离玩家太远的敌人不会被移除，而是移动到玩家前进方向的生成圈上重新加入战斗
+
+拴绳检查按轮转方式每帧只检查一部分敌人，每帧的开销与敌人总数成固定比例，不会集中在某一帧。
+"""
+
+import math
+import random
+from .spawn_director import DEFAULT_SPAWN_DISTANCE, clamp_to_boundaries
+
+# Game使用的默认上限和拴绳距离
+DEFAULT_MAX_ACTIVE = 600
+DEFAULT_LEASH_DISTANCE = 1500
+
+
+class PopulationManager:
+    """限制敌人数量，并把被玩家甩开的敌人回收到玩家附近
+
+    上限和拴绳距离默认都不启用，由Game通过set_limits设置。
+    """
+
+    def __init__(self, max_active=None, leash_distance=None, respawn_distance=DEFAULT_SPAWN_DISTANCE,
+                 check_interval=0.5, respawn_spread=30):
+        """
+        Args:
+            max_active: 同时存在的敌人数量上限，None表示不限制
+            leash_distance: 敌人中心与玩家的距离超过该值时回收，None表示不回收
+            respawn_distance: 回收的敌人重新出现时与玩家的距离
+            check_interval: 每个敌人大约每隔多少秒检查一次拴绳距离，0表示每帧检查所有敌人
+            respawn_spread: 重新出现的方向相对玩家前进方向的随机偏移范围（角度）
+        """
+        self.max_active = max_active
+        self.leash_distance = leash_distance
+        self.respawn_distance = respawn_distance
+        self.check_interval = check_interval
+        self.respawn_spread = respawn_spread
+
+        self._cursor = 0  # 轮转检查的起始位置
+
+        # 累计统计
+        self.recycled = 0
+        self.culled = 0
+        self.peak_active = 0
+
+    def set_limits(self, max_active=DEFAULT_MAX_ACTIVE, leash_distance=DEFAULT_LEASH_DISTANCE):
+        """
+        设置数量上限和拴绳距离
+
+        Args:
+            max_active: 同时存在的敌人数量上限，None表示不限制
+            leash_distance: 回收距离，None表示不回收
+        """
+        self.max_active = max_active
+        self.leash_distance = leash_distance
+
+    def can_spawn(self, active_count):
+        """
+        检查是否还能生成新的敌人，不能生成时计入丢弃数量
+
+        Args:
+            active_count: 当前的敌人数量
+
+        Returns:
+            bool: 是否可以生成
+        """
+        if self.max_active is not None and active_count >= self.max_active:
+            self.culled += 1
+            return False
+        return True
+
+    def update(self, dt, enemies, player, boundaries=None):
+        """
+        检查本帧轮到的敌人，把超出拴绳距离的敌人移动到玩家附近
+
+        Args:
+            dt: 时间增量
+            enemies: 敌人列表
+            player: 玩家对象（需要有world_x、world_y属性）
+            boundaries: 地图边界 (min_x, min_y, max_x, max_y)
+
+        Returns:
+            int: 本帧回收的敌人数量
+        """
+        count = len(enemies)
+        self.peak_active = max(self.peak_active, count)
+        if self.leash_distance is None or count == 0:
+            return 0
+
+        # 每帧检查的数量使每个敌人大约每check_interval秒被检查一次
+        if self.check_interval > 0:
+            batch = min(count, max(1, math.ceil(count * dt / self.check_interval)))
+        else:
+            batch = count
+        start = self._cursor % count
+        self._cursor = start + batch
+
+        return self._recycle((enemies[(start + offset) % count] for offset in range(batch)),
+                             player, boundaries)
+
+    def leash_all(self, entities, player, boundaries=None):
+        """
+        检查所有给定对象的拴绳距离（用于数量很少的对象，例如敌人群代理）
+
+        Args:
+            entities: 带有rect的对象列表
+            player: 玩家对象（需要有world_x、world_y属性）
+            boundaries: 地图边界 (min_x, min_y, max_x, max_y)
+
+        Returns:
+            int: 回收的数量
+        """
+        if self.leash_distance is None or not entities:
+            return 0
+        return self._recycle(entities, player, boundaries)
+
+    def _recycle(self, entities, player, boundaries):
+        """把超出拴绳距离的对象移动到生成圈上，返回回收的数量"""
+        player_x = player.world_x
+        player_y = player.world_y
+        leash_squared = self.leash_distance * self.leash_distance
+        recycled = 0
+        for entity in entities:
+            center_x, center_y = entity.rect.center
+            dx = center_x - player_x
+            dy = center_y - player_y
+            if dx * dx + dy * dy > leash_squared:
+                self._respawn(entity, player_x, player_y, -dx, -dy, boundaries)
+                recycled += 1
+
+        self.recycled += recycled
+        return recycled
+
+    def _respawn(self, entity, player_x, player_y, direction_x, direction_y, boundaries):
+        """把对象移动到生成圈上，方向为敌人相对玩家的反方向（即玩家远离敌人的前进方向）"""
+        angle = math.atan2(direction_y, direction_x) + math.radians(
+            random.uniform(-self.respawn_spread, self.respawn_spread))
+        x = player_x + self.respawn_distance * math.cos(angle)
+        y = player_y + self.respawn_distance * math.sin(angle)
+        entity.rect.center = clamp_to_boundaries(x, y, boundaries)
+
+    def get_stats(self, active_count):
+        """
+        获取数量统计
+
+        Args:
+            active_count: 当前的敌人数量
+
+        Returns:
+            dict: 包含active（当前数量）、peak（最高数量）、recycled（累计回收数量）
+                  和culled（累计因达到上限丢弃的生成数量）的字典
+        """
+        return {
+            'active': active_count,
+            'peak': self.peak_active,
+            'recycled': self.recycled,
+            'culled': self.culled
+        }
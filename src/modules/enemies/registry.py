@@ -0,0 +1,224 @@
+"""
+敌人类型注册表
+把敌人类型名（如'ghost'）映射到敌人类和资源清单，新的敌人类型只需在自己的模块中注册即可被生成：
+
+    GHOST_ASSETS = {
+        'idle': {'clip': 'ghost_idle', 'image': 'images/enemy/Ghost_Idle.png',
+                 'frame_width': 44, 'frame_height': 30, 'frame_count': 10},
+        ...
+    }
+
+    @register_enemy_type('ghost', GHOST_ASSETS)
+    class Ghost(Enemy):
+        ...
+
+资源清单中的精灵表在该类型第一次生成时才加载（同一图片只加载一次），
+也可以在地图和英雄选择界面调用warm_up提前加载本局会用到的类型。
+"""
+
+from ..resource_manager import resource_manager
+from .enemy_config import get_enemy_stats
+from .frame_bank import frame_banks
+
+# 资源清单中动画的默认动画速度（每帧持续时间）
+DEFAULT_ANIMATION_SPEED = 0.0333
+
+
+class EnemyType:
+    """一个已注册的敌人类型"""
+
+    def __init__(self, key, enemy_class, assets):
+        """
+        Args:
+            key: 敌人类型名
+            enemy_class: 敌人类
+            assets: 资源清单 {动画状态: {clip, image, frame_width, frame_height, frame_count, row}}
+        """
+        self.key = key
+        self.enemy_class = enemy_class
+        self.assets = assets
+        self.spritesheets = None  # {动画状态: SpriteSheet}，首次使用时加载
+
+    @property
+    def loaded(self):
+        """精灵表是否已经加载"""
+        return self.spritesheets is not None
+
+    def load_spritesheets(self):
+        """
+        加载资源清单中的精灵表（只在第一次调用时加载）
+
+        Returns:
+            dict: {动画状态: SpriteSheet}
+        """
+        if self.spritesheets is None:
+            # 以文件路径作为资源名称，多个动画状态共用同一张图片时只加载一次
+            self.spritesheets = {
+                state: resource_manager.load_spritesheet(asset['image'], asset['image'])
+                for state, asset in self.assets.items()
+            }
+        return self.spritesheets
+
+    def create_animations(self, frame_duration=DEFAULT_ANIMATION_SPEED):
+        """
+        按资源清单创建该类型的动画，帧数据在同类型的敌人之间共享
+
+        Args:
+            frame_duration: 每帧持续时间
+
+        Returns:
+            dict: {动画状态: Animation}
+        """
+        spritesheets = self.load_spritesheets()
+        return {
+            state: resource_manager.create_animation(
+                asset['clip'], spritesheets[state],
+                frame_width=asset['frame_width'], frame_height=asset['frame_height'],
+                frame_count=asset['frame_count'], row=asset.get('row', 0),
+                frame_duration=frame_duration)
+            for state, asset in self.assets.items()
+        }
+
+
+class EnemyRegistry:
+    """敌人类型名到敌人类和资源清单的映射"""
+
+    def __init__(self):
+        self.types = {}  # {类型名: EnemyType}
+        self._aliases = {}  # {小写的类型名或类名: 类型名}
+
+    def register(self, key, enemy_class, assets):
+        """
+        注册敌人类型
+
+        Args:
+            key: 敌人类型名
+            enemy_class: 敌人类
+            assets: 资源清单
+
+        Raises:
+            ValueError: 类型名已被其他类注册
+        """
+        existing = self.types.get(key)
+        if existing is not None and existing.enemy_class is not enemy_class:
+            raise ValueError(f"敌人类型 {key} 已注册为 {existing.enemy_class.__name__}")
+        self.types[key] = EnemyType(key, enemy_class, assets)
+        self._aliases[key.lower()] = key
+        # 旧存档按类名记录敌人类型（如'Ghost'），同样可以解析
+        self._aliases[enemy_class.__name__.lower()] = key
+
+    def resolve(self, name):
+        """
+        把类型名或类名解析为注册的类型名
+
+        Args:
+            name: 类型名（如'ghost'）或类名（如'Ghost'）
+
+        Returns:
+            str: 类型名，未注册时返回None
+        """
+        if name in self.types:
+            return name
+        if isinstance(name, str):
+            return self._aliases.get(name.lower())
+        return None
+
+    def get(self, name):
+        """
+        获取敌人类型
+
+        Args:
+            name: 类型名或类名
+
+        Returns:
+            EnemyType: 未注册时返回None
+        """
+        key = self.resolve(name)
+        return self.types[key] if key is not None else None
+
+    def get_class(self, name):
+        """
+        获取敌人类
+
+        Args:
+            name: 类型名或类名
+
+        Returns:
+            type: 敌人类，未注册时返回None
+        """
+        enemy_type = self.get(name)
+        return enemy_type.enemy_class if enemy_type is not None else None
+
+    def create_animations(self, name, frame_duration=DEFAULT_ANIMATION_SPEED):
+        """
+        创建敌人类型的动画，第一次调用时加载该类型的精灵表
+
+        Args:
+            name: 类型名或类名
+            frame_duration: 每帧持续时间
+
+        Returns:
+            dict: {动画状态: Animation}
+
+        Raises:
+            KeyError: 类型未注册
+        """
+        enemy_type = self.get(name)
+        if enemy_type is None:
+            raise KeyError(f"未注册的敌人类型: {name}")
+        return enemy_type.create_animations(frame_duration)
+
+    def warm_up(self, names, difficulty="normal"):
+        """
+        提前加载敌人类型的精灵表并构建帧缓存，避免第一次生成时卡顿
+
+        Args:
+            names: 类型名列表
+            difficulty: 游戏难度，用于读取缩放和动画速度
+
+        Returns:
+            list: 实际加载的类型名（已加载的类型会被跳过）
+        """
+        warmed = []
+        for name in names:
+            enemy_type = self.get(name)
+            if enemy_type is None or enemy_type.loaded:
+                continue
+            stats = get_enemy_stats(enemy_type.key, difficulty)
+            animations = enemy_type.create_animations(stats.get("animation_speed", DEFAULT_ANIMATION_SPEED))
+            frame_banks.get_bank(enemy_type.key, stats.get("scale", 2.0), animations)
+            warmed.append(enemy_type.key)
+        return warmed
+
+    def get_stats(self):
+        """
+        获取注册和加载情况
+
+        Returns:
+            dict: 包含registered（已注册的类型名）和loaded（已加载精灵表的类型名）的字典
+        """
+        return {
+            'registered': list(self.types),
+            'loaded': [key for key, enemy_type in self.types.items() if enemy_type.loaded]
+        }
+
+
+# 全局敌人类型注册表
+enemy_registry = EnemyRegistry()
+
+
+def register_enemy_type(key, assets):
+    """
+    注册敌人类型的类装饰器
+
+    Args:
+        key: 敌人类型名
+        assets: 资源清单
+
+    Returns:
+        装饰器，原样返回被装饰的类
+    """
+    def decorator(enemy_class):
+        enemy_registry.register(key, enemy_class, assets)
+        return enemy_class
+    return decorator
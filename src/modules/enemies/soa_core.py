@@ -0,0 +1,419 @@
+"""
+敌人模拟的数组结构（SoA）核心
+开启后敌人的位置、速度、生命值、计时器和类型保存在numpy数组中，
+追击玩家的移动、无敌计时、燃烧和减速效果对所有敌人一次性向量化计算。
+
+敌人对象被替换为同名的视图类：生命值、速度等属性通过属性描述符读写数组中的对应槽位，
+动画、图像以及Slime等子类自己的update扩展仍然按对象逐个处理。
+"""
+
+import numpy as np
+from .enemy import Enemy
+
+# 由数组保存的敌人属性 {属性名: 读取时转换的类型}
+VIEW_FIELDS = {
+    'health': float,
+    'speed': float,
+    'original_speed': float,
+    'invincible': bool,
+    'invincible_timer': float,
+    'hurt_timer': float,
+    'burn_flash_timer': float,
+    'burn_flash_duration': float,
+    'facing_right': bool,
+    '_alive': bool,
+}
+
+# 只在核心内部使用的数组
+FLOAT_ARRAYS = (
+    'health', 'speed', 'original_speed', 'invincible_timer', 'hurt_timer',
+    'burn_flash_timer', 'burn_flash_duration',
+    'burn_duration', 'burn_damage', 'burn_timer', 'burn_total_timer',
+    'slow_duration', 'slow_percent', 'slow_timer',
+)
+BOOL_ARRAYS = ('_alive', 'invincible', 'facing_right', 'moving', 'burning', 'slowed', 'has_update_hook')
+INT_ARRAYS = ('type_id', 'width', 'height')
+
+
+def round_half_away(values):
+    """
+    按pygame.Rect赋值浮点数时的规则取整（0.5远离零取整）
+
+    Args:
+        values: 浮点数组
+
+    Returns:
+        numpy.ndarray: 取整后的int64数组
+    """
+    rounded = np.round(values)  # numpy按银行家舍入处理0.5，下面单独修正
+    truncated = np.trunc(values)
+    ties = np.abs(values - truncated) == 0.5
+    if ties.any():
+        rounded[ties] = truncated[ties] + np.sign(values[ties])
+    return rounded.astype(np.int64)
+
+
+def _array_property(name, cast):
+    """创建读写数组槽位的属性描述符"""
+    def getter(self):
+        return cast(getattr(self._soa_core, name)[self._soa_slot])
+
+    def setter(self, value):
+        getattr(self._soa_core, name)[self._soa_slot] = value
+
+    return property(getter, setter)
+
+
+class EnemySoAView(Enemy):
+    """敌人视图的公共部分
+
+    实际使用的视图类由EnemySoACore按敌人类型动态创建，基类顺序为 (敌人类型, EnemySoAView)，
+    因此Slime.update中的super().update会调用这里的update，只处理数组之外的逐对象状态。
+    """
+
+    # 视图类对应的原始敌人类型，解除绑定时恢复
+    soa_base_class = None
+    # 原始类型是否重写了update（如Slime的攻击冷却和投射物），重写时屏幕外也需要逐帧调用
+    soa_has_update_hook = False
+
+    @property
+    def status_effects(self):
+        """由数组生成的状态效果快照，格式与Enemy.status_effects相同（修改快照不会生效）"""
+        core = self._soa_core
+        slot = self._soa_slot
+        effects = {}
+        if core.burning[slot]:
+            effects['burn'] = {
+                'duration': float(core.burn_duration[slot]),
+                'damage_per_sec': float(core.burn_damage[slot]),
+                'timer': float(core.burn_timer[slot]),
+                'total_timer': float(core.burn_total_timer[slot])
+            }
+        if core.slowed[slot]:
+            effects['slow'] = {
+                'duration': float(core.slow_duration[slot]),
+                'slow_percent': float(core.slow_percent[slot]),
+                'timer': float(core.slow_timer[slot])
+            }
+        return effects
+
+    @status_effects.setter
+    def status_effects(self, effects):
+        self._soa_core.write_status_effects(self._soa_slot, effects)
+
+    def apply_burn_effect(self, damage_per_second, duration):
+        core = self._soa_core
+        slot = self._soa_slot
+        # 与Enemy.apply_burn_effect相同：已有燃烧效果时取较长的持续时间和较高的伤害
+        if core.burning[slot]:
+            core.burn_duration[slot] = max(core.burn_duration[slot], duration)
+            core.burn_damage[slot] = max(core.burn_damage[slot], damage_per_second)
+        else:
+            core.burning[slot] = True
+            core.burn_duration[slot] = duration
+            core.burn_damage[slot] = damage_per_second
+            core.burn_timer[slot] = 0.0
+            core.burn_total_timer[slot] = 0.0
+
+    def apply_slow_effect(self, slow_percent, duration):
+        core = self._soa_core
+        slot = self._soa_slot
+        # 与Enemy.apply_slow_effect相同：取较强的减速和较长的持续时间
+        if core.slowed[slot]:
+            core.slow_duration[slot] = max(core.slow_duration[slot], duration)
+            if slow_percent > core.slow_percent[slot]:
+                core.slow_percent[slot] = slow_percent
+                core.speed[slot] = core.original_speed[slot] * (1 - slow_percent)
+        else:
+            core.original_speed[slot] = core.speed[slot]
+            core.slowed[slot] = True
+            core.slow_duration[slot] = duration
+            core.slow_percent[slot] = slow_percent
+            core.slow_timer[slot] = 0.0
+            core.speed[slot] = core.original_speed[slot] * (1 - slow_percent)
+
+    def update_status_effects(self, dt):
+        """状态效果由EnemySoACore.step统一结算"""
+        pass
+
+    def update(self, dt, player):
+        """
+        处理数组之外的状态：动画推进、动画切换和图像更新
+        移动、无敌、受伤计时和状态效果已经由EnemySoACore.step完成
+
+        Args:
+            dt: 时间增量（秒）
+            player: 玩家对象
+        """
+        if self.lod_visuals and self.current_animation in self.animations:
+            self.animations[self.current_animation].update(dt)
+
+        # 受伤结束后根据本帧是否移动切换到行走或待机动画
+        if self.hurt_timer <= 0:
+            target = 'walk' if self._soa_core.moving[self._soa_slot] else 'idle'
+            if self.current_animation != target:
+                self.current_animation = target
+                if target in self.animations:
+                    self.animations[target].reset()
+
+        if self.lod_visuals:
+            self.update_image()
+
+
+for _name, _cast in VIEW_FIELDS.items():
+    setattr(EnemySoAView, _name, _array_property(_name, _cast))
+
+# {敌人类: 视图类}
+_view_classes = {}
+
+
+def get_view_class(enemy_class):
+    """
+    获取敌人类对应的视图类
+
+    视图类与原类同名，存档等按类名处理的逻辑不受影响
+
+    Args:
+        enemy_class: 敌人类，如Ghost
+
+    Returns:
+        type: 继承自 (enemy_class, EnemySoAView) 的视图类
+    """
+    view_class = _view_classes.get(enemy_class)
+    if view_class is None:
+        view_class = type(enemy_class.__name__, (enemy_class, EnemySoAView), {
+            'soa_base_class': enemy_class,
+            'soa_has_update_hook': enemy_class.update is not Enemy.update,
+            '__module__': enemy_class.__module__,
+            '__qualname__': enemy_class.__qualname__
+        })
+        _view_classes[enemy_class] = view_class
+    return view_class
+
+
+class EnemySoACore:
+    """以数组保存所有敌人的模拟状态，按槽位紧密排列，移除时用最后一个槽位填补"""
+
+    def __init__(self, capacity=256):
+        """
+        Args:
+            capacity: 初始容量，不足时自动翻倍
+        """
+        self.count = 0
+        self.capacity = 0
+        self.enemies = []  # 与槽位一一对应的敌人视图
+        self.type_ids = {}  # {敌人类型: 类型编号}
+        self._grow(max(1, int(capacity)))
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        """扩容所有数组，保留已有数据"""
+        for names, dtype in ((FLOAT_ARRAYS, np.float64), (BOOL_ARRAYS, np.bool_), (INT_ARRAYS, np.int32)):
+            for name in names:
+                array = np.zeros(capacity, dtype=dtype)
+                if self.count:
+                    array[:self.count] = getattr(self, name)[:self.count]
+                setattr(self, name, array)
+        self.capacity = capacity
+
+    def add(self, enemy):
+        """
+        把敌人的状态移入数组，并把敌人替换为视图
+
+        Args:
+            enemy: 未绑定的敌人对象
+        """
+        if self.count >= self.capacity:
+            self._grow(self.capacity * 2)
+
+        slot = self.count
+        self.count += 1
+        self.enemies.append(enemy)
+
+        state = enemy.__dict__
+        for name in VIEW_FIELDS:
+            getattr(self, name)[slot] = state.pop(name)
+        self.write_status_effects(slot, state.pop('status_effects', {}))
+        self.moving[slot] = False
+        self.type_id[slot] = self.type_ids.setdefault(enemy.type, len(self.type_ids))
+        self.width[slot] = enemy.rect.width
+        self.height[slot] = enemy.rect.height
+
+        view_class = get_view_class(type(enemy))
+        self.has_update_hook[slot] = view_class.soa_has_update_hook
+        enemy._soa_core = self
+        enemy._soa_slot = slot
+        enemy.__class__ = view_class
+
+    def remove(self, enemy):
+        """
+        把敌人的状态写回对象并恢复原来的类，最后一个槽位移到空出的位置
+
+        Args:
+            enemy: 已绑定到本核心的敌人视图
+        """
+        slot = enemy._soa_slot
+        state = {name: getattr(enemy, name) for name in VIEW_FIELDS}
+        state['status_effects'] = enemy.status_effects
+
+        enemy.__class__ = enemy.soa_base_class
+        del enemy._soa_core
+        del enemy._soa_slot
+        enemy.__dict__.update(state)
+
+        last = self.count - 1
+        last_enemy = self.enemies.pop()
+        if slot != last:
+            for name in FLOAT_ARRAYS + BOOL_ARRAYS + INT_ARRAYS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            self.enemies[slot] = last_enemy
+            last_enemy._soa_slot = slot
+        self.count = last
+
+    def clear(self):
+        """解除所有敌人的绑定"""
+        while self.enemies:
+            self.remove(self.enemies[-1])
+
+    def write_status_effects(self, slot, effects):
+        """
+        把Enemy.status_effects格式的状态效果写入数组
+
+        Args:
+            slot: 槽位
+            effects: {'burn': {...}, 'slow': {...}}
+        """
+        burn = effects.get('burn')
+        self.burning[slot] = burn is not None
+        if burn is not None:
+            self.burn_duration[slot] = burn['duration']
+            self.burn_damage[slot] = burn['damage_per_sec']
+            self.burn_timer[slot] = burn['timer']
+            self.burn_total_timer[slot] = burn['total_timer']
+
+        slow = effects.get('slow')
+        self.slowed[slot] = slow is not None
+        if slow is not None:
+            self.slow_duration[slot] = slow['duration']
+            self.slow_percent[slot] = slow['slow_percent']
+            self.slow_timer[slot] = slow['timer']
+
+    def update(self, dt, player, lod=None):
+        """
+        更新所有敌人：先批量模拟，再逐个调用屏幕内敌人和带有update扩展的敌人的update
+        屏幕外的普通敌人不调用update，回到屏幕内时再切换动画和刷新图像
+
+        Args:
+            dt: 时间增量（秒）
+            player: 玩家对象（需要有world_x、world_y属性）
+            lod: LodScheduler实例，提供时用其视野判断敌人是否在屏幕内
+
+        Returns:
+            list: 本帧死亡的敌人
+        """
+        n = self.count
+        if n == 0:
+            return []
+        enemies = self.enemies
+
+        # 位置以rect为准（群体分离等逻辑会直接修改rect），每帧开始时读出
+        positions = np.array([enemy.rect.topleft for enemy in enemies], dtype=np.float64)
+        if lod is not None:
+            visible = lod.visible_mask(positions[:, 0], positions[:, 1],
+                                       positions[:, 0] + self.width[:n], positions[:, 1] + self.height[:n])
+        else:
+            visible = np.ones(n, dtype=np.bool_)
+
+        self.step(dt, player, positions)
+
+        update_slots = np.flatnonzero(visible | self.has_update_hook[:n])
+        if lod is not None:
+            lod.skipped += n - update_slots.size
+        for slot, visuals in zip(update_slots.tolist(), visible[update_slots].tolist()):
+            enemy = enemies[slot]
+            enemy.lod_visuals = visuals
+            enemy.update(dt, player)
+
+        dead = ~self._alive[:n] | (self.health[:n] <= 0)
+        return [enemies[slot] for slot in np.flatnonzero(dead).tolist()]
+
+    def step(self, dt, player, positions=None):
+        """
+        对所有敌人执行一帧的模拟：状态效果、无敌和受伤计时、追击玩家的移动和朝向
+        计算顺序和数值与Enemy.update一致
+
+        Args:
+            dt: 时间增量（秒）
+            player: 玩家对象（需要有world_x、world_y属性）
+            positions: 已经读出的 (n, 2) 敌人位置数组，None表示从rect读取
+        """
+        n = self.count
+        if n == 0:
+            return
+        enemies = self.enemies
+
+        # 燃烧闪烁计时
+        flash = self.burn_flash_timer[:n]
+        active = flash > 0
+        flash[active] -= dt
+        flash[flash < 0] = 0
+
+        # 燃烧：每0.5秒结算一次伤害，不触发无敌
+        burning = np.flatnonzero(self.burning[:n])
+        if burning.size:
+            self.burn_total_timer[burning] += dt
+            self.burn_timer[burning] += dt
+            ticks = burning[self.burn_timer[burning] >= 0.5]
+            if ticks.size:
+                self.health[ticks] -= self.burn_damage[ticks] * 0.5
+                self.burn_timer[ticks] = 0.0
+                self.burn_flash_timer[ticks] = self.burn_flash_duration[ticks]
+                killed = ticks[self.health[ticks] <= 0]
+                self._alive[killed] = False
+            ended = burning[self.burn_total_timer[burning] >= self.burn_duration[burning]]
+            self.burning[ended] = False
+
+        # 减速：到期后恢复原始速度
+        slowed = np.flatnonzero(self.slowed[:n])
+        if slowed.size:
+            self.slow_timer[slowed] += dt
+            ended = slowed[self.slow_timer[slowed] >= self.slow_duration[slowed]]
+            self.speed[ended] = self.original_speed[ended]
+            self.slowed[ended] = False
+
+        # 无敌计时
+        invincible = np.flatnonzero(self.invincible[:n])
+        if invincible.size:
+            self.invincible_timer[invincible] -= dt
+            ended = invincible[self.invincible_timer[invincible] <= 0]
+            self.invincible[ended] = False
+            self.invincible_timer[ended] = 0
+
+        # 受伤计时
+        hurt = self.hurt_timer[:n]
+        hurt[hurt > 0] -= dt
+
+        # 追击玩家：移动后按Rect的取整规则写回rect
+        if positions is None:
+            positions = np.array([enemy.rect.topleft for enemy in enemies], dtype=np.float64)
+        x = positions[:, 0]
+        y = positions[:, 1]
+        dx = player.world_x - x
+        dy = player.world_y - y
+        distance = np.sqrt(dx * dx + dy * dy)
+
+        self.facing_right[:n] = dx > 0
+        moving = distance != 0
+        self.moving[:n] = moving
+
+        # 与玩家重合的敌人不移动，用1代替距离避免除以零
+        distance[~moving] = 1.0
+        speed = self.speed[:n]
+        new_x = round_half_away(x + dx / distance * speed * dt).tolist()
+        new_y = round_half_away(y + dy / distance * speed * dt).tolist()
+
+        for slot in np.flatnonzero(moving).tolist():
+            enemies[slot].rect.topleft = (new_x[slot], new_y[slot])
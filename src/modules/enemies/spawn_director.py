@@ -0,0 +1,324 @@
+"""
+敌人生成导演
+按波次文件（assets/waves/*.json）安排敌人的生成：
+- spawners：在时间窗口内按固定间隔重复生成
+- waves：在指定时间一次性生成一大批敌人（随机位置、环形包围或方阵）
+
+所有生成请求先进入队列，每帧在时间预算内逐个生成，大规模波次分散到多帧完成，避免单帧卡顿。
+
+波次文件格式：
+    {
+        "spawners": [
+            {"start": 0, "end": 10, "interval": 1.0, "types": ["slime"]},
+            {"interval": 60, "immediate": true, "min_player_level": 1, "types": ["bat"]}
+        ],
+        "waves": [
+            {"time": 30, "pattern": "ring", "count": 120, "radius": 650, "types": {"ghost": 2, "slime": 1}}
+        ]
+    }
+
+types可以是类型列表（等概率）或 {类型: 权重} 字典。
+pattern可选random（默认，每个敌人随机角度）、ring（均匀分布在圆周上）和formation（rows×cols的方阵）。
+"""
+
+import os
+import json
+import math
+import time
+import random
+from collections import deque
+from ..resource_manager import resource_manager
+
+PATTERN_RANDOM = 'random'
+PATTERN_RING = 'ring'
+PATTERN_FORMATION = 'formation'
+PATTERNS = (PATTERN_RANDOM, PATTERN_RING, PATTERN_FORMATION)
+
+# 默认的生成距离（与玩家的距离）
+DEFAULT_SPAWN_DISTANCE = 600
+
+# 默认每帧用于生成敌人的时间预算（毫秒）
+DEFAULT_TIME_BUDGET_MS = 2.0
+
+# 已加载的波次文件 {名称: 波次数据}
+_schedule_cache = {}
+
+
+def _validate_group(entry, where):
+    """检查一组生成配置的类型和阵型"""
+    types = entry.get('types')
+    if not types:
+        raise ValueError(f"{where} 缺少types")
+    pattern = entry.get('pattern', PATTERN_RANDOM)
+    if pattern not in PATTERNS:
+        raise ValueError(f"{where} 未知的阵型: {pattern}")
+
+
+def validate_schedule(schedule):
+    """
+    检查波次数据的格式
+
+    Args:
+        schedule: 波次数据字典
+
+    Returns:
+        dict: 原样返回的波次数据
+
+    Raises:
+        ValueError: 格式错误
+    """
+    for index, spawner in enumerate(schedule.get('spawners', [])):
+        where = f"spawners[{index}]"
+        if spawner.get('interval', 0) <= 0:
+            raise ValueError(f"{where} 的interval必须大于0")
+        _validate_group(spawner, where)
+    for index, wave in enumerate(schedule.get('waves', [])):
+        where = f"waves[{index}]"
+        if 'time' not in wave:
+            raise ValueError(f"{where} 缺少time")
+        _validate_group(wave, where)
+    return schedule
+
+
+def load_wave_schedule(name='default'):
+    """
+    加载assets/waves目录下的波次文件（同名文件只读取一次）
+
+    Args:
+        name: 波次文件名（不含扩展名）
+
+    Returns:
+        dict: 波次数据
+    """
+    schedule = _schedule_cache.get(name)
+    if schedule is None:
+        path = os.path.join(resource_manager.resource_dir, "waves", f"{name}.json")
+        with open(path, 'r', encoding='utf-8') as f:
+            schedule = validate_schedule(json.load(f))
+        _schedule_cache[name] = schedule
+    return schedule
+
+
+def schedule_enemy_types(schedule):
+    """
+    获取波次数据中会出现的所有敌人类型
+
+    Args:
+        schedule: 波次数据
+
+    Returns:
+        list: 敌人类型列表（按首次出现的顺序，不重复）
+    """
+    enemy_types = {}
+    for entry in schedule.get('spawners', []) + schedule.get('waves', []):
+        for enemy_type in entry['types']:
+            enemy_types[enemy_type] = None
+    return list(enemy_types)
+
+
+def choose_types(types, count):
+    """
+    按配置随机选择敌人类型
+
+    Args:
+        types: 类型列表，或 {类型: 权重} 字典
+        count: 数量
+
+    Returns:
+        list: 敌人类型列表
+    """
+    if isinstance(types, dict):
+        return random.choices(list(types), weights=list(types.values()), k=count)
+    if len(types) == 1:
+        return [types[0]] * count
+    return [random.choice(types) for _ in range(count)]
+
+
+def clamp_to_boundaries(x, y, boundaries):
+    """
+    把坐标限制在地图边界内
+
+    Args:
+        x: 世界X坐标
+        y: 世界Y坐标
+        boundaries: 地图边界 (min_x, min_y, max_x, max_y)，None表示不限制
+
+    Returns:
+        tuple: (x, y)
+    """
+    if boundaries:
+        min_x, min_y, max_x, max_y = boundaries
+        x = max(min_x, min(x, max_x))
+        y = max(min_y, min(y, max_y))
+    return x, y
+
+
+def build_spawn_positions(entry, center_x, center_y):
+    """
+    按阵型计算一组敌人的世界坐标
+
+    Args:
+        entry: 生成配置（spawner或wave）
+        center_x: 玩家的世界X坐标
+        center_y: 玩家的世界Y坐标
+
+    Returns:
+        list: [(x, y), ...]
+    """
+    pattern = entry.get('pattern', PATTERN_RANDOM)
+
+    if pattern == PATTERN_FORMATION:
+        rows = int(entry.get('rows', 1))
+        cols = int(entry.get('cols', entry.get('count', 1)))
+        spacing = entry.get('spacing', 48)
+        distance = entry.get('distance', DEFAULT_SPAWN_DISTANCE)
+        angle = math.radians(entry['angle']) if 'angle' in entry else random.uniform(0, 2 * math.pi)
+        # 方阵中心在玩家的指定方向上，整体朝向玩家
+        formation_x = center_x + distance * math.cos(angle)
+        formation_y = center_y + distance * math.sin(angle)
+        forward_x, forward_y = -math.cos(angle), -math.sin(angle)
+        side_x, side_y = -forward_y, forward_x
+        positions = []
+        for row in range(rows):
+            depth = (row - (rows - 1) / 2) * spacing
+            for col in range(cols):
+                offset = (col - (cols - 1) / 2) * spacing
+                positions.append((formation_x + side_x * offset - forward_x * depth,
+                                  formation_y + side_y * offset - forward_y * depth))
+        return positions
+
+    count = int(entry.get('count', 1))
+    if pattern == PATTERN_RING:
+        radius = entry.get('radius', entry.get('distance', DEFAULT_SPAWN_DISTANCE))
+        start = random.uniform(0, 2 * math.pi)
+        step = 2 * math.pi / max(1, count)
+        return [(center_x + radius * math.cos(start + i * step),
+                 center_y + radius * math.sin(start + i * step)) for i in range(count)]
+
+    distance = entry.get('distance', DEFAULT_SPAWN_DISTANCE)
+    positions = []
+    for _ in range(count):
+        angle = random.uniform(0, 2 * math.pi)
+        positions.append((center_x + distance * math.cos(angle), center_y + distance * math.sin(angle)))
+    return positions
+
+
+class SpawnDirector:
+    """按波次数据安排敌人生成，并在每帧的时间预算内执行生成"""
+
+    def __init__(self, schedule=None, time_budget_ms=DEFAULT_TIME_BUDGET_MS, min_spawns_per_frame=1):
+        """
+        Args:
+            schedule: 波次数据，None表示不自动生成
+            time_budget_ms: 每帧用于生成敌人的时间预算（毫秒），None表示不限制
+            min_spawns_per_frame: 每帧至少生成的数量，保证预算不足时队列仍然推进
+        """
+        self.time_budget_ms = time_budget_ms
+        self.min_spawns_per_frame = min_spawns_per_frame
+        self.enabled = True
+
+        self.queue = deque()  # 待生成的 (类型, x, y)
+        self.set_schedule(schedule)
+
+        # 上一帧的统计数据
+        self.last_stats = {'spawned': 0, 'pending': 0, 'time_ms': 0.0}
+
+    def set_schedule(self, schedule):
+        """
+        更换波次数据，重置所有计时器和未生成的队列
+
+        Args:
+            schedule: 波次数据
+        """
+        self.schedule = schedule or {}
+        self.spawners = list(self.schedule.get('spawners', []))
+        # 每个spawner的计时器，immediate的spawner在第一次更新时立即生成
+        self.spawner_timers = [spawner['interval'] if spawner.get('immediate') else 0.0
+                               for spawner in self.spawners]
+        self.waves = sorted(self.schedule.get('waves', []), key=lambda wave: wave['time'])
+        self.next_wave = 0
+        self.queue.clear()
+
+    def queue_group(self, entry, player, boundaries=None):
+        """
+        按生成配置把一组敌人加入生成队列
+
+        Args:
+            entry: 生成配置（spawner或wave）
+            player: 玩家对象，阵型以玩家为中心
+            boundaries: 地图边界 (min_x, min_y, max_x, max_y)，超出的位置会被限制在边界内
+
+        Returns:
+            int: 加入队列的敌人数量
+        """
+        positions = build_spawn_positions(entry, player.world_x, player.world_y)
+        types = choose_types(entry['types'], len(positions))
+        for enemy_type, (x, y) in zip(types, positions):
+            self.queue.append((enemy_type, *clamp_to_boundaries(x, y, boundaries)))
+        return len(positions)
+
+    def update(self, dt, manager, player):
+        """
+        推进波次计时并在时间预算内生成队列中的敌人
+
+        Args:
+            dt: 时间增量
+            manager: EnemyManager实例（提供game_time、map_boundaries和spawn_enemy）
+            player: 玩家对象
+        """
+        if self.enabled:
+            self._schedule(dt, manager, player)
+        self._spawn_queued(manager)
+
+    def _schedule(self, dt, manager, player):
+        """把本帧到期的spawner和波次加入队列"""
+        game_time = manager.game_time
+        boundaries = manager.map_boundaries
+        level = getattr(player, 'level', 1)
+
+        for index, spawner in enumerate(self.spawners):
+            # 计时器始终累积，进入时间窗口时可以立即生成
+            self.spawner_timers[index] += dt
+            if self.spawner_timers[index] < spawner['interval']:
+                continue
+            if game_time < spawner.get('start', 0) or game_time >= spawner.get('end', math.inf):
+                continue
+            if level < spawner.get('min_player_level', 0):
+                continue
+            self.spawner_timers[index] = 0
+            self.queue_group(spawner, player, boundaries)
+
+        while self.next_wave < len(self.waves) and self.waves[self.next_wave]['time'] <= game_time:
+            self.queue_group(self.waves[self.next_wave], player, boundaries)
+            self.next_wave += 1
+
+    def _spawn_queued(self, manager):
+        """在时间预算内生成队列中的敌人，并记录本帧的统计数据"""
+        queue = self.queue
+        spawned = 0
+        start = time.perf_counter()
+        if queue:
+            deadline = None if self.time_budget_ms is None else start + self.time_budget_ms / 1000
+            while queue:
+                if deadline is not None and spawned >= self.min_spawns_per_frame \
+                        and time.perf_counter() >= deadline:
+                    break
+                enemy_type, x, y = queue.popleft()
+                manager.spawn_enemy(enemy_type, x, y)
+                spawned += 1
+
+        self.last_stats = {
+            'spawned': spawned,
+            'pending': len(queue),
+            'time_ms': (time.perf_counter() - start) * 1000
+        }
+
+    def get_stats(self):
+        """
+        获取上一帧的生成统计
+
+        Returns:
+            dict: 包含spawned（生成数量）、pending（队列中剩余数量）
+                  和time_ms（生成耗时，毫秒）的字典
+        """
+        return dict(self.last_stats)
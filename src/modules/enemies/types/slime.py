@@ -1,68 +1,52 @@
 from ..enemy import Enemy
-from ...resource_manager import resource_manager
+from ..registry import register_enemy_type
+from ...render_batch import LAYER_ENEMY_OVERLAY
+from ...projectiles import Projectile, ProjectileGroup
 import pygame
 import math
 
+# 资源清单：idle、walk和hurt暂时共用同一张精灵表
+SLIME_ASSETS = {
+    'idle': {'clip': 'ranger_idle', 'image': 'images/enemy/Slime_Idle_44x30.png',
+             'frame_width': 44, 'frame_height': 30, 'frame_count': 10},
+    'walk': {'clip': 'ranger_walk', 'image': 'images/enemy/Slime_Idle_44x30.png',
+             'frame_width': 44, 'frame_height': 30, 'frame_count': 10},
+    'hurt': {'clip': 'ranger_hurt', 'image': 'images/enemy/Slime_Idle_44x30.png',
+             'frame_width': 44, 'frame_height': 30, 'frame_count': 10}
+}
+
+@register_enemy_type('slime', SLIME_ASSETS)
 class Slime(Enemy):
     """远程攻击敌人示例类"""
     
+    ranged = True
+    
     def __init__(self, x, y, enemy_type='slime', difficulty="normal", level=1, scale=None):
         # 调用基类构造函数，传递敌人类型、难度和等级
         super().__init__(x, y, enemy_type, difficulty, level, scale)
         
-        # 从配置获取远程攻击相关属性
-        self.attack_range = self.config.get("attack_range", 800)        # 攻击距离
-        self.min_attack_range = self.config.get("min_attack_range", 300) # 最小攻击距离，太近不会发射
-        self.attack_cooldown = 0
-        self.attack_cooldown_time = self.config.get("attack_cooldown", 2.0)  # 攻击冷却时间（秒）
-        self.projectile_speed = self.config.get("projectile_speed", 180)
-        self.projectiles = pygame.sprite.Group()  # 存储投射物
+        self.projectiles = ProjectileGroup()  # 存储投射物
+        self._init_ranged_state()
         
         # 加载动画
         self.load_animations()
         
-        # 设置初始图像
+        # 设置初始图像（从该类型共享的帧缓存中获取，不创建新的Surface）
         self.current_animation = 'idle'
-        self.image = self.animations[self.current_animation].get_current_frame()
-        # 应用缩放
-        original_size = self.image.get_size()
-        new_size = (int(original_size[0] * self.scale), int(original_size[1] * self.scale))
-        self.image = pygame.transform.scale(self.image, new_size)
-        
-    def load_animations(self):
-        """加载远程敌人的动画"""
-        # 获取配置中的动画速度
-        animation_speed = self.config.get("animation_speed", 0.0333)
-        
-        # 加载精灵表
-        idle_spritesheet = resource_manager.load_spritesheet(
-            'slime_idle_spritesheet', 'images/enemy/Slime_Idle_44x30.png')
-        walk_spritesheet = resource_manager.load_spritesheet(
-            'slime_walk_spritesheet', 'images/enemy/Slime_Idle_44x30.png')
-        hurt_spritesheet = resource_manager.load_spritesheet(
-            'slime_hurt_spritesheet', 'images/enemy/Slime_Idle_44x30.png')
-        
-        # 创建动画
-        self.animations = {
-            'idle': resource_manager.create_animation(
-                'ranger_idle', idle_spritesheet,
-                frame_width=44, frame_height=30,
-                frame_count=10, row=0,
-                frame_duration=animation_speed
-            ),
-            'walk': resource_manager.create_animation(
-                'ranger_walk', walk_spritesheet,
-                frame_width=44, frame_height=30,
-                frame_count=10, row=0,
-                frame_duration=animation_speed
-            ),
-            'hurt': resource_manager.create_animation(
-                'ranger_hurt', hurt_spritesheet,
-                frame_width=44, frame_height=30,
-                frame_count=10, row=0,
-                frame_duration=animation_speed
-            )
-        }
+        self.update_image()
+        
+    def reset(self, x, y, enemy_type='slime', difficulty="normal", level=1, scale=None):
+        super().reset(x, y, enemy_type, difficulty, level, scale)
+        self.projectiles.empty()
+        self._init_ranged_state()
+        
+    def _init_ranged_state(self):
+        """从配置获取远程攻击相关属性"""
+        self.attack_range = self.config.get("attack_range", 800)        # 攻击距离
+        self.min_attack_range = self.config.get("min_attack_range", 300) # 最小攻击距离，太近不会发射
+        self.attack_cooldown = 0
+        self.attack_cooldown_time = self.config.get("attack_cooldown", 2.0)  # 攻击冷却时间（秒）
+        self.projectile_speed = self.config.get("projectile_speed", 180)
         
     def update(self, dt, player):
         # 首先调用父类更新方法
@@ -80,6 +64,18 @@ class Slime(Enemy):
         super().render(screen, screen_x, screen_y)
         
         # 渲染投射物
+        for image, dest in self._get_projectile_draws(screen_x, screen_y):
+            screen.blit(image, dest)
+            
+    def queue_render(self, batcher, screen_x, screen_y):
+        super().queue_render(batcher, screen_x, screen_y)
+        
+        # 投射物由批量渲染器单独裁剪，史莱姆本身在屏幕外时仍然可能可见
+        for image, dest in self._get_projectile_draws(screen_x, screen_y):
+            batcher.add(LAYER_ENEMY_OVERLAY, image, dest)
+            
+    def _get_projectile_draws(self, screen_x, screen_y):
+        """计算每个投射物绘制用的图像和左上角屏幕坐标"""
         for projectile in self.projectiles:
             # 计算投射物相对于敌人的偏移
             projectile_offset_x = projectile.x - self.rect.centerx
@@ -89,10 +85,8 @@ class Slime(Enemy):
             projectile_screen_x = screen_x + projectile_offset_x
             projectile_screen_y = screen_y + projectile_offset_y
             
-            # 渲染投射物
-            screen.blit(projectile.image, 
-                      (projectile_screen_x - projectile.image.get_width()//2, 
-                       projectile_screen_y - projectile.image.get_height()//2))
+            yield projectile.image, (projectile_screen_x - projectile.image.get_width()//2,
+                                     projectile_screen_y - projectile.image.get_height()//2)
         
     def attack(self, player, dt):
         """
@@ -179,9 +173,11 @@ class Slime(Enemy):
         return False
 
 
-class RangerProjectile(pygame.sprite.Sprite):
+class RangerProjectile(Projectile):
     """远程敌人的投射物类"""
     
+    __slots__ = ('x', 'y', 'direction_x', 'direction_y', 'damage', 'speed', 'radius', 'lifetime', 'image', 'rect')
+    
     def __init__(self, x, y, direction_x, direction_y, damage, speed):
         super().__init__()
         # 基本属性
@@ -222,4 +218,4 @@ class RangerProjectile(pygame.sprite.Sprite):
             
     def render(self, screen, camera_x, camera_y):
         """渲染投射物(已在Slime的render方法中实现，此方法不再使用)"""
-        pass
\ No newline at end of file
+        pass
@@ -1,6 +1,9 @@
 import pygame
 from .player import Player
 from .enemies.enemy_manager import EnemyManager
+from .enemies.spawn_director import DEFAULT_TIME_BUDGET_MS, load_wave_schedule, schedule_enemy_types
+from .enemies.registry import enemy_registry
+from .enemies.enemy_config import reload_enemy_configs
 from .items.item_manager import ItemManager
 from .ui import UI
 from .menu import PauseMenu, GameOverMenu, UpgradeMenu
@@ -10,12 +13,22 @@ from .save_system import SaveSystem
 from .resource_manager import resource_manager
 from .upgrade_system import UpgradeManager, WeaponUpgradeLevel, PassiveUpgradeLevel
 from .utils import apply_mask_collision
+from .collision.broad_phase import BroadPhase
+from .collision.swept import swept_mask_collision, reset_sweep
+from .combat_events import CombatEventQueue
+from .render_batch import RenderBatcher
 from .map_manager import MapManager
 from .menus.map_hero_select_menu import MapHeroSelectMenu
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, debug_mode=False):
+        """
+        Args:
+            screen: 游戏窗口
+            debug_mode: 是否启用调试按键（F3~F10切换各项性能优化并输出统计）
+        """
         self.screen = screen
+        self.debug_mode = debug_mode
         self.running = True
         self.paused = False
         self.game_over = False
@@ -68,6 +81,14 @@ class Game:
         # 地图状态
         self.current_map = None  # 当前地图名称
         
+        # 碰撞粗检测，可在'brute'、'grid'、'numpy'之间切换以便对比
+        self.broad_phase = BroadPhase(backend='grid')
+        
+        # 战斗事件队列，每帧末统一结算击杀和掉落
+        self.combat_events = CombatEventQueue()
+        # 世界精灵的批量渲染器
+        self.render_batcher = RenderBatcher()
+        
     def _set_map_boundaries(self):
         """根据当前地图尺寸设置边界
         
@@ -131,6 +152,9 @@ class Game:
         # 初始化游戏管理器
         self.enemy_manager = EnemyManager()
         self.enemy_manager.set_difficulty("normal")  # 设置初始难度
+        self.enemy_manager.lod.set_view_size(self.screen.get_size())
+        self.enemy_manager.population.set_limits()
+        self.enemy_manager.horde.set_view_size(self.screen.get_size())
         self.item_manager = ItemManager()
         
         # 设置边界
@@ -158,6 +182,9 @@ class Game:
         self.in_main_menu = False
         self.in_map_hero_select = True
         self.map_hero_select_menu.show()
+        
+        # 在选择界面提前加载本局波次会用到的敌人类型资源，其他类型在第一次生成时再加载
+        enemy_registry.warm_up(schedule_enemy_types(load_wave_schedule()))
             
     def load_map(self, map_name):
         """加载指定名称的地图"""
@@ -292,6 +319,9 @@ class Game:
             
             # 初始化游戏管理器
             self.enemy_manager = EnemyManager()
+            self.enemy_manager.lod.set_view_size(self.screen.get_size())
+            self.enemy_manager.population.set_limits()
+            self.enemy_manager.horde.set_view_size(self.screen.get_size())
             self.item_manager = ItemManager()
             
             # 恢复游戏状态
@@ -307,9 +337,13 @@ class Game:
             # 恢复敌人状态
             enemies_data = save_data.get('enemies_data', [])
             for enemy_data in enemies_data:
+                enemy_type = enemy_data.get('type', 'normal')
+                if enemy_registry.resolve(enemy_type) is None:
+                    print(f"跳过未知的敌人类型: {enemy_type}")
+                    continue
                 try:
                     self.enemy_manager.spawn_enemy(
-                        enemy_data.get('type', 'normal'),
+                        enemy_type,
                         enemy_data.get('x', 0),
                         enemy_data.get('y', 0),
                         enemy_data.get('health', 50)
@@ -444,9 +478,11 @@ class Game:
                 if self.player:
                     self.player.toggle_outline()
                     # 切换敌人的轮廓
-                    for enemy in self.enemy_manager.enemies:
+                    for enemy in self.enemy_manager.all_enemies():
                         enemy.toggle_outline()
                 return True
+            elif self.debug_mode and self._handle_debug_key(event.key):
+                return True
             
         # 处理玩家输入
         if self.player:
@@ -454,6 +490,81 @@ class Game:
             
         return True
         
+    def _handle_debug_key(self, key):
+        """处理调试按键（F3~F10），用于在运行中对比各项性能优化的效果
+        
+        只在以调试模式启动游戏时生效，每个按键切换一个子系统并输出相关统计
+        
+        Args:
+            key: 按键
+            
+        Returns:
+            bool: 是否为调试按键
+        """
+        if key == pygame.K_F3:
+            # 切换碰撞粗检测实现，用于对比性能
+            backend = self.broad_phase.next_backend()
+            print(f"碰撞检测实现: {backend}")
+            return True
+        elif key == pygame.K_F4:
+            # 切换批量渲染，并输出上一帧的绘制统计，用于对比性能
+            stats = self.render_batcher.get_stats()
+            print(f"上一帧绘制: 提交 {stats['submitted']} 个精灵, 裁剪 {stats['culled']} 个, "
+                  f"blit调用 {stats['blits_calls']} 次")
+            self.render_batcher.enabled = not self.render_batcher.enabled
+            print(f"批量渲染: {'开启' if self.render_batcher.enabled else '关闭'}")
+            return True
+        elif key == pygame.K_F5:
+            # 切换敌人更新的LOD，并输出上一帧各层级的敌人数量，用于对比性能
+            lod = self.enemy_manager.lod
+            stats = lod.get_stats()
+            print(f"上一帧敌人LOD: {stats['counts']}, 跳过更新 {stats['skipped']} 次")
+            lod.enabled = not lod.enabled
+            print(f"敌人LOD: {'开启' if lod.enabled else '关闭'}")
+            return True
+        elif key == pygame.K_F6:
+            # 切换数组结构的敌人模拟核心，用于对比性能
+            enemy_manager = self.enemy_manager
+            enemy_manager.set_soa_enabled(enemy_manager.soa_core is None)
+            print(f"敌人数组模拟: {'开启' if enemy_manager.soa_core is not None else '关闭'}")
+            return True
+        elif key == pygame.K_F7:
+            # 切换敌人生成的时间预算，并输出上一帧的生成统计，用于对比性能
+            director = self.enemy_manager.spawn_director
+            stats = director.get_stats()
+            print(f"上一帧生成: {stats['spawned']} 个敌人, 耗时 {stats['time_ms']:.2f} ms, "
+                  f"队列剩余 {stats['pending']} 个")
+            director.time_budget_ms = DEFAULT_TIME_BUDGET_MS if director.time_budget_ms is None else None
+            print(f"分帧生成: {'开启' if director.time_budget_ms is not None else '关闭'}")
+            return True
+        elif key == pygame.K_F8:
+            # 重新读取敌人配置，之后生成的敌人使用新的数值
+            if reload_enemy_configs(from_file=True):
+                print("敌人配置已重新加载")
+            return True
+        elif key == pygame.K_F9:
+            # 切换敌人数量上限和拴绳回收，并输出数量统计
+            population = self.enemy_manager.population
+            stats = population.get_stats(len(self.enemy_manager.enemies))
+            print(f"敌人数量: 当前 {stats['active']} 个, 最高 {stats['peak']} 个, "
+                  f"回收 {stats['recycled']} 次, 丢弃生成 {stats['culled']} 次")
+            if population.max_active is None:
+                population.set_limits()
+            else:
+                population.set_limits(None, None)
+            print(f"敌人数量限制: {'开启' if population.max_active is not None else '关闭'}")
+            return True
+        elif key == pygame.K_F10:
+            # 切换远处敌人群的聚合，并输出聚合统计，用于对比性能
+            horde = self.enemy_manager.horde
+            stats = horde.get_stats()
+            print(f"敌人群: {stats['proxies']} 个代理, 共 {stats['members']} 个敌人, "
+                  f"累计合并 {stats['merged']} 个, 拆分 {stats['split']} 次")
+            horde.enabled = not horde.enabled
+            print(f"敌人群聚合: {'开启' if horde.enabled else '关闭'}")
+            return True
+        return False
+        
     def _apply_upgrade(self, upgrade_level):
         """应用升级效果
         
@@ -539,17 +650,8 @@ class Game:
         
         # 更新其他游戏对象，注意检查player和enemy_manager是否存在
         if self.enemy_manager and self.player:
-            # 处理被状态效果（如燃烧）导致死亡的敌人
-            for enemy in list(self.enemy_manager.enemies):  # 使用列表复制避免在迭代时修改
-                if enemy in self.enemy_manager.enemies and not enemy.alive():
-                    self.kill_num += 1
-                    # 在敌人死亡位置生成物品，传递player对象以应用幸运值加成
-                    if self.item_manager:
-                        self.item_manager.spawn_item(enemy.rect.x, enemy.rect.y, enemy.type, self.player)
-                    # 敌人已经在enemy_manager.update()中被移除，无需再次移除
-            
             # 更新敌人和武器
-            self.enemy_manager.update(dt, self.player)
+            self.enemy_manager.update(dt, self.player, self.combat_events)
             self.player.update_weapons(dt, self.enemy_manager.enemies)
             
             # 更新物品
@@ -559,6 +661,9 @@ class Game:
             # 检测碰撞
             self._check_collisions()
             
+            # 统一结算本帧的命中、击杀和掉落
+            self.kill_num += self.combat_events.resolve(self.enemy_manager, self.item_manager, self.player)
+            
             # 检查是否可以升级
             if self.player.add_experience(0):  # 检查是否可以升级，不添加经验值
                 self.player.level_up()
@@ -598,23 +703,32 @@ class Game:
             # 如果没有地图，绘制网格作为背景
             self._draw_grid()
         
+        batcher = self.render_batcher
+        batcher.begin(self.screen)
+        
         # 确保游戏对象存在再渲染
         if self.enemy_manager:
             # 渲染游戏对象（考虑相机偏移）
             self.enemy_manager.render(self.screen, self.camera_x, self.camera_y, 
-                                   self.screen_center_x, self.screen_center_y)
+                                   self.screen_center_x, self.screen_center_y, batcher)
         
         if self.item_manager:
             self.item_manager.render(self.screen, self.camera_x, self.camera_y, 
-                                  self.screen_center_x, self.screen_center_y)
+                                  self.screen_center_x, self.screen_center_y, batcher)
+        
+        # 敌人和物品需要在玩家之前绘制
+        batcher.flush()
         
         # 渲染玩家（始终在屏幕中心）
         if self.player:
             self.player.render(self.screen)
-            self.player.render_weapons(self.screen, self.camera_x, self.camera_y)
+            self.player.render_weapons(self.screen, self.camera_x, self.camera_y, batcher)
+            batcher.end_frame()
             
             # 渲染UI
             self.ui.render(self.player, self.game_time, self.kill_num)
+        else:
+            batcher.end_frame()
             
         # 如果游戏暂停，渲染暂停菜单
         if self.paused:
@@ -657,61 +771,60 @@ class Game:
             return
             
         # 检测武器碰撞
+        # 粗检测按投射物的移动轨迹筛选出可能碰撞的敌人后再做像素级检测
+        grid = self.enemy_manager.spatial_grid
+        self.broad_phase.begin_frame(self.enemy_manager.enemies, grid)
         for weapon in self.player.weapons:
-            for projectile in weapon.get_projectiles():
-                for enemy in self.enemy_manager.enemies:
-                    # 首先使用矩形做快速检测
-                    # 计算世界坐标系中的距离
-                    dx = enemy.rect.x - projectile.world_x
-                    dy = enemy.rect.y - projectile.world_y
-                    distance = (dx**2 + dy**2)**0.5
-                    
-                    if distance < enemy.rect.width / 2 + projectile.rect.width / 2:
-                        # 进行更精确的像素级碰撞检测
-                        # 调整projectile的rect以匹配world坐标
-                        projectile_rect = projectile.rect.copy()
-                        projectile_rect.centerx = projectile.world_x
-                        projectile_rect.centery = projectile.world_y
+            projectiles = list(weapon.get_projectiles())
+            candidates = self.broad_phase.query(projectiles)
+            for projectile, enemies in zip(projectiles, candidates):
+                for enemy in enemies:
+                    # 跳过本帧已经死亡的敌人
+                    if not enemy.alive():
+                        continue
+                        
+                    # 沿投射物的移动轨迹进行像素级碰撞检测
+                    if swept_mask_collision(enemy, projectile):
+                        # 处理碰撞
+                        should_destroy = weapon.handle_collision(projectile, enemy, self.enemy_manager)
+                        # 记录命中，击中音效在帧末统一播放
+                        self.combat_events.record_hit(enemy)
                         
-                        if apply_mask_collision(enemy, projectile):
-                            # 处理碰撞
-                            should_destroy = weapon.handle_collision(projectile, enemy, self.enemy_manager.enemies)
-                            # 播放击中音效
-                            resource_manager.play_sound("hit")
+                        if enemy.health <= 0:
+                            # 记录击杀，敌人移除和物品掉落在帧末统一处理
+                            self.combat_events.record_kill(enemy)
                             
-                            if enemy.health <= 0:
-                                self.kill_num += 1
-                                # 在敌人死亡位置生成物品，传递player对象以应用幸运值加成
-                                if self.item_manager:
-                                    self.item_manager.spawn_item(enemy.rect.x, enemy.rect.y, enemy.type, self.player)
-                                self.enemy_manager.remove_enemy(enemy)
-                                # 播放敌人死亡音效
-                                resource_manager.play_sound("enemy_death")
-                                
-                            if should_destroy:
-                                projectile.kill()
+                        if should_destroy:
+                            projectile.kill()
+                            
+            # 下一次检测的移动轨迹从当前位置开始
+            for projectile in projectiles:
+                reset_sweep(projectile)
         
         # 检测玩家和敌人的碰撞
-        for enemy in self.enemy_manager.enemies:
-            if not self.player.invincible:  # 只在玩家不处于无敌状态时检测碰撞
-                # 首先进行矩形快速检测
-                player_rect = self.player.rect.copy()
-                player_rect.centerx = self.player.world_x
-                player_rect.centery = self.player.world_y
-                
-                # 对于Slime等远程攻击敌人，即使不直接碰撞也需要触发attack_player
-                # 这样才能正确生成投射物并处理碰撞逻辑
-                if hasattr(enemy, 'projectiles'):
-                    enemy.attack_player(self.player)
+        if self.player.invincible:  # 只在玩家不处于无敌状态时检测碰撞
+            return
+            
+        # 远程敌人（如Slime）即使不直接碰撞也需要触发攻击，由攻击调度器统一处理
+        self.enemy_manager.attack_scheduler.update(self.player)
+        if self.player.invincible:
+            return
+            
+        # 只检测与玩家矩形相交的敌人
+        player_rect = self.player.rect.copy()
+        player_rect.centerx = self.player.world_x
+        player_rect.centery = self.player.world_y
+        for enemy in self.enemy_manager.enemies_touching(player_rect):
+            # 本帧已经死亡、等待帧末移除的敌人不再攻击
+            if not enemy.alive():
+                continue
                 
-                # 对于直接碰撞的敌人，进行常规碰撞检测
-                if player_rect.colliderect(enemy.rect):
-                    # 进行像素级碰撞检测
-                    if apply_mask_collision(self.player, enemy):
-                        if enemy.attack_player(self.player):
-                            # 播放受伤音效
-                            resource_manager.play_sound("player_hurt")
-                            break  # 一次只处理一个碰撞
+            # 进行像素级碰撞检测
+            if apply_mask_collision(self.player, enemy):
+                if enemy.attack_player(self.player):
+                    # 播放受伤音效
+                    resource_manager.play_sound("player_hurt")
+                    break  # 一次只处理一个碰撞
         
     def _update_game_state(self):
         # 获取当前等级
@@ -1,5 +1,6 @@
 import pygame
 from ..resource_manager import resource_manager
+from ..render_batch import LAYER_ITEMS
 
 class Item(pygame.sprite.Sprite):
     def __init__(self, x, y, item_type):
@@ -96,4 +97,16 @@ class Item(pygame.sprite.Sprite):
         screen_y = screen_center_y + (self.world_y - camera_y)
         self.rect.center = (screen_x, screen_y)
         
-        screen.blit(self.image, self.rect) 
\ No newline at end of file
+        screen.blit(self.image, self.rect)
+        
+    def queue_render(self, batcher, camera_x, camera_y, screen_center_x, screen_center_y):
+        """把物品添加到批量渲染器"""
+        if self.collected:
+            return
+            
+        # 计算屏幕位置
+        screen_x = screen_center_x + (self.world_x - camera_x)
+        screen_y = screen_center_y + (self.world_y - camera_y)
+        self.rect.center = (screen_x, screen_y)
+        
+        batcher.add(LAYER_ITEMS, self.image, self.rect.topleft)
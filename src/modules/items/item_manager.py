@@ -10,23 +10,45 @@ class ItemManager:
         self.base_health_drop_rate = 0.05  # 5%概率掉落医疗包
         
     def spawn_item(self, x, y, enemy_type=None, player=None):
+        self.items.extend(self._roll_drops(x, y, enemy_type, player))
+        
+    def spawn_items(self, drops, player=None):
+        """批量生成掉落物品
+        
+        Args:
+            drops: [(x, y, enemy_type), ...] 掉落位置和敌人类型列表
+            player: 玩家对象，用于幸运值加成
+        """
+        new_items = []
+        for x, y, enemy_type in drops:
+            new_items.extend(self._roll_drops(x, y, enemy_type, player))
+        self.items.extend(new_items)
+        
+    def _roll_drops(self, x, y, enemy_type=None, player=None):
+        """计算一个敌人的掉落物品
+        
+        Returns:
+            list: 掉落的物品列表
+        """
         # 必定掉落经验球
-        self.items.append(Item(x, y, 'exp'))
+        drops = [Item(x, y, 'exp')]
 
         # 如果是boss，必定掉落宝箱
         if enemy_type == 'bat':
-            self.items.append(Item(x, y, 'chest'))
-            return
+            drops.append(Item(x, y, 'chest'))
+            return drops
         
         # 如果没有提供player参数，使用基础掉落概率
         luck_multiplier = player.luck if player else 1.0
         
         # 随机掉落其他物品，受幸运值影响
         if random.random() < self.base_coin_drop_rate * luck_multiplier:  # 受幸运值加成的金币掉落概率
-            self.items.append(Item(x + random.randint(-10, 10), y + random.randint(-10, 10), 'coin'))
+            drops.append(Item(x + random.randint(-10, 10), y + random.randint(-10, 10), 'coin'))
             
         if random.random() < self.base_health_drop_rate * luck_multiplier:  # 受幸运值加成的医疗包掉落概率
-            self.items.append(Item(x + random.randint(-10, 10), y + random.randint(-10, 10), 'health'))
+            drops.append(Item(x + random.randint(-10, 10), y + random.randint(-10, 10), 'health'))
+            
+        return drops
             
     def update(self, dt, player):
         for item in self.items[:]:  # 使用切片创建副本以避免在迭代时修改列表
@@ -34,6 +56,16 @@ class ItemManager:
             if item.collected:
                 self.items.remove(item)
                 
-    def render(self, screen, camera_x, camera_y, screen_center_x, screen_center_y):
+    def render(self, screen, camera_x, camera_y, screen_center_x, screen_center_y, batcher=None):
+        """渲染物品
+        
+        Args:
+            batcher: RenderBatcher实例，提供时只收集绘制内容，由调用方统一提交
+        """
+        if batcher is not None:
+            for item in self.items:
+                item.queue_render(batcher, camera_x, camera_y, screen_center_x, screen_center_y)
+            return
+            
         for item in self.items:
-            item.render(screen, camera_x, camera_y, screen_center_x, screen_center_y) 
\ No newline at end of file
+            item.render(screen, camera_x, camera_y, screen_center_x, screen_center_y)
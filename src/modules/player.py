@@ -38,6 +38,7 @@ class Player(pygame.sprite.Sprite):
         
         # 创建遮罩
         self.mask = None
+        self.image_flipped = False
         self.update_mask()
         
         # 轮廓相关
@@ -199,14 +200,15 @@ class Player(pygame.sprite.Sprite):
         self._update_animation_state()
         
         # 更新当前图像
-        self.image = self.animation.get_current_frame(not self.movement.facing_right)
+        self.image_flipped = not self.movement.facing_right
+        self.image = self.animation.get_current_frame(self.image_flipped)
         
         # 更新遮罩
         self.update_mask()
         
     def update_mask(self):
-        """更新精灵遮罩"""
-        self.mask = pygame.mask.from_surface(self.image)
+        """更新精灵遮罩（从遮罩缓存中获取当前帧的遮罩）"""
+        self.mask = self.animation.get_current_mask(self.image_flipped, self.image)
         
     def toggle_outline(self, show=None, color=None, thickness=None):
         """
@@ -284,9 +286,9 @@ class Player(pygame.sprite.Sprite):
         """更新所有武器状态"""
         self.weapon_manager.update(dt, enemies)
         
-    def render_weapons(self, screen, camera_x, camera_y):
+    def render_weapons(self, screen, camera_x, camera_y, batcher=None):
         """渲染所有武器"""
-        self.weapon_manager.render(screen, camera_x, camera_y)
+        self.weapon_manager.render(screen, camera_x, camera_y, batcher)
         
     def remove_weapon(self, weapon_type):
         """移除指定类型的武器"""
@@ -0,0 +1,146 @@
+"""
+对象池
+敌人和投射物在死亡后放回对象池，下次生成同类对象时取出并重新初始化，
+避免频繁创建和丢弃对象带来的内存分配和垃圾回收开销。
+"""
+
+
+class ObjectPool:
+    """单一类型对象的对象池
+
+    池中的对象需要实现reset方法，参数与构造函数相同，
+    取出已有对象时会调用reset用新的参数重新初始化。
+    """
+
+    def __init__(self, factory, max_size=256):
+        """
+        Args:
+            factory: 创建新对象的可调用对象（通常是类本身）
+            max_size: 池中最多保留的空闲对象数量，超出时放回的对象直接丢弃
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+        self._free_ids = set()  # 防止同一个对象被重复放回
+
+        # 统计数据
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+
+    def acquire(self, *args, **kwargs):
+        """
+        取出一个对象，池为空时创建新对象
+
+        Returns:
+            取出并完成初始化的对象
+        """
+        if self._free:
+            obj = self._free.pop()
+            self._free_ids.discard(id(obj))
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+
+        self.created += 1
+        return self.factory(*args, **kwargs)
+
+    def release(self, obj):
+        """
+        把不再使用的对象放回池中
+
+        Args:
+            obj: 要放回的对象
+
+        Returns:
+            bool: 是否放回了池中（重复放回或池已满时返回False）
+        """
+        if id(obj) in self._free_ids:
+            return False
+        if len(self._free) >= self.max_size:
+            self.dropped += 1
+            return False
+
+        self._free.append(obj)
+        self._free_ids.add(id(obj))
+        self.released += 1
+        return True
+
+    def get_stats(self):
+        """
+        获取对象池的统计数据
+
+        Returns:
+            dict: 包含created、reused、released、dropped和free（当前空闲数量）的字典
+        """
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'dropped': self.dropped,
+            'free': len(self._free)
+        }
+
+    def clear(self):
+        """丢弃所有空闲对象"""
+        self._free.clear()
+        self._free_ids.clear()
+
+
+class PoolRegistry:
+    """按键管理所有对象池"""
+
+    def __init__(self):
+        self.pools = {}  # {key: ObjectPool}
+
+    def get_pool(self, key, factory, max_size=256):
+        """
+        获取对象池，不存在时创建
+
+        Args:
+            key: 对象池的键，如 ('enemy', 'ghost')
+            factory: 创建新对象的可调用对象，仅在首次创建对象池时使用
+            max_size: 池中最多保留的空闲对象数量，仅在首次创建对象池时使用
+
+        Returns:
+            ObjectPool: 对象池
+        """
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = ObjectPool(factory, max_size)
+            self.pools[key] = pool
+        return pool
+
+    def release(self, key, obj):
+        """
+        把对象放回指定的对象池，对象池不存在时忽略
+
+        Args:
+            key: 对象池的键
+            obj: 要放回的对象
+
+        Returns:
+            bool: 是否放回了池中
+        """
+        pool = self.pools.get(key)
+        if pool is None:
+            return False
+        return pool.release(obj)
+
+    def get_stats(self):
+        """
+        获取所有对象池的统计数据
+
+        Returns:
+            dict: {key: 对象池统计}
+        """
+        return {key: pool.get_stats() for key, pool in self.pools.items()}
+
+    def clear(self):
+        """清空所有对象池"""
+        self.pools.clear()
+
+
+# 全局对象池
+pools = PoolRegistry()
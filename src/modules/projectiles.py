@@ -0,0 +1,121 @@
+"""
+紧凑的投射物表示
+投射物数量会随着每次施放的投射物数量升级成倍增长，这里用__slots__代替每个对象的__dict__，
+并用轻量的ProjectileGroup代替pygame.sprite.Group，减少内存占用以及加入、移除和遍历的开销。
+"""
+
+
+class Projectile:
+    """投射物基类
+
+    接口与pygame.sprite.Sprite中投射物用到的部分保持一致（kill、alive、update），
+    子类需要在__slots__中声明自己的全部属性。每个投射物同一时间只属于一个ProjectileGroup。
+    """
+
+    __slots__ = ('_group',)
+
+    def __init__(self):
+        self._group = None
+
+    def kill(self):
+        """从所属的ProjectileGroup中移除"""
+        if self._group is not None:
+            self._group.remove(self)
+
+    def alive(self):
+        """
+        是否仍属于某个ProjectileGroup
+
+        Returns:
+            bool: 属于某个ProjectileGroup时返回True
+        """
+        return self._group is not None
+
+    def update(self, *args, **kwargs):
+        """更新投射物状态，子类实现"""
+        pass
+
+
+class ProjectileGroup:
+    """投射物容器，代替pygame.sprite.Group
+
+    内部使用保持插入顺序的字典，遍历顺序与pygame.sprite.Group相同，
+    移除（kill）为O(1)且不改变其余投射物的顺序。
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, *projectiles):
+        """
+        Args:
+            projectiles: 初始加入的投射物
+        """
+        self._items = {}
+        self.add(*projectiles)
+
+    def add(self, *projectiles):
+        """
+        加入投射物，已属于其他容器的投射物会先从原容器移除
+
+        Args:
+            projectiles: 要加入的投射物
+        """
+        items = self._items
+        for projectile in projectiles:
+            group = projectile._group
+            if group is self:
+                continue
+            if group is not None:
+                group.remove(projectile)
+            items[projectile] = None
+            projectile._group = self
+
+    def remove(self, *projectiles):
+        """
+        移除投射物（不会放回对象池）
+
+        Args:
+            projectiles: 要移除的投射物
+        """
+        items = self._items
+        for projectile in projectiles:
+            if projectile in items:
+                del items[projectile]
+                projectile._group = None
+
+    def has(self, projectile):
+        """是否包含指定的投射物"""
+        return projectile in self._items
+
+    def sprites(self):
+        """
+        获取所有投射物
+
+        Returns:
+            list: 投射物列表的副本
+        """
+        return list(self._items)
+
+    def update(self, *args, **kwargs):
+        """调用所有投射物的update，过程中被移除的投射物仍会完成本次更新（与pygame.sprite.Group一致）"""
+        for projectile in list(self._items):
+            projectile.update(*args, **kwargs)
+
+    def empty(self):
+        """移除所有投射物"""
+        for projectile in self._items:
+            projectile._group = None
+        self._items.clear()
+
+    def __iter__(self):
+        # 遍历副本，遍历过程中可以安全地移除投射物
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, projectile):
+        return projectile in self._items
+
+    def __bool__(self):
+        return bool(self._items)
@@ -0,0 +1,129 @@
+"""
+批量渲染
+世界中的精灵（敌人、物品、投射物、特效）不再逐个调用screen.blit，而是先把已经完成
+屏幕裁剪的 (Surface, 位置) 收集起来，再按图层顺序用Surface.blits一次性提交。
+"""
+
+# 图层（数值小的先绘制）
+LAYER_ENEMIES = 0
+LAYER_ENEMY_OVERLAY = 1  # 敌人血条等叠加在敌人上方的内容
+LAYER_ITEMS = 2
+LAYER_PROJECTILES = 3
+LAYER_EFFECTS = 4
+
+
+class RenderBatcher:
+    """按图层收集精灵并批量绘制到屏幕
+
+    每帧的使用方式：begin(screen) -> add() -> flush()（可多次，
+    用于在两批之间插入玩家等直接绘制的内容）-> end_frame()。
+    """
+
+    def __init__(self, cull_margin=0):
+        """
+        Args:
+            cull_margin: 裁剪时屏幕四周额外保留的像素
+        """
+        self.cull_margin = cull_margin
+        self.enabled = True  # 关闭时add会立即绘制，用于对比性能
+
+        self.screen = None
+        self.center_x = 0
+        self.center_y = 0
+        self._min_x = 0
+        self._min_y = 0
+        self._max_x = 0
+        self._max_y = 0
+
+        self._layers = {}  # {图层: [(Surface, 位置), ...]}
+
+        # 当前帧的统计数据
+        self.submitted = 0
+        self.culled = 0
+        self.blits_calls = 0
+
+        # 上一帧的统计数据
+        self.last_stats = {'submitted': 0, 'culled': 0, 'blits_calls': 0}
+
+    def begin(self, screen):
+        """
+        开始新的一帧
+
+        Args:
+            screen: 目标Surface
+        """
+        self.screen = screen
+        width, height = screen.get_size()
+        self.center_x = width // 2
+        self.center_y = height // 2
+        self._min_x = -self.cull_margin
+        self._min_y = -self.cull_margin
+        self._max_x = width + self.cull_margin
+        self._max_y = height + self.cull_margin
+
+        self._layers.clear()
+        self.submitted = 0
+        self.culled = 0
+        self.blits_calls = 0
+
+    def add(self, layer, surface, dest):
+        """
+        添加一个精灵，完全位于屏幕外时直接丢弃
+
+        Args:
+            layer: 图层
+            surface: 要绘制的Surface
+            dest: 屏幕坐标系中的左上角位置 (x, y)
+
+        Returns:
+            bool: 是否在屏幕内（未被裁剪）
+        """
+        x, y = dest
+        width, height = surface.get_size()
+        if x >= self._max_x or y >= self._max_y or x + width <= self._min_x or y + height <= self._min_y:
+            self.culled += 1
+            return False
+
+        self.submitted += 1
+        if not self.enabled:
+            self.screen.blit(surface, dest)
+            self.blits_calls += 1
+            return True
+
+        batch = self._layers.get(layer)
+        if batch is None:
+            self._layers[layer] = [(surface, dest)]
+        else:
+            batch.append((surface, dest))
+        return True
+
+    def flush(self):
+        """按图层顺序绘制目前收集到的所有内容"""
+        if not self._layers:
+            return
+
+        screen = self.screen
+        for layer in sorted(self._layers):
+            screen.blits(self._layers[layer], doreturn=False)
+            self.blits_calls += 1
+
+        self._layers.clear()
+
+    def end_frame(self):
+        """绘制剩余内容并记录本帧的统计数据"""
+        self.flush()
+        self.last_stats = {
+            'submitted': self.submitted,
+            'culled': self.culled,
+            'blits_calls': self.blits_calls
+        }
+
+    def get_stats(self):
+        """
+        获取上一帧的绘制统计
+
+        Returns:
+            dict: 包含submitted（提交的精灵数）、culled（被裁剪的精灵数）
+                  和blits_calls（blit/blits调用次数）的字典
+        """
+        return dict(self.last_stats)
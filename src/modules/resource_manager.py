@@ -1,4 +1,5 @@
 import os
+import weakref
 import pygame
 
 class SpriteSheet:
@@ -22,22 +23,72 @@ class SpriteSheet:
         sprite.blit(self.sheet, (0, 0), (x, y, width, height))
         return sprite
 
-class Animation:
-    """动画类，用于管理一组帧的播放"""
-    def __init__(self, frames, frame_duration=0.1, loop=True):
+class AnimationClip:
+    """不可变的动画片段
+
+    保存从精灵表切分出的帧和播放参数，同一个片段被所有使用它的实体共享，
+    每个实体只持有自己的播放进度（Animation）。
+    """
+    __slots__ = ('name', 'frames', 'frame_duration', 'loop')
+
+    def __init__(self, name, frames, frame_duration=0.1, loop=True):
         """
         Args:
+            name: 动画名称，用于缓存查找
             frames: 帧列表
             frame_duration: 每帧持续时间(秒)
             loop: 是否循环播放
         """
-        self.frames = frames
-        self.frame_duration = frame_duration
-        self.loop = loop
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'frames', tuple(frames))
+        object.__setattr__(self, 'frame_duration', frame_duration)
+        object.__setattr__(self, 'loop', loop)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("动画片段不可修改")
+
+    def __len__(self):
+        return len(self.frames)
+
+    def create_playhead(self):
+        """创建一个从第一帧开始播放该片段的播放进度"""
+        return Animation(self)
+
+class Animation:
+    """动画播放进度，记录当前帧和计时器，帧数据来自共享的动画片段"""
+    __slots__ = ('clip', 'current_frame', 'timer', 'finished')
+
+    def __init__(self, frames, frame_duration=0.1, loop=True, name=None):
+        """
+        Args:
+            frames: 共享的动画片段（AnimationClip），或帧列表（此时创建一个新的片段）
+            frame_duration: 每帧持续时间(秒)，仅在传入帧列表时使用
+            loop: 是否循环播放，仅在传入帧列表时使用
+            name: 动画名称，仅在传入帧列表时使用
+        """
+        if not isinstance(frames, AnimationClip):
+            frames = AnimationClip(name, frames, frame_duration, loop)
+        self.clip = frames
         self.current_frame = 0
         self.timer = 0
         self.finished = False
 
+    @property
+    def name(self):
+        return self.clip.name
+
+    @property
+    def frames(self):
+        return self.clip.frames
+
+    @property
+    def frame_duration(self):
+        return self.clip.frame_duration
+
+    @property
+    def loop(self):
+        return self.clip.loop
+
     def update(self, dt):
         """更新动画状态
         
@@ -47,20 +98,21 @@ class Animation:
         if self.finished:
             return
 
+        clip = self.clip
         self.timer += dt
-        if self.timer >= self.frame_duration:
+        if self.timer >= clip.frame_duration:
             self.timer = 0
             self.current_frame += 1
-            if self.current_frame >= len(self.frames):
-                if self.loop:
+            if self.current_frame >= len(clip.frames):
+                if clip.loop:
                     self.current_frame = 0
                 else:
-                    self.current_frame = len(self.frames) - 1
+                    self.current_frame = len(clip.frames) - 1
                     self.finished = True
 
     def get_current_frame(self):
         """获取当前帧"""
-        return self.frames[self.current_frame]
+        return self.clip.frames[self.current_frame]
 
     def reset(self):
         """重置动画状态"""
@@ -68,6 +120,85 @@ class Animation:
         self.timer = 0
         self.finished = False
 
+class MaskCache:
+    """碰撞遮罩缓存
+
+    动画帧来自固定的精灵表，同一帧在相同缩放和翻转下的遮罩总是相同的，
+    因此每个 (动画, 帧序号, 缩放, 翻转) 组合只需要计算一次遮罩。
+    """
+    def __init__(self):
+        self.masks = {}  # {(clip, frame_index, scale, flip, variant): Mask}
+        self.surface_masks = weakref.WeakKeyDictionary()  # 按Surface对象缓存的遮罩
+        self.hits = 0
+        self.misses = 0
+
+    def get_frame_mask(self, clip, frame_index, scale, flip, surface, variant=None):
+        """获取动画帧的遮罩，未缓存时根据surface计算
+        
+        Args:
+            clip: 动画名称
+            frame_index: 帧序号
+            scale: 缩放系数
+            flip: 是否水平翻转
+            surface: 该帧对应的图像，仅在缓存未命中时使用
+            variant: 额外的图像变体标识（如状态效果），None表示原始帧
+            
+        Returns:
+            pygame.mask.Mask: 帧遮罩
+        """
+        key = (clip, frame_index, scale, flip, variant)
+        mask = self.masks.get(key)
+        if mask is None:
+            self.misses += 1
+            mask = pygame.mask.from_surface(surface)
+            self.masks[key] = mask
+        else:
+            self.hits += 1
+        return mask
+
+    def get_surface_mask(self, surface):
+        """获取任意Surface的遮罩，Surface被释放后缓存自动失效
+        
+        Args:
+            surface: 图像
+            
+        Returns:
+            pygame.mask.Mask: 图像遮罩
+        """
+        mask = self.surface_masks.get(surface)
+        if mask is None:
+            self.misses += 1
+            mask = pygame.mask.from_surface(surface)
+            self.surface_masks[surface] = mask
+        else:
+            self.hits += 1
+        return mask
+
+    def get_stats(self):
+        """获取缓存统计信息
+        
+        Returns:
+            dict: 命中数、未命中数、命中率和缓存数量
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self.masks) + len(self.surface_masks)
+        }
+
+    def reset_stats(self):
+        """重置命中统计"""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """清空缓存和统计"""
+        self.masks.clear()
+        self.surface_masks.clear()
+        self.reset_stats()
+
 class ResourceManager:
     """资源管理器类,用于统一管理游戏资源"""
     
@@ -76,7 +207,10 @@ class ResourceManager:
         self.sounds = {}  # 存储音效资源
         self.music = {}   # 存储音乐资源
         self.fonts = {}   # 存储字体资源
-        self.animations = {}  # 存储动画资源
+        self.animations = {}  # 存储动画资源 {动画名称: AnimationClip}
+        self.clips = {}  # 按切分参数缓存的动画片段
+        self.rotated_images = {}  # {(图片名称, 角度): 旋转后的Surface}
+        self.mask_cache = MaskCache()  # 碰撞遮罩缓存
         
         # 资源根目录，使用规范化的路径
         current_file = os.path.abspath(__file__)
@@ -275,6 +409,40 @@ class ResourceManager:
         image = self.load_image(name, file_path)
         return SpriteSheet(image)
 
+    def create_clip(self, name: str, spritesheet: SpriteSheet,
+                    frame_width: int, frame_height: int,
+                    frame_count: int, row: int = 0,
+                    col: int = 0,
+                    frame_duration: float = 0.1, loop: bool = True) -> AnimationClip:
+        """从精灵表创建共享的动画片段，相同参数只切分一次
+        
+        Args:
+            name: 动画名称
+            spritesheet: 精灵表对象
+            frame_width: 每帧宽度
+            frame_height: 每帧高度
+            frame_count: 帧数量
+            row: 精灵表中的行号(从0开始)
+            col: 精灵表中的起始列号(从0开始)
+            frame_duration: 每帧持续时间
+            loop: 是否循环播放
+            
+        Returns:
+            AnimationClip: 动画片段
+        """
+        key = (name, spritesheet.sheet, frame_width, frame_height, frame_count, row, col, frame_duration, loop)
+        clip = self.clips.get(key)
+        if clip is None:
+            frames = []
+            for i in range(frame_count):
+                frame = spritesheet.get_sprite((col + i) * frame_width, row * frame_height, 
+                                             frame_width, frame_height)
+                frames.append(frame)
+            clip = AnimationClip(name, frames, frame_duration, loop)
+            self.clips[key] = clip
+            self.animations[name] = clip
+        return clip
+
     def create_animation(self, name: str, spritesheet: SpriteSheet, 
                         frame_width: int, frame_height: int, 
                         frame_count: int, row: int = 0,
@@ -282,6 +450,9 @@ class ResourceManager:
                         frame_duration: float = 0.1, loop: bool = True) -> Animation:
         """从精灵表创建动画
         
+        帧数据来自共享的动画片段，只在第一次创建时切分精灵表，
+        返回的Animation只记录该实例自己的播放进度。
+        
         Args:
             name: 动画名称
             spritesheet: 精灵表对象
@@ -296,15 +467,55 @@ class ResourceManager:
         Returns:
             Animation: 动画对象
         """
-        frames = []
-        for i in range(frame_count):
-            frame = spritesheet.get_sprite((col + i) * frame_width, row * frame_height, 
-                                         frame_width, frame_height)
-            frames.append(frame)
+        clip = self.create_clip(name, spritesheet, frame_width, frame_height, frame_count,
+                                row, col, frame_duration, loop)
+        return clip.create_playhead()
+
+    def get_frame_mask(self, clip: str, frame_index: int, scale: float, flip: bool,
+                       surface: pygame.Surface, variant=None) -> pygame.mask.Mask:
+        """获取动画帧的碰撞遮罩（带缓存）
+        
+        Args:
+            clip: 动画名称
+            frame_index: 帧序号
+            scale: 缩放系数
+            flip: 是否水平翻转
+            surface: 该帧对应的图像，仅在缓存未命中时使用
+            variant: 额外的图像变体标识，None表示原始帧
+            
+        Returns:
+            pygame.mask.Mask: 帧遮罩
+        """
+        return self.mask_cache.get_frame_mask(clip, frame_index, scale, flip, surface, variant)
+        
+    def get_surface_mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """获取任意图像的碰撞遮罩（按Surface对象缓存）
+        
+        Args:
+            surface: 图像
+            
+        Returns:
+            pygame.mask.Mask: 图像遮罩
+        """
+        return self.mask_cache.get_surface_mask(surface)
+
+    def get_rotated_image(self, name: str, image: pygame.Surface, angle: float) -> pygame.Surface:
+        """获取旋转后的图片（按整数角度缓存）
         
-        animation = Animation(frames, frame_duration, loop)
-        self.animations[name] = animation
-        return animation
+        Args:
+            name: 图片名称，用于区分不同的原始图片
+            image: 原始图片，仅在缓存未命中时使用
+            angle: 逆时针旋转的角度，四舍五入到整数度
+            
+        Returns:
+            pygame.Surface: 共享的旋转后图片（不要修改）
+        """
+        key = (name, round(angle) % 360)
+        rotated = self.rotated_images.get(key)
+        if rotated is None:
+            rotated = pygame.transform.rotate(image, key[1])
+            self.rotated_images[key] = rotated
+        return rotated
 
     def get_animation(self, name: str) -> Animation:
         """获取已加载的动画
@@ -313,12 +524,12 @@ class ResourceManager:
             name: 动画名称
             
         Returns:
-            Animation: 动画对象
+            Animation: 从第一帧开始播放该动画片段的新动画对象
         """
         if name not in self.animations:
             print(f"动画 {name} 未加载")
             return None
-        return self.animations[name]
+        return self.animations[name].create_playhead()
             
     def clear(self):
         """清除所有已加载的资源"""
@@ -327,6 +538,9 @@ class ResourceManager:
         self.music.clear()
         self.fonts.clear()
         self.animations.clear()
+        self.clips.clear()
+        self.rotated_images.clear()
+        self.mask_cache.clear()
 
     def _init_resources(self):
         """初始化游戏所需的资源"""
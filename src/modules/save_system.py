@@ -62,12 +62,12 @@ class SaveSystem:
             },
             'enemies_data': [
                 {
-                    'type': enemy.__class__.__name__,
+                    'type': enemy.type,
                     'health': enemy.health,
                     'x': enemy.rect.x,
                     'y': enemy.rect.y
                 }
-                for enemy in game_state.enemy_manager.enemies
+                for enemy in game_state.enemy_manager.all_enemies()
             ]
         }
         
@@ -1,5 +1,9 @@
 import pygame
 import os
+import weakref
+import numpy as np
+from collections import namedtuple
+from .resource_manager import resource_manager
 
 class FontManager:
     @staticmethod
@@ -72,24 +76,43 @@ def create_default_knife_image():
     
     return file_path 
 
-def pixel_perfect_collision(surface1, rect1, surface2, rect2):
+# 像素重叠检测结果：是否碰撞、重叠像素数量、重叠区域质心（世界坐标，无重叠时为None）
+PixelOverlap = namedtuple('PixelOverlap', ['collided', 'count', 'centroid'])
+
+def pixel_overlap(surface1, rect1, surface2, rect2, threshold=127):
     """
-    实现基于像素的精确碰撞检测
+    计算两个对象不透明像素的重叠情况
     
     Args:
         surface1: 第一个对象的Surface
         rect1: 第一个对象的矩形位置
         surface2: 第二个对象的Surface
         rect2: 第二个对象的矩形位置
+        threshold: Alpha通道阈值，大于此值的像素被认为是不透明的
         
     Returns:
-        bool: 如果两个对象在像素级别发生碰撞则返回True
+        PixelOverlap: 重叠像素数量和质心，可用于计算击退方向
     """
+    alpha1, alpha2, overlap_rect = _overlap_alpha(surface1, rect1, surface2, rect2)
+    if alpha1 is None:
+        return PixelOverlap(False, 0, None)
+    
+    overlap = (alpha1 > threshold) & (alpha2 > threshold)
+    xs, ys = np.nonzero(overlap)
+    count = len(xs)
+    if count == 0:
+        return PixelOverlap(False, 0, None)
+    
+    centroid = (overlap_rect.x + float(xs.mean()), overlap_rect.y + float(ys.mean()))
+    return PixelOverlap(True, count, centroid)
+
+def _overlap_alpha(surface1, rect1, surface2, rect2):
+    """获取两个对象重叠区域的alpha数组，无重叠时返回(None, None, None)"""
     # 计算重叠区域
     overlap_rect = rect1.clip(rect2)
     
     if overlap_rect.width == 0 or overlap_rect.height == 0:
-        return False
+        return None, None, None
     
     # 计算重叠区域在每个表面上的坐标
     offset_1 = (overlap_rect.x - rect1.x, overlap_rect.y - rect1.y)
@@ -101,19 +124,35 @@ def pixel_perfect_collision(surface1, rect1, surface2, rect2):
         subsurface2 = surface2.subsurface((offset_2[0], offset_2[1], overlap_rect.width, overlap_rect.height))
     except ValueError:
         # 如果无法创建子表面，可能是因为重叠区域位于表面之外
-        return False
+        return None, None, None
     
     # 获取重叠区域的像素数组
-    pixels1 = pygame.surfarray.array_alpha(subsurface1)
-    pixels2 = pygame.surfarray.array_alpha(subsurface2)
+    return pygame.surfarray.array_alpha(subsurface1), pygame.surfarray.array_alpha(subsurface2), overlap_rect
+
+def pixel_perfect_collision(surface1, rect1, surface2, rect2, return_details=False):
+    """
+    实现基于像素的精确碰撞检测
     
-    # 检查是否有重叠的非透明像素
-    for x in range(overlap_rect.width):
-        for y in range(overlap_rect.height):
-            if pixels1[x, y] > 127 and pixels2[x, y] > 127:
-                return True
+    Args:
+        surface1: 第一个对象的Surface
+        rect1: 第一个对象的矩形位置
+        surface2: 第二个对象的Surface
+        rect2: 第二个对象的矩形位置
+        return_details: 是否返回重叠像素数量和质心
+        
+    Returns:
+        bool: 如果两个对象在像素级别发生碰撞则返回True
+        当return_details为True时返回PixelOverlap
+    """
+    if return_details:
+        return pixel_overlap(surface1, rect1, surface2, rect2)
+    
+    alpha1, alpha2, _ = _overlap_alpha(surface1, rect1, surface2, rect2)
+    if alpha1 is None:
+        return False
     
-    return False
+    # 检查是否有重叠的非透明像素
+    return bool(np.logical_and(alpha1 > 127, alpha2 > 127).any())
 
 def create_mask_from_surface(surface, threshold=127):
     """
@@ -139,11 +178,11 @@ def apply_mask_collision(sprite1, sprite2):
     Returns:
         bool: 如果遮罩碰撞则返回True，否则返回False
     """
-    # 为精灵创建遮罩(如果尚未创建)
+    # 为精灵获取遮罩(如果尚未创建)，从遮罩缓存中查找，避免重复计算
     if not hasattr(sprite1, 'mask') or sprite1.mask is None:
-        sprite1.mask = create_mask_from_surface(sprite1.image)
+        sprite1.mask = resource_manager.get_surface_mask(sprite1.image)
     if not hasattr(sprite2, 'mask') or sprite2.mask is None:
-        sprite2.mask = create_mask_from_surface(sprite2.image)
+        sprite2.mask = resource_manager.get_surface_mask(sprite2.image)
     
     # 计算偏移量
     offset = (
@@ -154,6 +193,23 @@ def apply_mask_collision(sprite1, sprite2):
     # 检测遮罩碰撞
     return sprite1.mask.overlap(sprite2.mask, offset) is not None
 
+def dilate_mask(mask, thickness):
+    """
+    按正方形范围扩大遮罩（每个不透明像素向四周扩展thickness个像素）
+    
+    通过与实心正方形遮罩做卷积完成，结果大小与原遮罩相同
+    
+    Args:
+        mask: 源遮罩
+        thickness: 扩展的像素数
+        
+    Returns:
+        pygame.mask.Mask: 扩大后的新遮罩
+    """
+    size = thickness * 2 + 1
+    kernel = pygame.mask.Mask((size, size), fill=True)
+    return mask.convolve(kernel, pygame.mask.Mask(mask.get_size()), (-thickness, -thickness))
+
 def extract_sprite_outline(surface, outline_color=(255, 0, 0), outline_thickness=1):
     """
     提取精灵图像的轮廓并创建带轮廓的新图像
@@ -174,25 +230,12 @@ def extract_sprite_outline(surface, outline_color=(255, 0, 0), outline_thickness
         outline_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA).convert_alpha()
         outline_surface.fill((0, 0, 0, 0))
     
-    # 创建遮罩并提取轮廓
+    # 创建遮罩并扩大遮罩以创建轮廓
     mask = create_mask_from_surface(surface)
-    outline_mask = pygame.mask.Mask(mask.get_size())
-    
-    # 扩大遮罩以创建轮廓
-    for x in range(mask.get_size()[0]):
-        for y in range(mask.get_size()[1]):
-            if mask.get_at((x, y)):
-                for dx in range(-outline_thickness, outline_thickness + 1):
-                    for dy in range(-outline_thickness, outline_thickness + 1):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < mask.get_size()[0] and 0 <= ny < mask.get_size()[1]:
-                            outline_mask.set_at((nx, ny), 1)
+    outline_mask = dilate_mask(mask, outline_thickness)
     
     # 保留轮廓而移除原始形状区域
-    for x in range(mask.get_size()[0]):
-        for y in range(mask.get_size()[1]):
-            if mask.get_at((x, y)):
-                outline_mask.set_at((x, y), 0)
+    outline_mask.erase(mask, (0, 0))
     
     # 将轮廓绘制到新表面
     outline_surface_tmp = outline_mask.to_surface(setcolor=outline_color)
@@ -204,10 +247,16 @@ def extract_sprite_outline(surface, outline_color=(255, 0, 0), outline_thickness
     
     return outline_surface
 
+# 带轮廓图像的缓存 {源Surface: {(轮廓颜色, 轮廓粗细): 带轮廓的Surface}}
+# 以源Surface为弱引用键，源图像被释放后对应的缓存会自动移除
+_outline_cache = weakref.WeakKeyDictionary()
+
 def create_outlined_sprite(sprite, outline_color=(255, 0, 0), outline_thickness=1):
     """
     为精灵添加可见轮廓
     
+    同一帧图像、颜色和粗细的轮廓只生成一次，返回的Surface会被共享，使用方不能修改
+    
     Args:
         sprite: 精灵对象(需要有image属性)
         outline_color: 轮廓颜色(R,G,B)
@@ -220,11 +269,20 @@ def create_outlined_sprite(sprite, outline_color=(255, 0, 0), outline_thickness=
     if not hasattr(sprite, 'image') or sprite.image is None:
         return None
     
-    # 创建轮廓图像
-    outlined_image = extract_sprite_outline(
-        sprite.image,
-        outline_color=outline_color,
-        outline_thickness=outline_thickness
-    )
+    variants = _outline_cache.get(sprite.image)
+    if variants is None:
+        variants = {}
+        _outline_cache[sprite.image] = variants
+    
+    key = (tuple(outline_color), outline_thickness)
+    outlined_image = variants.get(key)
+    if outlined_image is None:
+        # 创建轮廓图像
+        outlined_image = extract_sprite_outline(
+            sprite.image,
+            outline_color=outline_color,
+            outline_thickness=outline_thickness
+        )
+        variants[key] = outlined_image
     
-    return outlined_image 
\ No newline at end of file
+    return outlined_image
@@ -0,0 +1,195 @@
+"""
+目标查询服务
+每帧根据敌人位置建立一次索引，供所有需要追踪目标的武器共享
+"""
+
+import math
+
+
+class TargetingService:
+    """基于均匀网格的敌人位置索引，支持最近邻、k近邻和半径查询
+
+    敌人位置使用rect左上角坐标，与武器原先的最近敌人判定保持一致。
+    距离相同时按敌人在列表中的顺序选择，结果与逐一遍历完全相同。
+    """
+
+    def __init__(self, cell_size=256):
+        """
+        Args:
+            cell_size: 网格边长（世界坐标像素）
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # {(cx, cy): [(index, x, y, enemy), ...]}
+        self._source = None  # 建立索引时使用的敌人列表
+        self._count = 0
+        self._bounds = None  # 已占用格子的范围 (min_cx, min_cy, max_cx, max_cy)
+
+    def __len__(self):
+        return self._count
+
+    def rebuild(self, enemies):
+        """
+        根据敌人列表重建索引
+
+        Args:
+            enemies: 敌人列表
+        """
+        self.cells = {}
+        self._source = enemies
+        self._count = len(enemies)
+
+        size = self.cell_size
+        cells = self.cells
+        for index, enemy in enumerate(enemies):
+            x = enemy.rect.x
+            y = enemy.rect.y
+            key = (math.floor(x / size), math.floor(y / size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(index, x, y, enemy)]
+            else:
+                bucket.append((index, x, y, enemy))
+
+        if cells:
+            xs = [key[0] for key in cells]
+            ys = [key[1] for key in cells]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self._bounds = None
+
+    def covers(self, enemies):
+        """
+        检查索引是否由给定的敌人列表建立且列表未发生变化
+
+        Args:
+            enemies: 敌人列表
+
+        Returns:
+            bool: 索引可以用于该列表时返回True
+        """
+        return enemies is self._source and len(enemies) == self._count
+
+    def _ring(self, cx, cy, radius):
+        """遍历以(cx, cy)为中心、切比雪夫距离为radius的一圈格子中的条目"""
+        cells = self.cells
+        if radius == 0:
+            bucket = cells.get((cx, cy))
+            if bucket:
+                yield from bucket
+            return
+
+        for dx in range(-radius, radius + 1):
+            for dy in (-radius, radius):
+                bucket = cells.get((cx + dx, cy + dy))
+                if bucket:
+                    yield from bucket
+        for dy in range(-radius + 1, radius):
+            for dx in (-radius, radius):
+                bucket = cells.get((cx + dx, cy + dy))
+                if bucket:
+                    yield from bucket
+
+    def _max_ring(self, cx, cy):
+        """查询点到已占用格子范围的最大切比雪夫距离，超过该距离不会再有敌人"""
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        return max(abs(cx - min_cx), abs(cx - max_cx), abs(cy - min_cy), abs(cy - max_cy))
+
+    def k_nearest(self, x, y, k, max_distance=None):
+        """
+        查询距离最近的k个敌人
+
+        Args:
+            x: 查询点X坐标（世界坐标）
+            y: 查询点Y坐标（世界坐标）
+            k: 返回的最大数量
+            max_distance: 最大搜索距离，None表示不限制
+
+        Returns:
+            list: 敌人列表，按距离从近到远排列
+        """
+        if k <= 0 or not self.cells:
+            return []
+
+        size = self.cell_size
+        cx = math.floor(x / size)
+        cy = math.floor(y / size)
+        max_ring = self._max_ring(cx, cy)
+        if max_distance is not None:
+            max_ring = min(max_ring, int(max_distance // size) + 1)
+
+        # best: [(distance, index, enemy), ...]，按(distance, index)排序
+        best = []
+        for radius in range(max_ring + 1):
+            # 第radius圈中的点到查询点的距离至少为 (radius - 1) * size
+            if len(best) >= k and best[-1][0] < (radius - 1) * size:
+                break
+
+            for index, ex, ey, enemy in self._ring(cx, cy, radius):
+                dx = ex - x
+                dy = ey - y
+                distance = math.sqrt(dx * dx + dy * dy)
+                if max_distance is not None and distance > max_distance:
+                    continue
+                best.append((distance, index, enemy))
+
+            if len(best) > k:
+                best.sort(key=lambda item: (item[0], item[1]))
+                del best[k:]
+            else:
+                best.sort(key=lambda item: (item[0], item[1]))
+
+        return [enemy for _, _, enemy in best]
+
+    def nearest(self, x, y, max_distance=None):
+        """
+        查询距离最近的敌人
+
+        Args:
+            x: 查询点X坐标（世界坐标）
+            y: 查询点Y坐标（世界坐标）
+            max_distance: 最大搜索距离，None表示不限制
+
+        Returns:
+            Enemy: 最近的敌人，没有敌人时返回None
+        """
+        result = self.k_nearest(x, y, 1, max_distance)
+        return result[0] if result else None
+
+    def within_radius(self, x, y, radius):
+        """
+        查询距离不超过radius的所有敌人
+
+        Args:
+            x: 查询点X坐标（世界坐标）
+            y: 查询点Y坐标（世界坐标）
+            radius: 查询半径
+
+        Returns:
+            list: 敌人列表，按敌人列表中的顺序排列
+        """
+        if not self.cells:
+            return []
+
+        # 查询范围限制在已占用格子的范围内
+        size = self.cell_size
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        cx0 = max(min_cx, math.floor((x - radius) / size))
+        cy0 = max(min_cy, math.floor((y - radius) / size))
+        cx1 = min(max_cx, math.floor((x + radius) / size))
+        cy1 = min(max_cy, math.floor((y + radius) / size))
+
+        found = []
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for index, ex, ey, enemy in bucket:
+                    dx = ex - x
+                    dy = ey - y
+                    if math.sqrt(dx * dx + dy * dy) <= radius:
+                        found.append((index, enemy))
+
+        found.sort(key=lambda item: item[0])
+        return [enemy for _, enemy in found]
@@ -2,7 +2,11 @@ import pygame
 import math
 from ...resource_manager import resource_manager
 from ..weapon import Weapon
+from ...render_batch import LAYER_PROJECTILES, LAYER_EFFECTS
+from ...pooling import pools
+from ...projectiles import Projectile
 from ..weapon_stats import WeaponStatType, WeaponStatsDict
+from ...collision.broad_phase import enemies_in_radius
 
 class ExplosionEffect(pygame.sprite.Sprite):
     """火球爆炸特效"""
@@ -51,25 +55,50 @@ class ExplosionEffect(pygame.sprite.Sprite):
             self.rect = self.image.get_rect(center=(int(self.world_x), int(self.world_y)))
     
     def render(self, screen, camera_x, camera_y):
+        screen.blit(*self._get_draw_args(camera_x, camera_y, screen.get_width() // 2, screen.get_height() // 2))
+        
+    def queue_render(self, batcher, camera_x, camera_y):
+        """把爆炸特效添加到批量渲染器"""
+        batcher.add(LAYER_EFFECTS, *self._get_draw_args(camera_x, camera_y, batcher.center_x, batcher.center_y))
+        
+    def _get_draw_args(self, camera_x, camera_y, center_x, center_y):
+        """计算绘制用的图像和左上角屏幕坐标"""
         # 计算屏幕位置
-        screen_x = self.world_x - camera_x + screen.get_width() // 2
-        screen_y = self.world_y - camera_y + screen.get_height() // 2
+        screen_x = self.world_x - camera_x + center_x
+        screen_y = self.world_y - camera_y + center_y
         
-        # 渲染爆炸效果
-        screen.blit(self.image, (screen_x - self.image.get_width() // 2, 
-                                 screen_y - self.image.get_height() // 2))
+        return self.image, (screen_x - self.image.get_width() // 2,
+                            screen_y - self.image.get_height() // 2)
 
-class FireballProjectile(pygame.sprite.Sprite):
+class FireballProjectile(Projectile):
+    __slots__ = (
+        'base_image', 'image', 'rect', 'mask', 'world_x', 'world_y', 'prev_world_x', 'prev_world_y',
+        'target', 'damage', 'speed', 'direction_x', 'direction_y', 'explosion_radius',
+        'burn_damage', 'burn_duration', 'lifetime', 'scale', 'pulse_time', 'pulse_duration',
+        'hit_count', 'effects_group'
+    )
+    
+    # 对象池的键，火球被销毁后放回对象池，下次施放时重新初始化
+    POOL_KEY = ('projectile', 'fireball')
+    
     def __init__(self, x, y, target, stats):
         super().__init__()
+        self.reset(x, y, target, stats)
+        
+    def reset(self, x, y, target, stats):
+        """初始化火球的所有状态（从对象池取出时同样调用）"""
         # 加载基础图像
         self.base_image = resource_manager.load_image('weapon_fireball', 'images/weapons/fireball_32x32.png')
         self.image = self.base_image
         self.rect = self.image.get_rect()
+        self.mask = None  # 图像可能变化，碰撞检测时重新获取遮罩
         
         # 位置信息（世界坐标）
         self.world_x = float(x)
         self.world_y = float(y)
+        # 上一次碰撞检测时的位置，用于连续碰撞检测
+        self.prev_world_x = self.world_x
+        self.prev_world_y = self.world_y
         self.rect.centerx = self.world_x
         self.rect.centery = self.world_y
         
@@ -104,6 +133,11 @@ class FireballProjectile(pygame.sprite.Sprite):
         # 初始方向
         self._update_direction()
         
+    def kill(self):
+        """从投射物容器移除并放回对象池"""
+        super().kill()
+        pools.release(self.POOL_KEY, self)
+        
     def _update_direction(self):
         """更新朝向目标的方向"""
         if self.target and self.target.alive():
@@ -119,7 +153,7 @@ class FireballProjectile(pygame.sprite.Sprite):
                 
                 # 更新图像旋转
                 angle = math.degrees(math.atan2(-dy, dx))  # 注意：pygame的y轴是向下的，所以需要取负
-                self.image = pygame.transform.rotate(self.base_image, angle)
+                self.image = resource_manager.get_rotated_image('weapon_fireball', self.base_image, angle)
                 # 保持旋转后的图像中心点不变
                 new_rect = self.image.get_rect()
                 new_rect.center = self.rect.center
@@ -150,7 +184,7 @@ class FireballProjectile(pygame.sprite.Sprite):
         
         Args:
             target_enemy: 火球碰撞的目标敌人或爆炸位置
-            enemies: 游戏中的敌人列表
+            enemies: 游戏中的敌人列表，或提供空间查询的EnemyManager
         """
         # 确定爆炸中心点
         if hasattr(target_enemy, 'rect'):
@@ -169,33 +203,18 @@ class FireballProjectile(pygame.sprite.Sprite):
         
         # 如果有敌人列表，对范围内敌人造成伤害（优化性能）
         if enemies:
-            # 创建可能受影响的敌人列表（预筛选）
-            potential_targets = []
-            for enemy in enemies:
-                # 先做一个简单的矩形检测，快速排除明显不在范围内的敌人
-                if (abs(enemy.rect.centerx - explosion_x) <= self.explosion_radius + enemy.rect.width // 2 and
-                    abs(enemy.rect.centery - explosion_y) <= self.explosion_radius + enemy.rect.height // 2):
-                    potential_targets.append(enemy)
-            
-            # 只对可能受影响的敌人进行精确的圆形范围检测
-            for enemy in potential_targets:
-                # 计算与敌人的距离
-                dx = enemy.rect.centerx - explosion_x
-                dy = enemy.rect.centery - explosion_y
-                distance = math.sqrt(dx * dx + dy * dy)
+            # 通过空间查询获取爆炸范围内的敌人，避免遍历全部敌人
+            for enemy in enemies_in_radius(enemies, explosion_x, explosion_y, self.explosion_radius):
+                # 目标敌人受100%伤害，爆炸范围内敌人受50%伤害
+                damage_multiplier = 1.0 if enemy is target_enemy else 0.5
+                actual_damage = int(self.damage * damage_multiplier)
+                
+                # 造成伤害
+                enemy.take_damage(actual_damage)
                 
-                # 如果在爆炸范围内，造成伤害
-                if distance <= self.explosion_radius:
-                    # 目标敌人受100%伤害，爆炸范围内敌人受50%伤害
-                    damage_multiplier = 1.0 if enemy is target_enemy else 0.5
-                    actual_damage = int(self.damage * damage_multiplier)
-                    
-                    # 造成伤害
-                    enemy.take_damage(actual_damage)
-                    
-                    # 应用燃烧效果
-                    if hasattr(enemy, 'apply_burn_effect') and self.burn_duration > 0:
-                        enemy.apply_burn_effect(self.burn_damage, self.burn_duration)
+                # 应用燃烧效果
+                if hasattr(enemy, 'apply_burn_effect') and self.burn_duration > 0:
+                    enemy.apply_burn_effect(self.burn_damage, self.burn_duration)
         
         # 播放爆炸音效（使用try-except块处理可能不存在的音效）
         try:
@@ -208,9 +227,17 @@ class FireballProjectile(pygame.sprite.Sprite):
         self.kill()
         
     def render(self, screen, camera_x, camera_y):
+        screen.blit(*self._get_draw_args(camera_x, camera_y, screen.get_width() // 2, screen.get_height() // 2))
+        
+    def queue_render(self, batcher, camera_x, camera_y):
+        """把火球添加到批量渲染器"""
+        batcher.add(LAYER_PROJECTILES, *self._get_draw_args(camera_x, camera_y, batcher.center_x, batcher.center_y))
+        
+    def _get_draw_args(self, camera_x, camera_y, center_x, center_y):
+        """计算绘制用的图像和左上角屏幕坐标"""
         # 计算屏幕位置
-        screen_x = self.world_x - camera_x + screen.get_width() // 2
-        screen_y = self.world_y - camera_y + screen.get_height() // 2
+        screen_x = self.world_x - camera_x + center_x
+        screen_y = self.world_y - camera_y + center_y
         
         # 缩放图像
         scaled_size = (int(self.image.get_width() * self.scale),
@@ -220,7 +247,7 @@ class FireballProjectile(pygame.sprite.Sprite):
         # 调整绘制位置以保持中心点不变
         draw_x = screen_x - scaled_image.get_width() / 2
         draw_y = screen_y - scaled_image.get_height() / 2
-        screen.blit(scaled_image, (draw_x, draw_y))
+        return scaled_image, (draw_x, draw_y)
 
     def on_collision(self, enemy, enemies=None):
         """
@@ -228,7 +255,7 @@ class FireballProjectile(pygame.sprite.Sprite):
         
         Args:
             enemy: 被击中的敌人
-            enemies: 游戏中的所有敌人列表
+            enemies: 游戏中的所有敌人列表，或提供空间查询的EnemyManager
         
         Returns:
             bool: 始终返回True，因为火球碰撞后总是需要销毁
@@ -252,22 +279,6 @@ class Fireball(Weapon):
         # 特效组 - 用于存放爆炸效果
         self.effects = pygame.sprite.Group()
         
-    def find_nearest_enemy(self, enemies):
-        """寻找最近的敌人"""
-        nearest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            dx = enemy.rect.x - self.player.world_x
-            dy = enemy.rect.y - self.player.world_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_enemy = enemy
-                
-        return nearest_enemy
-        
     def update(self, dt, enemies):
         super().update(dt)
         
@@ -311,7 +322,7 @@ class Fireball(Weapon):
         
     def _cast_single_fireball(self, target):
         """施放单个火球"""
-        fireball = FireballProjectile(
+        fireball = pools.get_pool(FireballProjectile.POOL_KEY, FireballProjectile).acquire(
             self.player.world_x,
             self.player.world_y,
             target,
@@ -2,14 +2,31 @@ import pygame
 import math
 from ...resource_manager import resource_manager
 from ..weapon import Weapon
+from ...render_batch import LAYER_PROJECTILES
+from ...pooling import pools
+from ...projectiles import Projectile
 from ..weapon_stats import WeaponStatType, WeaponStatsDict
 from ..weapons_data import get_weapon_base_stats
 
-class ThrownKnife(pygame.sprite.Sprite):
+class ThrownKnife(Projectile):
     """飞刀投射物类"""
     
+    __slots__ = (
+        'image', 'rect', 'mask', 'start_x', 'start_y', 'world_x', 'world_y',
+        'prev_world_x', 'prev_world_y', 'direction_x', 'direction_y', 'damage', 'speed', 'lifetime',
+        'can_penetrate', 'max_penetration', 'penetration_damage_reduction', 'hit_count',
+        'throw_duration', 'throw_timer', 'throw_progress', 'time_alive'
+    )
+    
+    # 对象池的键，飞刀被销毁后放回对象池，下次投掷时重新初始化
+    POOL_KEY = ('projectile', 'knife')
+    
     def __init__(self, x, y, direction_x, direction_y, stats):
         super().__init__()
+        self.reset(x, y, direction_x, direction_y, stats)
+        
+    def reset(self, x, y, direction_x, direction_y, stats):
+        """初始化飞刀的所有状态（从对象池取出时同样调用）"""
         # 从资源管理器获取飞刀图像并旋转
         original_image = resource_manager.load_image('weapon_knife', 'images/weapons/knife_32x32.png')
         # 计算需要旋转的角度
@@ -17,8 +34,9 @@ class ThrownKnife(pygame.sprite.Sprite):
         # 原始图片刀尖朝上（-90度），需要调整基础角度
         base_angle = -45
         final_angle = -(angle - base_angle)
-        self.image = pygame.transform.rotate(original_image, final_angle)
+        self.image = resource_manager.get_rotated_image('weapon_knife', original_image, final_angle)
         self.rect = self.image.get_rect()
+        self.mask = None  # 图像可能变化，碰撞检测时重新获取遮罩
         self.rect.center = (int(x), int(y))
         
         # 设置飞刀属性
@@ -26,6 +44,9 @@ class ThrownKnife(pygame.sprite.Sprite):
         self.start_y = float(y)  # 起始y坐标，用于动画
         self.world_x = float(x)
         self.world_y = float(y)
+        # 上一次碰撞检测时的位置，用于连续碰撞检测
+        self.prev_world_x = self.world_x
+        self.prev_world_y = self.world_y
         self.direction_x = float(direction_x)
         self.direction_y = float(direction_y)
         self.damage = stats.get(WeaponStatType.DAMAGE, 20)  # 默认伤害20
@@ -46,6 +67,11 @@ class ThrownKnife(pygame.sprite.Sprite):
         # 存活时间跟踪
         self.time_alive = 0
         
+    def kill(self):
+        """从投射物容器移除并放回对象池"""
+        super().kill()
+        pools.release(self.POOL_KEY, self)
+        
     def update(self, dt):
         # 更新投掷动画进度
         if self.throw_timer < self.throw_duration:
@@ -74,9 +100,17 @@ class ThrownKnife(pygame.sprite.Sprite):
             self.kill()
             
     def render(self, screen, camera_x, camera_y):
+        screen.blit(*self._get_draw_args(camera_x, camera_y, screen.get_width() // 2, screen.get_height() // 2))
+        
+    def queue_render(self, batcher, camera_x, camera_y):
+        """把飞刀添加到批量渲染器"""
+        batcher.add(LAYER_PROJECTILES, *self._get_draw_args(camera_x, camera_y, batcher.center_x, batcher.center_y))
+        
+    def _get_draw_args(self, camera_x, camera_y, center_x, center_y):
+        """计算绘制用的图像和左上角屏幕坐标"""
         # 计算屏幕位置（相对于相机的偏移）
-        screen_x = self.world_x - camera_x + screen.get_width() // 2
-        screen_y = self.world_y - camera_y + screen.get_height() // 2
+        screen_x = self.world_x - camera_x + center_x
+        screen_y = self.world_y - camera_y + center_y
         
         # 根据投掷进度缩放图像
         # FIXME: 这里会让小刀变大，感觉很奇怪。 和update中的平滑同时关闭，感觉会好一些。
@@ -91,10 +125,9 @@ class ThrownKnife(pygame.sprite.Sprite):
             # 调整绘制位置以保持中心点不变
             draw_x = screen_x - scaled_image.get_width() / 2
             draw_y = screen_y - scaled_image.get_height() / 2
-            screen.blit(scaled_image, (draw_x, draw_y))
-        else:
-            # 正常渲染
-            screen.blit(self.image, (screen_x - self.rect.width/2, screen_y - self.rect.height/2))
+            return scaled_image, (draw_x, draw_y)
+        # 正常渲染
+        return self.image, (screen_x - self.rect.width/2, screen_y - self.rect.height/2)
 
 class Knife(Weapon):
     def __init__(self, player):
@@ -144,7 +177,7 @@ class Knife(Weapon):
         
     def _throw_single_knife(self, direction_x, direction_y):
         """投掷单个小刀"""
-        knife = ThrownKnife(
+        knife = pools.get_pool(ThrownKnife.POOL_KEY, ThrownKnife).acquire(
             self.player.world_x,
             self.player.world_y,
             direction_x,
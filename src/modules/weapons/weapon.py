@@ -4,6 +4,7 @@ from enum import Enum, auto
 from .weapon_stats import WeaponStatType, DEFAULT_WEAPON_STATS
 import math
 from .weapons_data import get_weapon_base_stats, get_weapon_config
+from ..projectiles import ProjectileGroup
 
 class WeaponType(Enum):
     MELEE = auto()      # 近战武器
@@ -32,7 +33,10 @@ class Weapon(pygame.sprite.Sprite):
         self.attack_interval = 1.0 / self.current_stats.get(WeaponStatType.ATTACK_SPEED, 1.0)
         
         # 投射物列表（如果是投射物类型的武器）
-        self.projectiles = pygame.sprite.Group()
+        self.projectiles = ProjectileGroup()
+        
+        # 共享的目标查询服务，由WeaponManager每帧建立一次索引
+        self.targeting = None
         
         # 加载配置中的图标路径
         weapon_config = get_weapon_config(weapon_type)
@@ -43,7 +47,36 @@ class Weapon(pygame.sprite.Sprite):
         
     def get_projectiles(self):
         """获取武器的投射物列表，如果没有则返回空列表"""
-        return self.projectiles if hasattr(self, 'projectiles') else pygame.sprite.Group()
+        return self.projectiles if hasattr(self, 'projectiles') else ProjectileGroup()
+        
+    def find_nearest_enemy(self, enemies):
+        """寻找距离玩家最近的敌人
+        
+        如果共享的目标查询服务已经为这组敌人建立了索引，直接使用索引查询，
+        否则逐一遍历敌人列表
+        
+        Args:
+            enemies: 敌人列表
+            
+        Returns:
+            Enemy: 最近的敌人，没有敌人时返回None
+        """
+        if self.targeting is not None and self.targeting.covers(enemies):
+            return self.targeting.nearest(self.player.world_x, self.player.world_y)
+            
+        nearest_enemy = None
+        min_distance = float('inf')
+        
+        for enemy in enemies:
+            dx = enemy.rect.x - self.player.world_x
+            dy = enemy.rect.y - self.player.world_y
+            distance = math.sqrt(dx * dx + dy * dy)
+            
+            if distance < min_distance:
+                min_distance = distance
+                nearest_enemy = enemy
+                
+        return nearest_enemy
         
     def handle_collision(self, projectile, enemy, enemies=None):
         """处理武器投射物与敌人的碰撞
@@ -51,7 +84,7 @@ class Weapon(pygame.sprite.Sprite):
         Args:
             projectile: 武器的投射物
             enemy: 被击中的敌人
-            enemies: 游戏中的所有敌人列表
+            enemies: 游戏中的所有敌人列表，或提供enemies_in_radius范围查询的EnemyManager
 
         Returns:
             bool: 是否应该销毁投射物
@@ -151,4 +184,18 @@ class Weapon(pygame.sprite.Sprite):
     
     def render(self, screen, camera_x, camera_y):
         """渲染武器"""
-        pass    
+        pass
+        
+    def queue_render(self, batcher, camera_x, camera_y):
+        """
+        把武器的投射物和特效添加到批量渲染器
+        
+        Args:
+            batcher: RenderBatcher实例
+            camera_x: 相机X坐标
+            camera_y: 相机Y坐标
+        """
+        for projectile in self.projectiles:
+            projectile.queue_render(batcher, camera_x, camera_y)
+        for effect in getattr(self, 'effects', ()):
+            effect.queue_render(batcher, camera_x, camera_y)    
@@ -0,0 +1,96 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.attack_scheduler import AttackScheduler
+from modules.enemies.enemy_manager import EnemyManager
+
+class MockPlayer:
+    """模拟玩家"""
+    def __init__(self):
+        self.invincible = False
+
+class MockRangedEnemy:
+    """记录攻击次数的模拟远程敌人"""
+    def __init__(self, calls, hit=False):
+        self.calls = calls
+        self.hit = hit
+        self.health = 10
+
+    def alive(self):
+        return self.health > 0
+
+    def attack_player(self, player):
+        self.calls.append(self)
+        if self.hit:
+            player.invincible = True
+        return self.hit
+
+class MockEntity:
+    """只包含rect的模拟敌人"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 44, 30)
+
+class TestAttackScheduler(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.scheduler = AttackScheduler()
+        self.player = MockPlayer()
+
+    def test_register_order_and_unregister(self):
+        """测试按注册顺序调度，取消注册后不再调度"""
+        first = MockRangedEnemy(self.calls)
+        second = MockRangedEnemy(self.calls)
+        self.scheduler.register(first)
+        self.scheduler.register(second)
+        self.scheduler.register(first)
+        self.assertEqual(len(self.scheduler), 2)
+
+        self.assertFalse(self.scheduler.update(self.player))
+        self.assertEqual(self.calls, [first, second])
+
+        self.assertTrue(self.scheduler.unregister(first))
+        self.assertFalse(self.scheduler.unregister(first))
+        self.calls.clear()
+        self.scheduler.update(self.player)
+        self.assertEqual(self.calls, [second])
+
+    def test_skips_dead_enemies(self):
+        """测试已经死亡的敌人不再攻击"""
+        dead = MockRangedEnemy(self.calls)
+        dead.health = 0
+        self.scheduler.register(dead)
+        self.scheduler.update(self.player)
+        self.assertEqual(self.calls, [])
+
+        self.scheduler.unregister_many([dead])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_stops_when_player_invincible(self):
+        """测试玩家被命中进入无敌状态后停止调度"""
+        hitter = MockRangedEnemy(self.calls, hit=True)
+        later = MockRangedEnemy(self.calls)
+        self.scheduler.register(hitter)
+        self.scheduler.register(later)
+
+        self.assertTrue(self.scheduler.update(self.player))
+        self.assertEqual(self.calls, [hitter])
+
+    def test_enemies_touching_matches_colliderect(self):
+        """测试玩家接触查询与逐一矩形检测结果一致"""
+        manager = EnemyManager()
+        manager.enemies = [MockEntity(x, y) for x in range(0, 1000, 37) for y in range(0, 1000, 41)]
+        manager.spatial_grid.rebuild(manager.enemies)
+
+        player_rect = pygame.Rect(0, 0, 64, 64)
+        for center in [(0, 0), (500, 500), (999, 20), (2000, 2000)]:
+            player_rect.center = center
+            expected = [enemy for enemy in manager.enemies if player_rect.colliderect(enemy.rect)]
+            self.assertEqual(manager.enemies_touching(player_rect), expected)
+
+if __name__ == '__main__':
+    unittest.main()
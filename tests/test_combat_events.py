@@ -0,0 +1,116 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.combat_events import CombatEventQueue
+from modules.enemies.enemy_manager import EnemyManager
+from modules.items.item_manager import ItemManager
+from modules.resource_manager import resource_manager
+
+class MockEnemy:
+    """模拟敌人"""
+    def __init__(self, x, y, health=10, enemy_type='ghost'):
+        self.rect = pygame.Rect(x, y, 44, 30)
+        self.health = health
+        self.type = enemy_type
+
+    def alive(self):
+        return self.health > 0
+
+class TestCombatEventQueue(unittest.TestCase):
+    def setUp(self):
+        self.manager = EnemyManager()
+        self.manager.enemies = [MockEnemy(i * 50, 0) for i in range(10)]
+        self.manager.spatial_grid.rebuild(self.manager.enemies)
+        self.item_manager = ItemManager()
+        self.queue = CombatEventQueue()
+
+        # 记录播放的音效
+        self.played = []
+        self._play_sound = resource_manager.play_sound
+        resource_manager.play_sound = self.played.append
+
+    def tearDown(self):
+        resource_manager.play_sound = self._play_sound
+
+    def test_resolve_batches_kills_and_drops(self):
+        """测试帧末一次性移除击杀的敌人、生成掉落并合并音效"""
+        enemies = self.manager.enemies
+        enemy_list = list(enemies)
+        killed = [enemy_list[1], enemy_list[4]]
+        for enemy in killed:
+            enemy.health = 0
+            self.queue.record_hit(enemy)
+            self.queue.record_kill(enemy)
+        self.queue.record_kill(enemy_list[1])
+        # 范围伤害杀死但未记录的敌人也会被结算
+        enemy_list[7].health = -5
+
+        kills = self.queue.resolve(self.manager, self.item_manager)
+
+        self.assertEqual(kills, 3)
+        self.assertIs(self.manager.enemies, enemies)
+        self.assertEqual(len(self.manager.enemies), 7)
+        self.assertTrue(all(enemy.alive() for enemy in self.manager.enemies))
+        self.assertEqual(len(self.manager.spatial_grid), 7)
+        self.assertEqual(sum(1 for item in self.item_manager.items if item.item_type == 'exp'), 3)
+        self.assertEqual(sorted(self.played), ['enemy_death', 'hit'])
+        self.assertEqual(self.queue.last_hits, 2)
+        self.assertIn(enemy_list[0], self.manager.spatial_grid)
+        self.assertNotIn(enemy_list[4], self.manager.spatial_grid)
+
+    def test_resolve_clears_queue(self):
+        """测试结算后事件被清空"""
+        enemy = self.manager.enemies[0]
+        enemy.health = 0
+        self.queue.record_kill(enemy)
+        self.assertIn(enemy, self.queue)
+        self.queue.resolve(self.manager)
+        self.assertNotIn(enemy, self.queue)
+
+        self.played.clear()
+        self.assertEqual(self.queue.resolve(self.manager), 0)
+        self.assertEqual(self.played, [])
+
+class TestBurnKillSound(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.played = []
+        self._play_sound = resource_manager.play_sound
+        resource_manager.play_sound = self.played.append
+
+    def tearDown(self):
+        resource_manager.play_sound = self._play_sound
+        pygame.quit()
+
+    def _burn_kill_sounds(self, use_soa):
+        """同一帧被燃烧杀死5个敌人，返回播放的音效"""
+        manager = EnemyManager()
+        manager.spawn_director.enabled = False
+        manager.set_soa_enabled(use_soa)
+        for i in range(5):
+            enemy = manager.spawn_enemy('ghost', i * 100, 0)
+            enemy.health = 1
+            enemy.apply_burn_effect(10, 2.0)
+
+        queue = CombatEventQueue()
+        player = type('Player', (), {'world_x': 0, 'world_y': 0, 'level': 0})()
+        manager.update(0.5, player, queue)
+        self.assertEqual(queue.resolve(manager), 5)
+        return self.played
+
+    def test_burn_kills_play_one_death_sound(self):
+        """测试燃烧击杀的死亡音效只在帧末结算时播放一次"""
+        self.assertEqual(self._burn_kill_sounds(False), ['enemy_death'])
+
+    def test_soa_burn_kills_play_one_death_sound(self):
+        """测试数组核心中的燃烧击杀同样只在帧末播放一次死亡音效"""
+        self.assertEqual(self._burn_kill_sounds(True), ['enemy_death'])
+
+if __name__ == '__main__':
+    unittest.main()
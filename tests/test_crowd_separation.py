@@ -0,0 +1,64 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+import numpy as np
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.crowd_separation import CrowdSeparation
+
+class MockEnemy:
+    """包含群体分离参数的模拟敌人"""
+    def __init__(self, x, y, radius=40, strength=0.5):
+        self.rect = pygame.Rect(0, 0, 44, 30)
+        self.rect.center = (x, y)
+        self.separation_radius = radius
+        self.separation_strength = strength
+
+class TestCrowdSeparation(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_overlapping_pair_is_pushed_apart(self):
+        """测试重叠的两个敌人沿连线方向被推开"""
+        left = MockEnemy(100, 100)
+        right = MockEnemy(120, 100)
+        CrowdSeparation('python').apply([left, right])
+        self.assertEqual(left.rect.centerx, 95)
+        self.assertEqual(right.rect.centerx, 125)
+        self.assertEqual(left.rect.centery, 100)
+
+    def test_zero_radius_is_ignored(self):
+        """测试分离半径为0的敌人不参与分离"""
+        enemies = [MockEnemy(100, 100, radius=0), MockEnemy(100, 100, radius=0)]
+        for backend in ('python', 'numpy'):
+            CrowdSeparation(backend).apply(enemies)
+            self.assertEqual([e.rect.center for e in enemies], [(100, 100), (100, 100)])
+
+    def test_backends_agree(self):
+        """测试python和numpy实现得到相同的位移"""
+        count = 400
+        xs = [random.uniform(0, 600) for _ in range(count)]
+        ys = [random.uniform(0, 600) for _ in range(count)]
+        radii = [random.choice([0, 40, 40, 80]) for _ in range(count)]
+        strengths = [random.choice([0.3, 0.5]) for _ in range(count)]
+        # 包含完全重合的敌人
+        xs[1], ys[1], radii[1] = xs[0], ys[0], radii[0] or 40
+        radii[0] = radii[1]
+
+        python_x, python_y = CrowdSeparation('python').compute_displacements(xs, ys, radii, strengths)
+        numpy_x, numpy_y = CrowdSeparation('numpy').compute_displacements(xs, ys, radii, strengths)
+        self.assertTrue(any(python_x))
+        np.testing.assert_allclose(python_x, numpy_x, atol=1e-9)
+        np.testing.assert_allclose(python_y, numpy_y, atol=1e-9)
+
+    def test_unknown_backend(self):
+        """测试未知实现名称抛出异常"""
+        with self.assertRaises(ValueError):
+            CrowdSeparation('boids')
+
+if __name__ == '__main__':
+    unittest.main()
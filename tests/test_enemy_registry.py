@@ -0,0 +1,76 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.registry import EnemyRegistry, enemy_registry
+from modules.enemies.enemy_manager import EnemyManager
+from modules.enemies.spawn_director import schedule_enemy_types, load_wave_schedule
+from modules.enemies.types import Ghost, Slime
+from modules.enemies.types.ghost import GHOST_ASSETS
+from modules.enemies.frame_bank import frame_banks
+from modules.pooling import pools
+
+class TestEnemyRegistry(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        pools.clear()
+
+    def tearDown(self):
+        pools.clear()
+        pygame.quit()
+
+    def test_builtin_types_registered(self):
+        """测试内置敌人类型已注册，类名同样可以解析为类型名"""
+        self.assertEqual(set(enemy_registry.get_stats()['registered']), {'ghost', 'radish', 'bat', 'slime'})
+        self.assertIs(enemy_registry.get_class('ghost'), Ghost)
+        self.assertEqual(enemy_registry.resolve('Slime'), 'slime')
+        self.assertIsNone(enemy_registry.resolve('normal'))
+
+    def test_spawn_by_saved_class_name(self):
+        """测试旧存档中按类名记录的敌人可以正常恢复"""
+        manager = EnemyManager()
+        enemy = manager.spawn_enemy('Slime', 10, 20, health=5)
+        self.assertIsInstance(enemy, Slime)
+        self.assertEqual(enemy.type, 'slime')
+        self.assertEqual(enemy.health, 5)
+        self.assertIsNone(manager.spawn_enemy('normal', 0, 0))
+        self.assertEqual(manager.enemies, [enemy])
+
+    def test_assets_load_lazily(self):
+        """测试精灵表在第一次创建动画时才加载，预热会构建帧缓存且只执行一次"""
+        registry = EnemyRegistry()
+        registry.register('ghost', Ghost, GHOST_ASSETS)
+        self.assertEqual(registry.get_stats()['loaded'], [])
+
+        frame_banks.clear()
+        self.assertEqual(registry.warm_up(['ghost', 'unknown']), ['ghost'])
+        self.assertEqual(registry.get_stats()['loaded'], ['ghost'])
+        self.assertIn(('ghost', 1.0), frame_banks.banks)
+        self.assertEqual(registry.warm_up(['ghost']), [])
+
+        # 三个动画状态共用同一张精灵表
+        spritesheets = registry.get('ghost').spritesheets
+        self.assertIs(spritesheets['idle'].sheet, spritesheets['hurt'].sheet)
+
+    def test_register_conflict(self):
+        """测试同一类型名不能注册为不同的类"""
+        registry = EnemyRegistry()
+        registry.register('ghost', Ghost, GHOST_ASSETS)
+        with self.assertRaises(ValueError):
+            registry.register('ghost', Slime, GHOST_ASSETS)
+
+    def test_schedule_enemy_types(self):
+        """测试获取波次文件中会出现的敌人类型"""
+        self.assertEqual(set(schedule_enemy_types(load_wave_schedule('default'))),
+                         {'bat', 'slime', 'ghost', 'radish'})
+        schedule = {'waves': [{'time': 0, 'types': {'ghost': 2, 'slime': 1}}],
+                    'spawners': [{'interval': 1, 'types': ['ghost']}]}
+        self.assertEqual(schedule_enemy_types(schedule), ['ghost', 'slime'])
+
+if __name__ == '__main__':
+    unittest.main()
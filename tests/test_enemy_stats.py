@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies import enemy_config
+from modules.enemies.enemy_config import (ENEMY_CONFIGS, get_enemy_stats, get_enemy_config,
+                                          reload_enemy_configs)
+from modules.enemies.types import Ghost
+
+class TestEnemyStatTable(unittest.TestCase):
+    def setUp(self):
+        self.original = {name: dict(config) for name, config in ENEMY_CONFIGS.items()}
+
+    def tearDown(self):
+        reload_enemy_configs(self.original)
+
+    def test_shared_and_read_only(self):
+        """测试同一组参数共享同一个只读属性对象"""
+        stats = get_enemy_stats('ghost', 'hard', 3)
+        self.assertIs(stats, get_enemy_stats('ghost', 'hard', 3))
+        with self.assertRaises(TypeError):
+            stats['health'] = 1
+
+        # get_enemy_config仍然返回可以修改的副本
+        config = get_enemy_config('ghost', 'hard', 3)
+        self.assertEqual(config, dict(stats))
+        config['health'] = 1
+        self.assertNotEqual(stats['health'], 1)
+
+    def test_values_scaled(self):
+        """测试难度和等级系数的计算结果"""
+        stats = get_enemy_stats('ghost', 'hard', 3)
+        self.assertEqual(stats['health'], round(80 * 1.3 * 1.2))
+        self.assertEqual(stats['speed'], round(100 * 1.2 * 1.04))
+        with self.assertRaises(ValueError):
+            get_enemy_stats('dragon')
+
+    def test_reload_invalidates_table(self):
+        """测试修改配置并重新加载后，新生成的敌人使用新的数值"""
+        old = get_enemy_stats('ghost')
+        ENEMY_CONFIGS['ghost']['health'] = 500
+        self.assertIs(get_enemy_stats('ghost'), old)
+
+        reload_enemy_configs()
+        self.assertEqual(get_enemy_stats('ghost')['health'], 500)
+
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            self.assertEqual(Ghost(0, 0).max_health, 500)
+        finally:
+            pygame.quit()
+
+    def test_reload_from_file(self):
+        """测试从配置文件重新读取时恢复文件中的数值"""
+        ENEMY_CONFIGS['ghost']['health'] = 1
+        enemy_config.LEVEL_SCALING['health_per_level'] = 5
+        reload_enemy_configs(from_file=True)
+        self.assertEqual(get_enemy_stats('ghost', 'normal', 2)['health'], round(80 * 1.1))
+
+    def test_reload_from_broken_file_keeps_tables(self):
+        """测试配置文件有错误时重新加载失败，原有配置和属性表保持不变"""
+        ENEMY_CONFIGS['ghost']['health'] = 7
+        reload_enemy_configs()
+        stats = get_enemy_stats('ghost')
+        level_scaling = dict(enemy_config.LEVEL_SCALING)
+
+        # 语法错误，以及只读到了一部分表
+        for patch in (mock.patch.object(enemy_config.runpy, 'run_path', side_effect=SyntaxError("invalid syntax")),
+                      mock.patch.object(enemy_config.runpy, 'run_path',
+                                        return_value={'ENEMY_CONFIGS': {}, 'DIFFICULTY_MULTIPLIERS': {}})):
+            with patch:
+                self.assertFalse(reload_enemy_configs(from_file=True))
+            self.assertEqual(ENEMY_CONFIGS['ghost']['health'], 7)
+            self.assertEqual(enemy_config.LEVEL_SCALING, level_scaling)
+            self.assertIs(get_enemy_stats('ghost'), stats)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.health_bar import HealthBarCache, health_bar_level, HEALTH_BAR_LEVELS
+from modules.enemies.enemy_manager import EnemyManager
+from modules.render_batch import RenderBatcher
+from modules.player import Player
+
+def legacy_health_bar(scale, health_ratio):
+    """原先逐帧绘制血条的方式"""
+    width = 32 * scale
+    height = 5 * scale
+    surface = pygame.Surface((64, 16))
+    surface.fill((0, 0, 0))
+    pygame.draw.rect(surface, (255, 0, 0), (0, 0, width, height))
+    pygame.draw.rect(surface, (0, 255, 0), (0, 0, width * health_ratio, height))
+    return surface
+
+class TestHealthBarCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_level_quantization(self):
+        """测试血量量化：满血为最高档，只要还有血量就至少一格"""
+        self.assertEqual(health_bar_level(100, 100), HEALTH_BAR_LEVELS)
+        self.assertEqual(health_bar_level(1, 100), 1)
+        self.assertEqual(health_bar_level(0, 100), 0)
+        self.assertEqual(health_bar_level(-5, 100), 0)
+        self.assertEqual(health_bar_level(50, 100), HEALTH_BAR_LEVELS // 2)
+
+    def test_bar_matches_legacy_drawing(self):
+        """测试预绘制的血条与原先的绘制结果一致"""
+        cache = HealthBarCache()
+        for scale in (1.0, 1.5, 2.0):
+            for level in (0, 8, 16, 31, 32):
+                ratio = level / HEALTH_BAR_LEVELS
+                expected = legacy_health_bar(scale, ratio)
+                actual = pygame.Surface((64, 16))
+                actual.fill((0, 0, 0))
+                actual.blit(cache.get_bar(scale, ratio * 100, 100), (0, 0))
+                self.assertEqual(pygame.image.tostring(actual, 'RGB'),
+                                 pygame.image.tostring(expected, 'RGB'))
+
+    def test_bars_shared(self):
+        """测试相同缩放和档位的血条只绘制一次"""
+        cache = HealthBarCache()
+        first = cache.get_bar(2.0, 40, 100)
+        second = cache.get_bar(2.0, 39, 100)
+        self.assertIs(first, second)
+        self.assertEqual(len(cache.bars), 1)
+
+class TestDamagedOnlyHealthBars(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.player = Player(400, 300)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _render(self, manager):
+        batcher = RenderBatcher()
+        batcher.begin(self.screen)
+        manager.render(self.screen, 400, 300, 400, 300, batcher)
+        batcher.end_frame()
+        return batcher.get_stats()
+
+    def test_full_health_enemies_have_no_bars(self):
+        """测试满血的敌人不提交血条"""
+        manager = EnemyManager()
+        for i in range(20):
+            manager.spawn_enemy('ghost', 50 + (i % 10) * 70, 200 + (i // 10) * 100)
+        stats = self._render(manager)
+        self.assertEqual(stats['submitted'], 20)
+        self.assertEqual(stats['blits_calls'], 1)
+
+    def test_damaged_enemy_shows_bar(self):
+        """测试受伤后显示血条"""
+        manager = EnemyManager()
+        enemy = manager.spawn_enemy('ghost', 300, 300)
+        manager.spawn_enemy('ghost', 500, 300)
+        self.assertFalse(enemy.show_health_bar())
+        enemy.take_damage(1)
+        self.assertTrue(enemy.show_health_bar())
+        self.assertEqual(self._render(manager)['submitted'], 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import math
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.horde import HordeProxy
+from modules.enemies.enemy_manager import EnemyManager
+from modules.pooling import pools
+
+class MockPlayer:
+    """模拟玩家"""
+    def __init__(self, x=0, y=0):
+        self.world_x = x
+        self.world_y = y
+        self.level = 0
+
+class TestHorde(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        pools.clear()
+        self.manager = EnemyManager()
+        self.manager.spawn_director.enabled = False
+        self.manager.horde.set_view_size((800, 600))  # 拆分距离700，合并距离1000
+
+    def tearDown(self):
+        pools.clear()
+        pygame.quit()
+
+    def _spawn_cluster(self, enemy_type, x, y, count):
+        return [self.manager.spawn_enemy(enemy_type, x + (i % 4) * 20, y + (i // 4) * 20)
+                for i in range(count)]
+
+    def test_distant_cluster_becomes_proxy(self):
+        """测试远处的同类型敌人群合并成一个代理，记录数量和总生命值"""
+        ghosts = self._spawn_cluster('ghost', 2000, 0, 10)
+        self._spawn_cluster('radish', 2000, 300, 3)  # 数量不足，保持独立
+        near = self.manager.spawn_enemy('ghost', 200, 0)
+        ghosts[0].health -= 1
+
+        self.manager.update(0.5, MockPlayer())
+
+        proxies = self.manager.horde.proxies
+        self.assertEqual(len(proxies), 1)
+        self.assertEqual(proxies[0].type, 'ghost')
+        self.assertEqual(proxies[0].count, 10)
+        self.assertEqual(proxies[0].health, sum(ghost.health for ghost in ghosts))
+        self.assertEqual(len(self.manager.enemies), 4)
+        self.assertIn(near, self.manager.enemies)
+        self.assertEqual(len(self.manager.all_enemies()), 14)
+        self.assertEqual(self.manager.spatial_grid.query_radius(2030, 20, 200), [])
+
+    def test_proxy_moves_and_splits_near_player(self):
+        """测试代理整体向玩家移动，进入拆分范围后还原成员并保持相对位置"""
+        ghosts = self._spawn_cluster('ghost', 1100, 0, 8)
+        player = MockPlayer()
+        self.manager.update(0.5, player)
+        proxy = self.manager.horde.proxies[0]
+        offsets = [(ghost.rect.centerx - ghosts[0].rect.centerx, ghost.rect.centery - ghosts[0].rect.centery)
+                   for ghost in ghosts]
+        start_x = proxy.rect.centerx
+
+        self.manager.update(0.1, player)
+        self.assertAlmostEqual(start_x - proxy.rect.centerx, proxy.speed * 0.1, delta=1)
+        # 成员跟随代理移动，保持相对位置
+        proxy.sync_members()
+        for ghost, offset in zip(ghosts, offsets):
+            self.assertEqual((ghost.rect.centerx - ghosts[0].rect.centerx,
+                              ghost.rect.centery - ghosts[0].rect.centery), offset)
+
+        for _ in range(600):
+            if not self.manager.horde.proxies:
+                break
+            self.manager.update(1 / 60, player)
+
+        self.assertEqual(self.manager.horde.proxies, [])
+        self.assertEqual(sorted(self.manager.enemies, key=id), sorted(ghosts, key=id))
+        self.assertLessEqual(math.hypot(*ghosts[0].rect.center), 760)
+
+    def test_ranged_and_burning_enemies_stay_individual(self):
+        """测试远程敌人和带状态效果的敌人不参与合并"""
+        self._spawn_cluster('slime', 2000, 0, 8)
+        for ghost in self._spawn_cluster('ghost', -2000, 0, 8):
+            ghost.apply_burn_effect(1, 10)
+
+        self.manager.update(0.5, MockPlayer())
+        self.assertEqual(self.manager.horde.proxies, [])
+        self.assertEqual(len(self.manager.enemies), 16)
+
+    def test_proxy_members_count_toward_cap(self):
+        """测试群代理中的敌人同样计入数量上限"""
+        self.manager.population.set_limits(max_active=8, leash_distance=None)
+        self._spawn_cluster('ghost', 2000, 0, 8)
+        self.manager.update(0.5, MockPlayer())
+        self.assertEqual(self.manager.enemies, [])
+        self.assertIsNone(self.manager.spawn_enemy('ghost', 0, 0))
+
+    def test_disable_splits_all(self):
+        """测试关闭聚合后所有代理立即拆分"""
+        self._spawn_cluster('ghost', 2000, 0, 8)
+        self.manager.set_soa_enabled(True)
+        self.manager.update(0.5, MockPlayer())
+        self.assertEqual(len(self.manager.soa_core), 0)
+
+        self.manager.horde.enabled = False
+        self.manager.update(1 / 60, MockPlayer())
+        self.assertEqual(len(self.manager.enemies), 8)
+        self.assertEqual(len(self.manager.soa_core), 8)
+        self.assertEqual(self.manager.horde.get_stats()['split'], 1)
+
+    def test_proxy_uses_slowest_member_speed(self):
+        """测试代理按最慢成员的速度移动"""
+        enemies = self._spawn_cluster('ghost', 0, 0, 2)
+        enemies[1].speed = enemies[0].speed / 2
+        self.assertEqual(HordeProxy('ghost', enemies).speed, enemies[1].speed)
+
+if __name__ == '__main__':
+    unittest.main()
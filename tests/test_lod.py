@@ -0,0 +1,108 @@
+import unittest
+from unittest import mock
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.lod import LodScheduler, TIER_VISIBLE, TIER_OFFSCREEN, TIER_FAR
+from modules.enemies.enemy_manager import EnemyManager
+from modules.enemies.types import Ghost
+from modules.player import Player
+
+class MockPlayer:
+    """模拟玩家"""
+    def __init__(self, x, y):
+        self.world_x = x
+        self.world_y = y
+
+class MockEnemy:
+    """只记录更新时间的模拟敌人"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 44, 30)
+        self.status_effects = {}
+        self.lod_visuals = True
+        self.lod_pending_dt = 0.0
+        self.updated = 0.0
+
+    def update(self, dt, player):
+        self.updated += dt
+
+class TestLodScheduler(unittest.TestCase):
+    def setUp(self):
+        self.player = MockPlayer(0, 0)
+        self.lod = LodScheduler(view_size=(800, 600), margin=0, far_distance=1000, far_interval=4)
+
+    def test_classify_tiers(self):
+        """测试按屏幕范围和距离划分层级"""
+        self.lod.begin_frame(self.player)
+        self.assertEqual(self.lod.classify(MockEnemy(100, 100)), TIER_VISIBLE)
+        self.assertEqual(self.lod.classify(MockEnemy(500, 0)), TIER_OFFSCREEN)
+        self.assertEqual(self.lod.classify(MockEnemy(2000, 0)), TIER_FAR)
+
+        # 带有状态效果的远处敌人保持每帧更新
+        burning = MockEnemy(2000, 0)
+        burning.status_effects['burn'] = {}
+        self.assertEqual(self.lod.classify(burning), TIER_OFFSCREEN)
+
+    def test_disabled_without_view_size(self):
+        """测试未设置视野时所有敌人都完整更新"""
+        lod = LodScheduler()
+        lod.begin_frame(self.player)
+        enemy = MockEnemy(5000, 5000)
+        self.assertEqual(lod.schedule(enemy, 0, 0.1), 0.1)
+        self.assertTrue(enemy.lod_visuals)
+
+    def test_far_updates_accumulate_time(self):
+        """测试远处敌人降低更新频率，但累积的时间不会丢失"""
+        enemies = [MockEnemy(2000 + i * 50, 0) for i in range(8)]
+        dt = 1 / 60
+        for _ in range(12):
+            self.lod.begin_frame(self.player)
+            for index, enemy in enumerate(enemies):
+                step = self.lod.schedule(enemy, index, dt)
+                if step is not None:
+                    enemy.update(step, self.player)
+            self.lod.end_frame()
+
+        stats = self.lod.get_stats()
+        self.assertEqual(stats['counts'][TIER_FAR], 8)
+        self.assertEqual(stats['skipped'], 6)
+        for enemy in enemies:
+            self.assertAlmostEqual(enemy.updated + enemy.lod_pending_dt, 12 * dt)
+
+class TestEnemyLod(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.player = Player(400, 300)
+        self.player.world_x = 0
+        self.player.world_y = 0
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_offscreen_enemy_skips_visuals(self):
+        """测试屏幕外的敌人只移动，不更新图像，回到屏幕内时刷新图像"""
+        manager = EnemyManager()
+        manager.lod.set_view_size((800, 600))
+        enemy = manager.spawn_enemy('ghost', 1200, 0)
+        manager.spawn_director.enabled = False  # 避免测试中生成新的敌人
+
+        start_x = enemy.rect.x
+        with mock.patch.object(Ghost, 'update_image') as update_image:
+            manager.update(0.1, self.player)
+            update_image.assert_not_called()
+        self.assertLess(enemy.rect.x, start_x)
+        self.assertEqual(manager.lod.get_stats()['counts'][TIER_OFFSCREEN], 1)
+
+        # 回到屏幕内后刷新图像
+        enemy.rect.x = 100
+        with mock.patch.object(Ghost, 'update_image') as update_image:
+            manager.update(0.1, self.player)
+            update_image.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.utils import dilate_mask, extract_sprite_outline, create_outlined_sprite
+
+def legacy_dilate(mask, thickness):
+    """原先逐像素扩大遮罩的方式"""
+    width, height = mask.get_size()
+    result = pygame.mask.Mask((width, height))
+    for x in range(width):
+        for y in range(height):
+            if mask.get_at((x, y)):
+                for dx in range(-thickness, thickness + 1):
+                    for dy in range(-thickness, thickness + 1):
+                        nx, ny = x + dx, y + dy
+                        if 0 <= nx < width and 0 <= ny < height:
+                            result.set_at((nx, ny), 1)
+    return result
+
+class MockSprite:
+    def __init__(self, image):
+        self.image = image
+
+class TestSpriteOutline(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((100, 100))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _random_surface(self, size, seed):
+        rng = random.Random(seed)
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for _ in range(6):
+            color = (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), 255)
+            pygame.draw.circle(surface, color, (rng.randint(0, size[0]), rng.randint(0, size[1])), rng.randint(1, 6))
+        return surface
+
+    def test_dilate_matches_legacy(self):
+        """测试卷积扩大遮罩的结果与逐像素扩大完全一致"""
+        for seed in range(5):
+            surface = self._random_surface((23, 17), seed)
+            mask = pygame.mask.from_surface(surface)
+            for thickness in (1, 2, 3):
+                expected = legacy_dilate(mask, thickness)
+                actual = dilate_mask(mask, thickness)
+                self.assertEqual(actual.get_size(), expected.get_size())
+                self.assertEqual(actual.count(), expected.count())
+                self.assertEqual(actual.overlap_area(expected, (0, 0)), expected.count())
+
+    def test_outline_excludes_shape(self):
+        """测试轮廓只出现在形状外侧，原图保持不变"""
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill((255, 255, 255, 255), (3, 3, 4, 4))
+        outlined = extract_sprite_outline(surface, outline_color=(0, 255, 0), outline_thickness=1)
+        self.assertEqual(outlined.get_at((2, 2)), (0, 255, 0, 255))
+        self.assertEqual(outlined.get_at((4, 4)), (255, 255, 255, 255))
+        self.assertEqual(outlined.get_at((0, 0))[3], 0)
+
+    def test_outline_cached_per_frame_color_thickness(self):
+        """测试同一帧、颜色和粗细的轮廓只生成一次"""
+        sprite = MockSprite(self._random_surface((16, 16), 0))
+        first = create_outlined_sprite(sprite, (0, 255, 0), 1)
+        self.assertIs(create_outlined_sprite(sprite, (0, 255, 0), 1), first)
+        self.assertIsNot(create_outlined_sprite(sprite, (0, 255, 0), 2), first)
+        self.assertIsNot(create_outlined_sprite(sprite, (255, 0, 0), 1), first)
+
+        # 另一帧图像生成新的轮廓
+        other = MockSprite(self._random_surface((16, 16), 1))
+        self.assertIsNot(create_outlined_sprite(other, (0, 255, 0), 1), first)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.utils import pixel_perfect_collision, pixel_overlap
+
+def make_surface(size, opaque_rect):
+    """创建只有opaque_rect区域不透明的Surface"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((255, 255, 255, 255), opaque_rect)
+    return surface
+
+class TestPixelCollision(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_no_rect_overlap(self):
+        """测试矩形不重叠时不碰撞"""
+        surface = make_surface((10, 10), (0, 0, 10, 10))
+        self.assertFalse(pixel_perfect_collision(surface, pygame.Rect(0, 0, 10, 10),
+                                                 surface, pygame.Rect(20, 0, 10, 10)))
+
+    def test_transparent_overlap(self):
+        """测试只有透明像素重叠时不碰撞"""
+        left = make_surface((10, 10), (0, 0, 4, 10))
+        right = make_surface((10, 10), (6, 0, 4, 10))
+        self.assertFalse(pixel_perfect_collision(left, pygame.Rect(0, 0, 10, 10),
+                                                 right, pygame.Rect(0, 0, 10, 10)))
+
+    def test_overlap_count_and_centroid(self):
+        """测试返回重叠像素数量和质心"""
+        surface1 = make_surface((10, 10), (0, 0, 10, 10))
+        surface2 = make_surface((10, 10), (0, 0, 4, 2))
+        result = pixel_perfect_collision(surface1, pygame.Rect(100, 100, 10, 10),
+                                         surface2, pygame.Rect(104, 106, 10, 10), return_details=True)
+        self.assertTrue(result.collided)
+        self.assertEqual(result.count, 8)
+        self.assertEqual(result.centroid, (105.5, 106.5))
+        self.assertTrue(pixel_perfect_collision(surface1, pygame.Rect(100, 100, 10, 10),
+                                                surface2, pygame.Rect(104, 106, 10, 10)))
+
+    def test_no_overlap_details(self):
+        """测试无重叠时的详细结果"""
+        surface = make_surface((10, 10), (0, 0, 10, 10))
+        result = pixel_overlap(surface, pygame.Rect(0, 0, 10, 10), surface, pygame.Rect(50, 50, 10, 10))
+        self.assertEqual(result, (False, 0, None))
+
+if __name__ == '__main__':
+    unittest.main()
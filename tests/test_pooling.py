@@ -0,0 +1,115 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.pooling import ObjectPool, pools
+from modules.enemies.enemy_manager import EnemyManager
+from modules.weapons.types.knife import ThrownKnife
+from modules.projectiles import ProjectileGroup
+from modules.weapons.weapon_stats import WeaponStatType
+from modules.player import Player
+
+class Counter:
+    """记录初始化次数的简单对象"""
+    def __init__(self, value):
+        self.resets = 0
+        self.value = value
+
+    def reset(self, value):
+        self.resets += 1
+        self.value = value
+
+class TestObjectPool(unittest.TestCase):
+    def test_acquire_reuses_released_objects(self):
+        """测试放回的对象会被重新初始化后再次使用"""
+        pool = ObjectPool(Counter)
+        first = pool.acquire(1)
+        self.assertTrue(pool.release(first))
+        # 重复放回会被忽略
+        self.assertFalse(pool.release(first))
+
+        second = pool.acquire(2)
+        self.assertIs(second, first)
+        self.assertEqual(second.value, 2)
+        self.assertEqual(second.resets, 1)
+        self.assertEqual(pool.get_stats(), {'created': 1, 'reused': 1, 'released': 1, 'dropped': 0, 'free': 0})
+
+    def test_max_size(self):
+        """测试池满时放回的对象被丢弃"""
+        pool = ObjectPool(Counter, max_size=1)
+        objects = [pool.acquire(i) for i in range(2)]
+        for obj in objects:
+            pool.release(obj)
+        stats = pool.get_stats()
+        self.assertEqual(stats['free'], 1)
+        self.assertEqual(stats['dropped'], 1)
+
+class TestPooledGameObjects(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.player = Player(400, 300)
+        pools.clear()
+
+    def tearDown(self):
+        pools.clear()
+        pygame.quit()
+
+    def test_enemy_reused_with_fresh_state(self):
+        """测试移除的敌人放回对象池，再次生成时状态与新建的敌人一致"""
+        manager = EnemyManager()
+        enemy = manager.spawn_enemy('slime', 100, 100)
+        enemy.take_damage(5)
+        enemy.apply_burn_effect(10, 3.0)
+        enemy.apply_slow_effect(0.5, 2.0)
+        enemy._fire_projectile(1.0, 0.0)
+        enemy.kill()
+        manager.remove_enemies([enemy])
+
+        reused = manager.spawn_enemy('slime', 300, 200)
+        self.assertIs(reused, enemy)
+        self.assertTrue(reused.alive())
+        self.assertEqual((reused.rect.x, reused.rect.y), (300, 200))
+        self.assertEqual(reused.health, reused.max_health)
+        self.assertEqual(reused.status_effects, {})
+        self.assertEqual(reused.speed, reused.config['speed'])
+        self.assertEqual(len(reused.projectiles), 0)
+        self.assertFalse(reused.invincible)
+        self.assertIn(reused, manager.attack_scheduler.attackers)
+
+        # 图像与新建的同类敌人相同
+        fresh = manager.spawn_enemy('slime', 300, 200)
+        self.assertIsNot(fresh, reused)
+        self.assertIs(reused.image, fresh.image)
+        self.assertIs(reused.mask, fresh.mask)
+
+        stats = pools.get_stats()[('enemy', 'slime')]
+        self.assertEqual(stats['created'], 2)
+        self.assertEqual(stats['reused'], 1)
+
+    def test_knife_returned_on_kill(self):
+        """测试飞刀销毁后放回对象池，重新取出时按新方向初始化"""
+        stats = {WeaponStatType.DAMAGE: 20, WeaponStatType.PROJECTILE_SPEED: 400}
+        pool = pools.get_pool(ThrownKnife.POOL_KEY, ThrownKnife)
+        group = ProjectileGroup()
+
+        knife = pool.acquire(0, 0, 1.0, 0.0, stats)
+        group.add(knife)
+        knife.mask = pygame.mask.Mask((1, 1))
+        knife.update(0.5)
+        knife.kill()
+        self.assertEqual(len(group), 0)
+
+        reused = pool.acquire(50, 60, 0.0, 1.0, stats)
+        self.assertIs(reused, knife)
+        self.assertEqual((reused.world_x, reused.world_y), (50.0, 60.0))
+        self.assertEqual(reused.time_alive, 0)
+        self.assertIsNone(reused.mask)
+        self.assertIs(reused.image, ThrownKnife(0, 0, 0.0, 1.0, stats).image)
+
+if __name__ == '__main__':
+    unittest.main()
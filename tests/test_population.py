@@ -0,0 +1,97 @@
+import unittest
+import math
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.population import PopulationManager
+from modules.enemies.enemy_manager import EnemyManager
+from modules.pooling import pools
+
+class MockPlayer:
+    """模拟玩家"""
+    def __init__(self, x=0, y=0):
+        self.world_x = x
+        self.world_y = y
+        self.level = 0
+
+class MockEnemy:
+    """只有位置的模拟敌人"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 20, 20)
+        self.rect.center = (x, y)
+
+class TestPopulationManager(unittest.TestCase):
+    def test_leash_respawns_ahead_of_player(self):
+        """测试超出拴绳距离的敌人移动到玩家前进方向的生成圈上"""
+        population = PopulationManager(leash_distance=1000, respawn_distance=600, check_interval=0,
+                                       respawn_spread=0)
+        far = MockEnemy(-2000, 0)
+        near = MockEnemy(-500, 0)
+
+        recycled = population.update(1 / 60, [far, near], MockPlayer())
+
+        self.assertEqual(recycled, 1)
+        self.assertEqual(far.rect.center, (600, 0))
+        self.assertEqual(near.rect.center, (-500, 0))
+        self.assertEqual(population.get_stats(2)['recycled'], 1)
+
+    def test_respawn_clamped_to_boundaries(self):
+        """测试重新出现的位置限制在地图边界内"""
+        population = PopulationManager(leash_distance=1000, check_interval=0)
+        enemy = MockEnemy(0, -3000)
+        population.update(1 / 60, [enemy], MockPlayer(), boundaries=(-100, -100, 100, 100))
+        x, y = enemy.rect.center
+        self.assertTrue(-100 <= x <= 100 and -100 <= y <= 100)
+
+    def test_round_robin_bounds_checks_per_frame(self):
+        """测试每帧只检查一部分敌人，约check_interval秒后全部检查一遍"""
+        population = PopulationManager(leash_distance=100, check_interval=0.5, respawn_distance=50)
+        enemies = [MockEnemy(1000 + i, 0) for i in range(120)]
+        player = MockPlayer()
+
+        self.assertEqual(population.update(1 / 60, enemies, player), 4)
+        for _ in range(29):
+            population.update(1 / 60, enemies, player)
+        self.assertEqual(population.recycled, 120)
+        for enemy in enemies:
+            self.assertLessEqual(math.hypot(*enemy.rect.center), 51)
+
+    def test_cap_counts_culled(self):
+        """测试达到上限后拒绝生成并计数"""
+        population = PopulationManager(max_active=2)
+        self.assertTrue(population.can_spawn(1))
+        self.assertFalse(population.can_spawn(2))
+        self.assertEqual(population.get_stats(2)['culled'], 1)
+
+class TestEnemyManagerPopulation(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        pools.clear()
+
+    def tearDown(self):
+        pools.clear()
+        pygame.quit()
+
+    def test_manager_respects_cap_and_leash(self):
+        """测试敌人管理器的数量上限和拴绳回收"""
+        manager = EnemyManager()
+        manager.spawn_director.enabled = False
+        manager.population.set_limits(max_active=3, leash_distance=1500)
+        for i in range(5):
+            manager.spawn_enemy('ghost', 5000, i * 30)
+
+        self.assertEqual(len(manager.enemies), 3)
+        manager.update(1.0, MockPlayer())
+
+        stats = manager.population.get_stats(len(manager.enemies))
+        self.assertEqual(stats, {'active': 3, 'peak': 3, 'recycled': 3, 'culled': 2})
+        for enemy in manager.enemies:
+            self.assertLess(math.hypot(*enemy.rect.center), 700)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.projectiles import Projectile, ProjectileGroup
+from modules.weapons.types.knife import ThrownKnife
+from modules.enemies.types.slime import RangerProjectile
+from modules.weapons.weapon_stats import WeaponStatType
+
+class Dart(Projectile):
+    """记录更新次数的测试投射物"""
+    __slots__ = ('name', 'updates')
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.updates = 0
+
+    def update(self, dt):
+        self.updates += 1
+
+class TestProjectileGroup(unittest.TestCase):
+    def test_order_kept_after_kill(self):
+        """测试移除投射物后其余投射物的顺序不变"""
+        darts = [Dart(i) for i in range(5)]
+        group = ProjectileGroup(*darts)
+        darts[1].kill()
+        darts[3].kill()
+
+        self.assertEqual([dart.name for dart in group], [0, 2, 4])
+        self.assertFalse(darts[1].alive())
+        self.assertTrue(darts[0].alive())
+        self.assertEqual(len(group), 3)
+
+    def test_update_allows_kill(self):
+        """测试update过程中移除投射物是安全的"""
+        class Killer(Dart):
+            __slots__ = ()
+
+            def update(self, dt):
+                super().update(dt)
+                self.kill()
+
+        group = ProjectileGroup(Killer('a'), Dart('b'), Killer('c'))
+        group.update(0.1)
+        self.assertEqual([dart.name for dart in group], ['b'])
+
+    def test_single_group_membership(self):
+        """测试投射物加入新容器时从原容器移除"""
+        dart = Dart('a')
+        first = ProjectileGroup(dart)
+        second = ProjectileGroup()
+        second.add(dart)
+
+        self.assertNotIn(dart, first)
+        self.assertIn(dart, second)
+        second.empty()
+        self.assertFalse(second)
+        self.assertFalse(dart.alive())
+
+class TestCompactProjectiles(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_projectiles_have_no_instance_dict(self):
+        """测试投射物使用__slots__，没有实例__dict__"""
+        stats = {WeaponStatType.DAMAGE: 20, WeaponStatType.PROJECTILE_SPEED: 400}
+        knife = ThrownKnife(0, 0, 1.0, 0.0, stats)
+        ranger = RangerProjectile(0, 0, 1.0, 0.0, 5, 180)
+        for projectile in (knife, ranger):
+            self.assertFalse(hasattr(projectile, '__dict__'))
+
+        group = ProjectileGroup(ranger)
+        ranger.update(10.0)  # 超过生命周期后自动移除
+        self.assertEqual(len(group), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.render_batch import RenderBatcher, LAYER_ENEMIES, LAYER_ITEMS
+from modules.enemies.enemy_manager import EnemyManager
+from modules.items.item_manager import ItemManager
+from modules.items.item import Item
+from modules.player import Player
+from modules.game import Game
+
+class TestRenderBatcher(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.Surface((200, 100))
+        self.batcher = RenderBatcher()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _solid(self, color, size=(10, 10)):
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return surface
+
+    def test_layers_drawn_in_order(self):
+        """测试按图层顺序绘制，与添加顺序无关"""
+        self.batcher.begin(self.screen)
+        self.batcher.add(LAYER_ITEMS, self._solid((0, 0, 255)), (0, 0))
+        self.batcher.add(LAYER_ENEMIES, self._solid((255, 0, 0)), (0, 0))
+        self.batcher.add(LAYER_ENEMIES, self._solid((0, 255, 0)), (20, 0))
+        self.batcher.end_frame()
+
+        self.assertEqual(self.screen.get_at((5, 5))[:3], (0, 0, 255))
+        self.assertEqual(self.screen.get_at((25, 5))[:3], (0, 255, 0))
+        # 两个图层各一次blits调用
+        self.assertEqual(self.batcher.get_stats()['blits_calls'], 2)
+
+    def test_offscreen_sprites_culled(self):
+        """测试完全位于屏幕外的精灵被裁剪，部分可见的保留"""
+        surface = self._solid((255, 0, 0))
+        self.batcher.begin(self.screen)
+        self.assertFalse(self.batcher.add(LAYER_ENEMIES, surface, (-10, 0)))
+        self.assertFalse(self.batcher.add(LAYER_ENEMIES, surface, (200, 50)))
+        self.assertTrue(self.batcher.add(LAYER_ENEMIES, surface, (-5, 95)))
+        self.batcher.end_frame()
+
+        stats = self.batcher.get_stats()
+        self.assertEqual(stats['submitted'], 1)
+        self.assertEqual(stats['culled'], 2)
+        self.assertEqual(self.screen.get_at((0, 99))[:3], (255, 0, 0))
+
+    def test_disabled_draws_immediately(self):
+        """测试关闭批量渲染时逐个绘制"""
+        self.batcher.enabled = False
+        self.batcher.begin(self.screen)
+        for i in range(3):
+            self.batcher.add(LAYER_ENEMIES, self._solid((255, 0, 0)), (i * 20, 0))
+        self.assertEqual(self.screen.get_at((45, 5))[:3], (255, 0, 0))
+        self.batcher.end_frame()
+        self.assertEqual(self.batcher.get_stats()['blits_calls'], 3)
+
+class TestBatchedWorldRender(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.player = Player(400, 300)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _render_both(self, render):
+        """分别用逐个绘制和批量绘制渲染，返回两张结果图"""
+        direct = pygame.Surface((800, 600))
+        render(direct, None)
+
+        batched = pygame.Surface((800, 600))
+        batcher = RenderBatcher()
+        batcher.begin(batched)
+        render(batched, batcher)
+        batcher.end_frame()
+        return direct, batched, batcher
+
+    def test_enemies_match_direct_render(self):
+        """测试批量绘制敌人和血条的结果与逐个绘制一致"""
+        manager = EnemyManager()
+        for i in range(5):
+            enemy = manager.spawn_enemy('ghost', 100 + i * 120, 300)
+            enemy.health = enemy.max_health * (i + 1) / 6
+        # 屏幕外的敌人
+        manager.spawn_enemy('ghost', 5000, 300)
+
+        direct, batched, batcher = self._render_both(
+            lambda screen, b: manager.render(screen, 400, 300, 400, 300, b))
+
+        self.assertEqual(pygame.image.tostring(direct, 'RGB'), pygame.image.tostring(batched, 'RGB'))
+        stats = batcher.get_stats()
+        # 5个敌人和5条血条，敌人和血条各一次blits调用
+        self.assertEqual(stats['submitted'], 10)
+        self.assertEqual(stats['culled'], 1)
+        self.assertEqual(stats['blits_calls'], 2)
+
+    def test_slime_projectiles_batched(self):
+        """测试史莱姆的投射物也会提交到批量渲染器"""
+        manager = EnemyManager()
+        slime = manager.spawn_enemy('slime', 300, 300)
+        slime._fire_projectile(1.0, 0.0)
+
+        direct, batched, batcher = self._render_both(
+            lambda screen, b: manager.render(screen, 400, 300, 400, 300, b))
+
+        self.assertEqual(pygame.image.tostring(direct, 'RGB'), pygame.image.tostring(batched, 'RGB'))
+        self.assertEqual(batcher.get_stats()['submitted'], 2)
+
+    def test_items_match_direct_render(self):
+        """测试批量绘制物品的结果与逐个绘制一致"""
+        manager = ItemManager()
+        manager.items = [Item(100 + i * 60, 200, item_type)
+                         for i, item_type in enumerate(('exp', 'coin', 'health', 'chest'))]
+
+        direct, batched, batcher = self._render_both(
+            lambda screen, b: manager.render(screen, 400, 300, 400, 300, b))
+
+        self.assertEqual(pygame.image.tostring(direct, 'RGB'), pygame.image.tostring(batched, 'RGB'))
+        self.assertEqual(batcher.get_stats()['submitted'], 4)
+
+    def test_game_render_without_player(self):
+        """测试没有玩家时渲染游戏画面不会绘制UI"""
+        game = Game(self.screen)
+        game.in_main_menu = False
+        game.render()
+        self.assertEqual(game.render_batcher.get_stats()['submitted'], 0)
+
+    def test_debug_keys_require_debug_mode(self):
+        """测试切换批量渲染的调试按键只在调试模式下生效"""
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F4)
+        game = Game(self.screen)
+        game.in_main_menu = False
+        game.handle_event(event)
+        self.assertTrue(game.render_batcher.enabled)
+
+        game = Game(self.screen, debug_mode=True)
+        game.in_main_menu = False
+        game.handle_event(event)
+        self.assertFalse(game.render_batcher.enabled)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import unittest
+from unittest import mock
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.resource_manager import resource_manager, MaskCache, AnimationClip, Animation
+from modules.enemies.types import Ghost, Bat
+from modules.enemies.frame_bank import FrameBank, frame_banks
+from modules.player import Player
+
+class TestMaskCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        resource_manager.mask_cache.clear()
+        self.player = Player(400, 300)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_frame_mask_hit_and_miss(self):
+        """测试同一帧的遮罩只计算一次"""
+        cache = MaskCache()
+        surface = pygame.Surface((8, 8), pygame.SRCALPHA)
+        surface.fill((255, 255, 255, 255), (0, 0, 4, 8))
+
+        first = cache.get_frame_mask('clip', 0, 1.0, False, surface)
+        second = cache.get_frame_mask('clip', 0, 1.0, False, surface)
+        self.assertIs(first, second)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(first.count(), 32)
+
+        # 翻转后的帧是不同的缓存项
+        cache.get_frame_mask('clip', 0, 1.0, True, pygame.transform.flip(surface, True, False))
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.get_stats()['size'], 2)
+
+    def test_enemy_mask_matches_image(self):
+        """测试敌人使用缓存遮罩后与重新计算的遮罩一致"""
+        enemy = Ghost(100, 100)
+        for _ in range(3):
+            enemy.update(0.01, self.player)
+            expected = pygame.mask.from_surface(enemy.image)
+            self.assertEqual(enemy.mask.overlap_area(expected, (0, 0)), expected.count())
+            self.assertEqual(enemy.mask.count(), expected.count())
+        self.assertGreater(resource_manager.mask_cache.hits, 0)
+
+    def test_player_mask_uses_cache(self):
+        """测试玩家每帧更新时复用缓存遮罩"""
+        resource_manager.mask_cache.reset_stats()
+        self.player.update(0.001)
+        self.player.update(0.001)
+        self.assertGreater(resource_manager.mask_cache.hits, 0)
+        expected = pygame.mask.from_surface(self.player.image)
+        self.assertEqual(self.player.mask.count(), expected.count())
+
+def legacy_tint(frame, slowed, burning):
+    """原先每帧重新绘制状态效果的实现，用于对比"""
+    modified_frame = frame.copy()
+    mask = pygame.mask.from_surface(frame)
+    for enabled, glow, fill in ((slowed, (0, 0, 200, 100), (0, 0, 100, 70)),
+                                (burning, (255, 100, 0, 150), (50, 0, 0, 50))):
+        if not enabled:
+            continue
+        effect = pygame.Surface(modified_frame.get_size(), pygame.SRCALPHA)
+        for point in mask.outline():
+            pygame.draw.circle(effect, glow, point, 3)
+        effect.blit(mask.to_surface(setcolor=fill, unsetcolor=(0, 0, 0, 0)), (0, 0),
+                    special_flags=pygame.BLEND_RGBA_ADD)
+        modified_frame.blit(effect, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    return modified_frame
+
+class TestFrameBank(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        frame_banks.clear()
+        self.player = Player(400, 300)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_frames_match_transform_pipeline(self):
+        """测试预处理帧与逐帧缩放、翻转得到的图像完全相同"""
+        enemy = Bat(100, 100)
+        bank = FrameBank(enemy.animations, enemy.scale)
+        for state, animation in enemy.animations.items():
+            for index, frame in enumerate(animation.frames):
+                size = (int(frame.get_width() * enemy.scale), int(frame.get_height() * enemy.scale))
+                expected = pygame.transform.flip(pygame.transform.scale(frame, size), True, False)
+                for facing_right in (True, False):
+                    if not facing_right:
+                        expected = pygame.transform.flip(expected, True, False)
+                    actual = bank.get_frame(state, index, facing_right)
+                    self.assertEqual(pygame.image.tostring(actual, 'RGBA'),
+                                     pygame.image.tostring(expected, 'RGBA'))
+        self.assertGreater(bank.memory_bytes, 0)
+        self.assertEqual(bank.frame_count, 2 * sum(len(a.frames) for a in enemy.animations.values()))
+
+    def test_tinted_frames_match_legacy(self):
+        """测试缓存的状态效果帧与原先逐帧绘制的结果完全相同，且只生成一次"""
+        enemy = Ghost(100, 100)
+        bank = FrameBank(enemy.animations, enemy.scale)
+        for slowed, burning in ((True, False), (False, True), (True, True)):
+            for facing_right in (True, False):
+                frame = bank.get_frame('walk', 2, facing_right)
+                mask = pygame.mask.from_surface(frame)
+                tinted = bank.get_tinted_frame('walk', 2, facing_right, slowed, burning, mask)
+                self.assertEqual(pygame.image.tostring(tinted, 'RGBA'),
+                                 pygame.image.tostring(legacy_tint(frame, slowed, burning), 'RGBA'))
+                self.assertIs(bank.get_tinted_frame('walk', 2, facing_right, slowed, burning, mask), tinted)
+        self.assertEqual(len(bank.tinted_frames), 6)
+
+    def test_bank_shared_per_type(self):
+        """测试同类型敌人共享同一个帧缓存，图像直接引用缓存中的帧"""
+        first = Ghost(100, 100)
+        second = Ghost(300, 100)
+        first.update(0.01, self.player)
+        second.update(0.01, self.player)
+        self.assertIs(first.frame_bank, second.frame_bank)
+        self.assertEqual(len(frame_banks.get_stats()['banks']), 1)
+
+        animation = first.animations[first.current_animation]
+        self.assertIs(first.image, first.frame_bank.get_frame(
+            first.current_animation, animation.current_frame, first.facing_right))
+
+class TestAnimationClip(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.player = Player(400, 300)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_clip_is_immutable(self):
+        """测试动画片段不可修改，播放进度各自独立"""
+        frames = [pygame.Surface((4, 4)) for _ in range(3)]
+        clip = AnimationClip('clip', frames, frame_duration=0.1)
+        with self.assertRaises(AttributeError):
+            clip.frame_duration = 0.5
+
+        first = clip.create_playhead()
+        second = Animation(clip)
+        first.update(0.15)
+        self.assertEqual(first.current_frame, 1)
+        self.assertEqual(second.current_frame, 0)
+        self.assertIs(first.get_current_frame(), frames[1])
+        self.assertIs(first.frames, second.frames)
+
+    def test_enemies_share_clips(self):
+        """测试同类型敌人共享动画片段，生成敌人时不再切分精灵表或缩放帧"""
+        first = Ghost(100, 100)
+        first.update(0.01, self.player)
+
+        with mock.patch('modules.resource_manager.SpriteSheet.get_sprite', side_effect=AssertionError), \
+                mock.patch('pygame.transform.scale', side_effect=AssertionError), \
+                mock.patch('pygame.transform.flip', side_effect=AssertionError):
+            second = Ghost(200, 100)
+            second.update(0.01, self.player)
+
+        for state in first.animations:
+            self.assertIsNot(first.animations[state], second.animations[state])
+            self.assertIs(first.animations[state].clip, second.animations[state].clip)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import random
+import numpy as np
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.soa_core import EnemySoACore, round_half_away
+from modules.enemies.enemy_manager import EnemyManager
+from modules.enemies.types import Ghost, Slime
+from modules.pooling import pools
+
+class MockPlayer:
+    """模拟玩家"""
+    def __init__(self, x, y):
+        self.world_x = x
+        self.world_y = y
+        self.level = 0
+
+class TestRoundHalfAway(unittest.TestCase):
+    def test_matches_rect_assignment(self):
+        """测试取整规则与pygame.Rect赋值浮点数一致"""
+        values = [-2.5, -1.5, -0.5, -0.49999, 0.49999999999999994, 0.5, 1.5, 2.5, 10.7, -2.6]
+        rect = pygame.Rect(0, 0, 1, 1)
+        expected = []
+        for value in values:
+            rect.x = value
+            expected.append(rect.x)
+        self.assertEqual(round_half_away(np.array(values)).tolist(), expected)
+
+class TestEnemySoACore(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        pools.clear()
+
+    def tearDown(self):
+        pools.clear()
+        pygame.quit()
+
+    def test_view_keeps_type_and_roundtrips_state(self):
+        """测试视图保持原有类型，解除绑定后属性写回对象"""
+        core = EnemySoACore(capacity=1)
+        ghost = Ghost(100, 100)
+        slime = Slime(200, 100)
+        core.add(ghost)
+        core.add(slime)  # 触发扩容
+
+        self.assertIsInstance(ghost, Ghost)
+        self.assertEqual(type(ghost).__name__, 'Ghost')
+        ghost.apply_burn_effect(10, 2.0)
+        ghost.health = 7
+        self.assertEqual(core.health[ghost._soa_slot], 7)
+        self.assertIn('burn', ghost.status_effects)
+
+        core.remove(ghost)
+        self.assertIs(type(ghost), Ghost)
+        self.assertEqual(ghost.health, 7)
+        self.assertEqual(ghost.status_effects['burn']['damage_per_sec'], 10)
+        # 最后一个槽位移到了空出的位置
+        self.assertEqual(slime._soa_slot, 0)
+        self.assertEqual(len(core), 1)
+
+    def _simulate(self, use_soa):
+        """用相同的随机种子生成敌人并模拟若干帧，返回每帧的敌人状态"""
+        random.seed(3)
+        pools.clear()
+        manager = EnemyManager()
+        manager.spawn_director.enabled = False
+        manager.set_soa_enabled(use_soa)
+        player = MockPlayer(400.3, 300.0)
+        for _ in range(60):
+            manager.spawn_enemy(random.choice(['ghost', 'slime', 'bat', 'radish']),
+                                random.randint(-900, 1700), random.randint(-900, 1500))
+
+        frames = []
+        for frame in range(120):
+            player.world_x += 0.37
+            if frame % 7 == 0:
+                for enemy in manager.enemies[::5]:
+                    enemy.apply_burn_effect(10, 1.3)
+            if frame % 11 == 0:
+                for enemy in manager.enemies[1::4]:
+                    enemy.apply_slow_effect(0.4, 0.9)
+            if frame % 5 == 0:
+                for enemy in manager.enemies[2::6]:
+                    enemy.take_damage(3)
+            manager.update(1 / 60, player)
+            frames.append([(enemy.rect.topleft, enemy.health, enemy.speed, enemy.current_animation,
+                            enemy.facing_right, enemy.invincible, sorted(enemy.status_effects))
+                           for enemy in manager.enemies])
+        return frames
+
+    def test_matches_object_update(self):
+        """测试数组核心的移动、计时和状态效果结果与逐个更新完全一致"""
+        self.assertEqual(self._simulate(False), self._simulate(True))
+
+    def test_toggle_and_release(self):
+        """测试开关数组核心以及移除的敌人恢复为普通对象"""
+        manager = EnemyManager()
+        enemy = manager.spawn_enemy('ghost', 0, 0)
+        manager.set_soa_enabled(True)
+        self.assertIs(enemy._soa_core, manager.soa_core)
+
+        slime = manager.spawn_enemy('slime', 50, 0)
+        manager.remove_enemy(slime)
+        self.assertIs(type(slime), Slime)
+        self.assertEqual(len(manager.soa_core), 1)
+
+        manager.set_soa_enabled(False)
+        self.assertIs(type(enemy), Ghost)
+        self.assertFalse(hasattr(enemy, '_soa_core'))
+
+    def test_offscreen_enemies_skip_object_update(self):
+        """测试屏幕外的普通敌人只做数组模拟，带update扩展的史莱姆仍然逐帧更新"""
+        manager = EnemyManager()
+        manager.spawn_director.enabled = False
+        manager.lod.set_view_size((800, 600))
+        manager.set_soa_enabled(True)
+        ghost = manager.spawn_enemy('ghost', 3000, 0)
+        slime = manager.spawn_enemy('slime', 3000, 500)
+        slime.attack_cooldown = 1.0
+
+        manager.update(0.1, MockPlayer(0, 0))
+
+        self.assertLess(ghost.rect.x, 3000)
+        self.assertFalse(slime.lod_visuals)
+        self.assertAlmostEqual(slime.attack_cooldown, 0.9)
+        self.assertEqual(manager.lod.get_stats()['skipped'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
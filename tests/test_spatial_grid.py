@@ -0,0 +1,126 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.collision.spatial_grid import SpatialGrid
+from modules.collision.broad_phase import BroadPhase, projectile_enemy_candidates, enemies_in_radius
+
+class MockEntity:
+    """只包含rect的模拟实体"""
+    def __init__(self, x, y, width=44, height=30):
+        self.rect = pygame.Rect(x, y, width, height)
+
+class MockProjectile:
+    """模拟投射物"""
+    def __init__(self, x, y, size=32):
+        self.world_x = float(x)
+        self.world_y = float(y)
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (int(x), int(y))
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.grid = SpatialGrid(cell_size=64)
+
+    def test_insert_remove(self):
+        """测试插入和移除实体"""
+        entity = MockEntity(100, 100)
+        self.grid.insert(entity)
+        self.assertIn(entity, self.grid)
+        self.assertEqual(len(self.grid), 1)
+
+        self.assertTrue(self.grid.remove(entity))
+        self.assertNotIn(entity, self.grid)
+        self.assertFalse(self.grid.remove(entity))
+        self.assertEqual(self.grid.cells, {})
+
+    def test_move_updates_cell(self):
+        """测试实体移动后增量更新格子"""
+        entity = MockEntity(10, 10)
+        self.grid.insert(entity)
+        entity.rect.x = 500
+        self.grid.move(entity)
+        self.assertEqual(self.grid.query_rect(0, 0, 60, 60), [])
+        self.assertEqual(self.grid.query_rect(500, 10, 10, 10), [entity])
+
+    def test_query_rect_matches_brute_force(self):
+        """测试矩形查询结果与逐一遍历一致，并保持插入顺序"""
+        entities = [MockEntity(random.randint(-500, 500), random.randint(-500, 500),
+                               random.randint(10, 90), random.randint(10, 90))
+                    for _ in range(300)]
+        self.grid.rebuild(entities)
+
+        for _ in range(50):
+            area = pygame.Rect(random.randint(-500, 500), random.randint(-500, 500),
+                               random.randint(1, 200), random.randint(1, 200))
+            expected = [e for e in entities if e.rect.colliderect(area)]
+            self.assertEqual(self.grid.query_rect(area.x, area.y, area.width, area.height), expected)
+
+    def test_query_radius_matches_list_scan(self):
+        """测试半径查询与遍历列表的范围检测结果一致"""
+        entities = [MockEntity(random.randint(0, 1000), random.randint(0, 1000),
+                               random.randint(10, 90), random.randint(10, 90))
+                    for _ in range(300)]
+        self.grid.rebuild(entities)
+
+        for _ in range(50):
+            x = random.uniform(0, 1000)
+            y = random.uniform(0, 1000)
+            radius = random.choice([0, 40, 120, 300])
+            expected = enemies_in_radius(entities, x, y, radius)
+            self.assertEqual(self.grid.query_radius(x, y, radius), expected)
+
+    def test_projectile_candidates_match_distance_check(self):
+        """测试网格粗检测与原始距离检测命中相同的敌人"""
+        enemies = [MockEntity(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(400)]
+        self.grid.rebuild(enemies)
+
+        for _ in range(100):
+            projectile = MockProjectile(random.uniform(0, 1000), random.uniform(0, 1000))
+            expected = []
+            for enemy in enemies:
+                dx = enemy.rect.x - projectile.world_x
+                dy = enemy.rect.y - projectile.world_y
+                if (dx**2 + dy**2)**0.5 < enemy.rect.width / 2 + projectile.rect.width / 2:
+                    expected.append(enemy)
+            self.assertEqual(projectile_enemy_candidates(self.grid, projectile), expected)
+
+    def test_broad_phase_backends_agree(self):
+        """测试三种粗检测实现得到完全相同的候选敌人"""
+        enemies = [MockEntity(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(400)]
+        projectiles = [MockProjectile(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(60)]
+        self.grid.rebuild(enemies)
+
+        results = []
+        for backend in BroadPhase.BACKENDS:
+            broad_phase = BroadPhase(backend, chunk_size=1000)
+            broad_phase.begin_frame(enemies, self.grid)
+            results.append(broad_phase.query(projectiles))
+
+        self.assertTrue(any(results[0]))
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
+    def test_broad_phase_verify_mode(self):
+        """测试对比模式不会记录不一致"""
+        enemies = [MockEntity(random.randint(0, 500), random.randint(0, 500)) for _ in range(100)]
+        self.grid.rebuild(enemies)
+        broad_phase = BroadPhase('numpy')
+        broad_phase.verify_backend = 'brute'
+        broad_phase.begin_frame(enemies, self.grid)
+        broad_phase.query([MockProjectile(random.uniform(0, 500), random.uniform(0, 500)) for _ in range(30)])
+        self.assertEqual(broad_phase.mismatch_count, 0)
+
+    def test_broad_phase_unknown_backend(self):
+        """测试未知实现名称抛出异常"""
+        with self.assertRaises(ValueError):
+            BroadPhase('quadtree')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import math
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.enemies.spawn_director import (SpawnDirector, load_wave_schedule, validate_schedule,
+                                            build_spawn_positions)
+from modules.enemies.enemy_manager import EnemyManager
+
+class MockPlayer:
+    """模拟玩家"""
+    def __init__(self, x=0, y=0, level=1):
+        self.world_x = x
+        self.world_y = y
+        self.level = level
+
+class RecordingManager:
+    """只记录生成请求的模拟敌人管理器"""
+    def __init__(self, boundaries=None):
+        self.game_time = 0
+        self.map_boundaries = boundaries
+        self.spawned = []
+
+    def spawn_enemy(self, enemy_type, x, y):
+        self.spawned.append((self.game_time, enemy_type, x, y))
+
+class TestSpawnDirector(unittest.TestCase):
+    def test_default_schedule(self):
+        """测试默认波次文件：开局一只蝙蝠，前10秒只有史莱姆，之后每秒随机一只"""
+        director = SpawnDirector(load_wave_schedule('default'))
+        manager = RecordingManager()
+        player = MockPlayer()
+        for _ in range(int(11.5 * 60)):
+            manager.game_time += 1 / 60
+            director.update(1 / 60, manager, player)
+
+        self.assertEqual(manager.spawned[0][1], 'bat')
+        early = [enemy_type for time, enemy_type, _, _ in manager.spawned[1:] if time < 10]
+        late = [enemy_type for time, enemy_type, _, _ in manager.spawned if time >= 10]
+        self.assertEqual(early, ['slime'] * 9)
+        self.assertEqual(len(late), 2)
+        self.assertTrue(set(late) <= {'ghost', 'radish', 'slime'})
+        for _, _, x, y in manager.spawned:
+            self.assertAlmostEqual(math.hypot(x, y), 600)
+
+    def test_large_wave_spread_over_frames(self):
+        """测试大规模波次按每帧的生成上限分散到多帧"""
+        schedule = {'waves': [{'time': 0, 'pattern': 'ring', 'count': 300, 'radius': 500, 'types': ['ghost']}]}
+        # 时间预算为0时每帧只生成最少数量
+        director = SpawnDirector(schedule, time_budget_ms=0, min_spawns_per_frame=50)
+        manager = RecordingManager()
+
+        frames = 0
+        while frames == 0 or director.get_stats()['pending']:
+            director.update(1 / 60, manager, MockPlayer())
+            self.assertEqual(director.get_stats()['spawned'], 50)
+            frames += 1
+
+        self.assertEqual(frames, 6)
+        self.assertEqual(len(manager.spawned), 300)
+        for _, _, x, y in manager.spawned:
+            self.assertAlmostEqual(math.hypot(x, y), 500)
+
+    def test_unlimited_budget_spawns_in_one_frame(self):
+        """测试不限制时间预算时整个波次在同一帧生成，超出地图边界的位置被限制在边界内"""
+        schedule = {'waves': [{'time': 0, 'pattern': 'formation', 'rows': 4, 'cols': 5, 'spacing': 10,
+                               'distance': 100, 'angle': 0, 'types': {'radish': 1}}]}
+        director = SpawnDirector(schedule, time_budget_ms=None)
+        manager = RecordingManager(boundaries=(-1000, -1000, 95, 1000))
+        director.update(1 / 60, manager, MockPlayer())
+
+        self.assertEqual(len(manager.spawned), 20)
+        self.assertEqual(max(x for _, _, x, _ in manager.spawned), 95)
+        self.assertEqual(director.get_stats()['pending'], 0)
+
+    def test_formation_centered_on_direction(self):
+        """测试方阵中心位于指定方向和距离上"""
+        positions = build_spawn_positions(
+            {'pattern': 'formation', 'rows': 3, 'cols': 3, 'spacing': 20, 'distance': 300, 'angle': 90},
+            100, 100)
+        self.assertEqual(len(positions), 9)
+        center_x = sum(x for x, _ in positions) / 9
+        center_y = sum(y for _, y in positions) / 9
+        self.assertAlmostEqual(center_x, 100)
+        self.assertAlmostEqual(center_y, 400)
+
+    def test_invalid_schedule(self):
+        """测试波次数据格式检查"""
+        with self.assertRaises(ValueError):
+            validate_schedule({'spawners': [{'interval': 0, 'types': ['ghost']}]})
+        with self.assertRaises(ValueError):
+            validate_schedule({'waves': [{'time': 5, 'pattern': 'spiral', 'types': ['ghost']}]})
+
+class TestEnemyManagerSpawning(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_manager_uses_director(self):
+        """测试敌人管理器通过生成导演生成敌人"""
+        manager = EnemyManager()
+        manager.update(1 / 60, MockPlayer())
+        self.assertEqual([enemy.type for enemy in manager.enemies], ['bat'])
+
+        manager.spawn_director.enabled = False
+        manager.update(2.0, MockPlayer())
+        self.assertEqual(len(manager.enemies), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.collision.spatial_grid import SpatialGrid
+from modules.collision.broad_phase import BroadPhase
+from modules.collision.swept import segment_point_distance, swept_mask_collision, reset_sweep
+
+class MockEnemy:
+    """带实心遮罩的模拟敌人"""
+    def __init__(self, x, y, width=44, height=30):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.image = pygame.Surface((width, height))
+        self.mask = pygame.mask.Mask((width, height), fill=True)
+
+class MockProjectile:
+    """记录上一次检测位置的模拟投射物"""
+    def __init__(self, start, end, size=16):
+        self.prev_world_x, self.prev_world_y = float(start[0]), float(start[1])
+        self.world_x, self.world_y = float(end[0]), float(end[1])
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (round(self.world_x), round(self.world_y))
+        self.image = pygame.Surface((size, size))
+        self.mask = pygame.mask.Mask((size, size), fill=True)
+
+class TestSweptCollision(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_segment_point_distance(self):
+        """测试点到线段的距离"""
+        self.assertAlmostEqual(segment_point_distance(0, 0, 10, 0, 5, 3), 3)
+        self.assertAlmostEqual(segment_point_distance(0, 0, 10, 0, -4, 3), 5)
+        self.assertAlmostEqual(segment_point_distance(0, 0, 10, 0, 13, 4), 5)
+        # 线段退化为点
+        self.assertAlmostEqual(segment_point_distance(2, 2, 2, 2, 5, 6), 5)
+
+    def test_fast_projectile_does_not_tunnel(self):
+        """测试一帧内穿过敌人的高速投射物仍然命中"""
+        enemy = MockEnemy(500, 500)
+        # 一帧移动400像素，起点和终点都离敌人很远
+        projectile = MockProjectile((300, 510), (700, 510))
+        grid = SpatialGrid(cell_size=64)
+        grid.rebuild([enemy])
+
+        for backend in BroadPhase.BACKENDS:
+            broad_phase = BroadPhase(backend)
+            broad_phase.begin_frame([enemy], grid)
+            self.assertEqual(broad_phase.query([projectile]), [[enemy]], backend)
+
+        self.assertTrue(swept_mask_collision(enemy, projectile))
+        self.assertEqual(projectile.rect.center, (700, 510))
+
+        # 轨迹起点更新后，静止的投射物不再命中
+        reset_sweep(projectile)
+        self.assertFalse(swept_mask_collision(enemy, projectile))
+
+    def test_swept_backends_agree(self):
+        """测试三种粗检测实现对移动中的投射物得到相同的候选敌人"""
+        enemies = [MockEnemy(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(300)]
+        projectiles = []
+        for _ in range(60):
+            start = (random.uniform(0, 1000), random.uniform(0, 1000))
+            end = (start[0] + random.uniform(-200, 200), start[1] + random.uniform(-200, 200))
+            projectiles.append(MockProjectile(start, end))
+        grid = SpatialGrid(cell_size=64)
+        grid.rebuild(enemies)
+
+        results = []
+        for backend in BroadPhase.BACKENDS:
+            broad_phase = BroadPhase(backend, chunk_size=1000)
+            broad_phase.begin_frame(enemies, grid)
+            results.append(broad_phase.query(projectiles))
+
+        self.assertTrue(any(results[0]))
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import math
+import random
+import pygame
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from modules.weapons.targeting import TargetingService
+
+class MockEnemy:
+    """只包含rect的模拟敌人"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 44, 30)
+
+def brute_sorted(enemies, x, y):
+    """按(距离, 列表顺序)排序的敌人列表"""
+    items = []
+    for index, enemy in enumerate(enemies):
+        distance = math.sqrt((enemy.rect.x - x) ** 2 + (enemy.rect.y - y) ** 2)
+        items.append((distance, index, enemy))
+    items.sort(key=lambda item: (item[0], item[1]))
+    return items
+
+class TestTargetingService(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.enemies = [MockEnemy(random.randint(-2000, 2000), random.randint(-2000, 2000)) for _ in range(500)]
+        self.service = TargetingService(cell_size=128)
+        self.service.rebuild(self.enemies)
+
+    def test_nearest_matches_linear_scan(self):
+        """测试最近敌人与逐一遍历结果一致"""
+        for _ in range(100):
+            x, y = random.uniform(-2500, 2500), random.uniform(-2500, 2500)
+            self.assertIs(self.service.nearest(x, y), brute_sorted(self.enemies, x, y)[0][2])
+
+    def test_k_nearest(self):
+        """测试k近邻查询"""
+        for k in (1, 5, 20):
+            x, y = random.uniform(-2000, 2000), random.uniform(-2000, 2000)
+            expected = [enemy for _, _, enemy in brute_sorted(self.enemies, x, y)[:k]]
+            self.assertEqual(self.service.k_nearest(x, y, k), expected)
+
+    def test_max_distance_and_radius(self):
+        """测试距离限制和半径查询"""
+        x, y = 0, 0
+        radius = 400
+        expected = [enemy for enemy in self.enemies
+                    if math.sqrt(enemy.rect.x ** 2 + enemy.rect.y ** 2) <= radius]
+        self.assertEqual(self.service.within_radius(x, y, radius), expected)
+        self.assertTrue(all(enemy in expected for enemy in self.service.k_nearest(x, y, 1000, radius)))
+        self.assertEqual(len(self.service.k_nearest(x, y, 1000, radius)), len(expected))
+
+    def test_covers(self):
+        """测试索引只对建立它的敌人列表有效"""
+        self.assertTrue(self.service.covers(self.enemies))
+        self.assertFalse(self.service.covers(list(self.enemies)))
+        self.enemies.append(MockEnemy(0, 0))
+        self.assertFalse(self.service.covers(self.enemies))
+
+    def test_empty(self):
+        """测试没有敌人时的查询"""
+        service = TargetingService()
+        service.rebuild([])
+        self.assertIsNone(service.nearest(0, 0))
+        self.assertEqual(service.within_radius(0, 0, 100), [])
+
+if __name__ == '__main__':
+    unittest.main()